@@ -0,0 +1,69 @@
+"""
+Conditional-GET helpers for read endpoints whose payload only changes when the
+underlying data snapshot is reloaded: pre-serialized bodies, strong ETags and 304s.
+"""
+import hashlib
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from models.serialization import dumps
+
+def strong_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 If-None-Match: weak comparison over a comma-separated list, or "*"."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+class ResponseCache:
+    """
+    Serialized JSON bodies (with their ETag) keyed per endpoint and arguments.
+    Entries belong to one data snapshot: asking with a different snapshot
+    object drops everything built from the previous one.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._snapshot = None
+        self._entries: Dict[Hashable, Tuple[bytes, str]] = {}
+        self.stats = {"hits": 0, "misses": 0, "not_modified": 0, "invalidations": 0}
+
+    def get(self, snapshot: Any, key: Hashable, build: Callable[[], Any]) -> Tuple[bytes, str]:
+        if snapshot is not self._snapshot:
+            if self._snapshot is not None:
+                self.stats["invalidations"] += 1
+            self._snapshot = snapshot
+            self._entries = {}
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry
+
+        self.stats["misses"] += 1
+        body = dumps(build())
+        entry = (body, strong_etag(body))
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = entry
+        return entry
+
+    def respond(self, request: Request, snapshot: Any, key: Hashable, build: Callable[[], Any],
+                cache_control: str, vary: Optional[str] = None) -> Response:
+        """200 with the cached body, or 304 when the client already holds this ETag."""
+        body, etag = self.get(snapshot, key, build)
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if vary:
+            headers["Vary"] = vary
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            self.stats["not_modified"] += 1
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {**self.stats, "entries": len(self._entries)}
@@ -1,46 +1,79 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Cookie, Depends, HTTPException, Query, Request, Response
 from typing import Dict, Any, Optional
-from streams.climate.mock_monsoon_client import MockMonsoonClient
+from api.http_cache import ResponseCache
+from models.serialization import ORJSONResponse
+from streams.climate.mock_monsoon_client import MockMonsoonClient, MonsoonContext
+from streams.climate.monsoon_alerts import alert_engine, LEVELS
 
 router = APIRouter(prefix="/streams/climate/monsoon", tags=["Monsoon Stream"])
 
-# Initialize Client (Singleton for now)
+# Shared, read-only data snapshot; per-user year selection lives in MonsoonContext
 monsoon_client = MockMonsoonClient()
 
+SESSION_COOKIE = "oracle_sim_year"
+
+# Bodies depend only on (snapshot, year); /current also varies with the session cookie
+response_cache = ResponseCache()
+HISTORICAL_CACHE_CONTROL = "public, max-age=86400"
+CURRENT_CACHE_CONTROL = "private, no-cache"
+
+async def simulation_context(year: Optional[int] = None, scenario: Optional[str] = None,
+                             session_year: Optional[int] = Cookie(None, alias=SESSION_COOKIE)) -> MonsoonContext:
+    """
+    Context for this request: explicit ?year= / ?scenario=, else the year this
+    session picked via /simulation/set_year, else the default (2019).
+    Async so FastAPI resolves it inline instead of on the threadpool.
+    """
+    return monsoon_client.context(year if year is not None else session_year, scenario)
+
 @router.get("/current")
-async def get_current_status(year: Optional[int] = None) -> Dict[str, Any]:
+async def get_current_status(request: Request, context: MonsoonContext = Depends(simulation_context)) -> Response:
     """
     Get the current monsoon status. 
-    Optionally set the simulation year context (default 2019).
+    Optionally pick the simulation year (?year=) or scenario (?scenario=) for this request (default 2019).
+    Revalidate with If-None-Match; unchanged data answers 304.
     """
-    if year:
-        monsoon_client.set_year(year)
-    
-    data = monsoon_client.get_current_metrics()
-    if not data:
+    if not context.get_current_metrics():
         raise HTTPException(status_code=404, detail="Monsoon data not found")
-        
-    return {
-        "status": "healthy",
-        "timestamp": 1700000000.0, # Mock timestamp
-        "metrics": {
-            "deviation_percent": data["deviation_percent"],
-            "onset_delay_days": monsoon_client.get_onset_delay(),
-            "rainfall_total": data["all_india_rainfall_mm"]
-        },
-        "metadata": data
-    }
+
+    def build() -> Dict[str, Any]:
+        data = context.get_current_metrics()
+        return {
+            "status": "healthy",
+            "timestamp": context.store.loaded_at, # When this data snapshot was loaded
+            "metrics": {
+                "deviation_percent": data["deviation_percent"],
+                "onset_delay_days": context.get_onset_delay(),
+                "rainfall_total": data["all_india_rainfall_mm"]
+            },
+            "metadata": data
+        }
+
+    return response_cache.respond(request, context.store, ("current", context.year), build,
+                                  CURRENT_CACHE_CONTROL, vary="Cookie")
 
 @router.get("/historical/{year}")
-async def get_historical_data(year: int):
-    """Get raw data for a specific year."""
-    data = monsoon_client.data_cache.get(str(year))
+async def get_historical_data(year: int, request: Request) -> Response:
+    """Get raw data for a specific year (cacheable; ETag changes only when the data is reloaded)."""
+    store = monsoon_client.store
+    data = store.record(year)
     if not data:
         raise HTTPException(status_code=404, detail=f"No data for year {year}")
-    return data
+    return response_cache.respond(request, store, ("historical", year), lambda: data, HISTORICAL_CACHE_CONTROL)
+
+@router.get("/alerts")
+async def get_historical_alerts(start: Optional[int] = None, end: Optional[int] = None,
+                                level: Optional[str] = Query(None, description="national, region, state or district"),
+                                severity: Optional[str] = None) -> Response:
+    """Runs the monsoon alert rules over every year in [start, end] (default: all years in the store)."""
+    if level is not None and level not in LEVELS:
+        raise HTTPException(status_code=400, detail=f"Unknown level '{level}'")
+    alerts = alert_engine.evaluate(monsoon_client.store, start=start, end=end)
+    return ORJSONResponse([a.model_dump(mode="json") for a in alerts
+                           if (level is None or a.context["level"] == level) and (severity is None or a.severity.value == severity)])
 
 @router.post("/simulation/set_year")
-async def set_simulation_year(year: int):
-    """Control endpoint for Demo Mode to switch years."""
-    monsoon_client.set_year(year)
+async def set_simulation_year(year: int, response: Response):
+    """Control endpoint for Demo Mode to switch years (for this browser session only)."""
+    response.set_cookie(SESSION_COOKIE, str(year), samesite="lax")
     return {"message": f"Simulation context switched to {year}"}
@@ -0,0 +1,81 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, AsyncGenerator, List
+from models.serialization import dumps
+from streams.event_bus import Subscriber, RESYNC, WORLD_HEARTBEAT
+from streams.stream_manager import stream_manager
+
+router = APIRouter(prefix="/streams", tags=["Stream Orchestration"])
+
+HEARTBEAT_SECONDS = 15.0
+HEARTBEAT_MESSAGE = dumps({"channel": WORLD_HEARTBEAT})
+RESYNC_MESSAGE = dumps({"channel": RESYNC})
+
+@router.get("/status")
+async def get_stream_status() -> Dict[str, Any]:
+    """Scheduler state plus per-stream scan latency, skip and error counts."""
+    return stream_manager.get_status()
+
+@router.get("/world")
+async def get_world_state(refresh: bool = False) -> Dict[str, Any]:
+    """
+    Merged snapshot of every registered stream and the active alerts.
+    refresh=true scans all streams concurrently before answering.
+    """
+    state = await stream_manager.scan_all() if refresh else stream_manager.get_world_state()
+    return state.model_dump()
+
+@router.get("/alerts")
+async def get_active_alerts() -> List[Dict[str, Any]]:
+    """Currently active alerts across all streams."""
+    return [a.model_dump() for a in stream_manager.active_alerts]
+
+def _snapshot() -> bytes:
+    state = stream_manager.get_world_state()
+    return dumps({"channel": "snapshot", **state.model_dump(mode="json")})
+
+async def event_messages(subscriber: Subscriber, heartbeat: float = HEARTBEAT_SECONDS) -> AsyncGenerator[bytes, None]:
+    """
+    Snapshot first, then alert diffs and coalesced metric deltas as they are published.
+    Ends with a resync message if the client fell too far behind and was dropped.
+    """
+    try:
+        yield _snapshot()
+        while True:
+            message = await subscriber.get(timeout=heartbeat)
+            if message is not None:
+                yield message
+            elif subscriber.closed:
+                yield RESYNC_MESSAGE
+                return
+            else:
+                yield HEARTBEAT_MESSAGE
+    finally:
+        stream_manager.events.unsubscribe(subscriber)
+
+@router.get("/events")
+async def stream_events():
+    """Server-Sent Events push channel; each message's data carries its channel name."""
+    subscriber = stream_manager.events.subscribe()
+
+    async def sse():
+        async for message in event_messages(subscriber):
+            yield b"data: " + message + b"\n\n"
+
+    return StreamingResponse(sse(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@router.websocket("/ws")
+async def stream_events_ws(websocket: WebSocket):
+    """WebSocket variant of /events with identical messages."""
+    await websocket.accept()
+    subscriber = stream_manager.events.subscribe()
+    messages = event_messages(subscriber)
+    try:
+        async for message in messages:
+            # Text frames, as before: the encoded bytes are already UTF-8
+            await websocket.send_text(message.decode())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await messages.aclose()
@@ -0,0 +1,31 @@
+import os
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import FileResponse, Response
+
+router = APIRouter(prefix="/tracks", tags=["Hurricane Tracks"])
+
+# Written by: python scripts/process_hurricanes.py --stream --tiles
+TILES_DIR = os.path.join(os.path.dirname(__file__), "../data/processed/track_tiles")
+
+# Tiles are immutable until the pipeline is re-run
+CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+EMPTY_TILE = b'{"type": "FeatureCollection", "features": []}'
+
+@router.get("/tiles/index.json")
+async def get_tile_index():
+    """Manifest of zoom levels, tolerances and non-empty tiles."""
+    path = os.path.join(TILES_DIR, "index.json")
+    if not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Track tiles have not been generated")
+    return FileResponse(path, media_type="application/json", headers=CACHE_HEADERS)
+
+@router.get("/tiles/{z}/{x}/{y}.json")
+async def get_tile(z: int, x: int, y: int):
+    """Serves one z/x/y tile; tiles with no tracks are returned as empty collections."""
+    if z < 0 or not (0 <= x < (2 << z)) or not (0 <= y < (1 << z)):
+        raise HTTPException(status_code=404, detail=f"Tile {z}/{x}/{y} out of range")
+
+    path = os.path.join(TILES_DIR, str(z), str(x), f"{y}.json")
+    if not os.path.exists(path):
+        return Response(EMPTY_TILE, media_type="application/json", headers=CACHE_HEADERS)
+    return FileResponse(path, media_type="application/json", headers=CACHE_HEADERS)
@@ -0,0 +1,92 @@
+"""
+Benchmark: per-request allocation, memory per cached result, encode time and
+cache-hit frame cost for the old nested-dict analysis payload vs the typed AnalysisResult.
+
+    python benchmarks/bench_analysis_models.py --results 2000
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from models.serialization import dumps
+from reasoning.llm_engine import OracleEngine
+from reasoning.mechanism_database import MECHANISMS
+from reasoning.policy_context import POLICY_MAPPING
+
+
+def dict_result(engine, key, papers, sources, investment):
+    """The payload as the engine used to build it: fresh nested dicts/lists from the raw tables."""
+    mechanism_data, policy_data = MECHANISMS[key], POLICY_MAPPING[key]
+    return {
+        "mechanism": mechanism_data["name"],
+        "description": mechanism_data["description"],
+        "feasibility_score": engine._calculate_feasibility(engine.mechanism(key), engine.policy_analyzer.get_analysis(key), investment),
+        "bottleneck": {
+            "current_capability": mechanism_data["current_capability"],
+            "required_capability": mechanism_data["required_capability_base"],
+            "gap_ratio": mechanism_data["gap_ratio"],
+            "description": f"Gap of {mechanism_data['gap_ratio']}x between current pilots and required scale."
+        },
+        "research_vectors": [{"focus": focus, "institutions": mechanism_data["indian_institutions"]}
+                             for focus in mechanism_data["research_focus"]],
+        "active_papers": papers,
+        "research_sources": sources,
+        "economic_context": mechanism_data["economic_context"],
+        "policy_context": policy_data,
+    }
+
+
+def typed_result(engine, key, papers, sources, investment):
+    return engine._build_response(engine.mechanism(key), engine.policy_analyzer.get_analysis(key), papers, sources, investment)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--results', type=int, default=2000)
+    args = parser.parse_args()
+
+    engine = OracleEngine()
+    keys = list(MECHANISMS)
+    papers = engine.research_client.search("monsoon cloud seeding research India", 5)
+
+    print(f"{'payload':<16} {'alloc B/req':>12} {'retained B/result':>18} {'build us':>9} {'encode us':>10} {'cache-hit frame us':>19}")
+    for label, build in (("nested dicts", dict_result), ("AnalysisResult", typed_result)):
+        # Papers/sources arrive as fresh dicts per request in both cases
+        inputs = [(keys[i % len(keys)], [dict(p) for p in papers],
+                   {"indian_repositories": {"status": "ok", "latency_ms": 0.2, "count": len(papers)}}, 1e7 * i)
+                  for i in range(args.results)]
+
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        results = [build(engine, *item) for item in inputs]
+        retained = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.reset_peak()
+        start_peak = tracemalloc.get_traced_memory()[0]
+        build(engine, *inputs[0])
+        allocated = tracemalloc.get_traced_memory()[1] - start_peak
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for item in inputs:
+            build(engine, *item)
+        build_us = (time.perf_counter() - start) / len(inputs) * 1e6
+
+        start = time.perf_counter()
+        for result in results:
+            dumps(result)
+        encode_us = (time.perf_counter() - start) / len(results) * 1e6
+
+        start = time.perf_counter()
+        for result in results:
+            engine._final(result, cached=True)
+        hit_us = (time.perf_counter() - start) / len(results) * 1e6
+        print(f"{label:<16} {allocated:12d} {retained / len(results):18.0f} {build_us:9.1f} {encode_us:10.1f} {hit_us:19.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark: time-to-first-paper and parse memory for arXiv feeds.
+A local server trickles Atom entries with a fixed gap; the buffered path
+(read everything, then ElementTree) is compared with ArxivWrapper.iter_papers.
+
+    python benchmarks/bench_arxiv_stream.py --entries 20 --gap 0.05 --bulk 2000
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from reasoning.arxiv_wrapper import ArxivWrapper, FeedParser, ATOM_NS, parse_entry
+
+
+def atom_feed(n: int) -> bytes:
+    entry = ("<entry><title>Paper {i}</title><summary>" + "Abstract text. " * 60 + "</summary>"
+             "<published>2023-01-01T00:00:00Z</published><author><name>Author {i}</name></author></entry>")
+    return ('<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">'
+            + "".join(entry.format(i=i) for i in range(n)) + "</feed>").encode()
+
+
+def serve(feed: bytes, gap: float) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            self.send_response(200)
+            self.end_headers()
+            for i, part in enumerate(feed.split(b"</entry>")):
+                if i:
+                    time.sleep(gap)
+                self.wfile.write(part + (b"</entry>" if b"<entry>" in part else b""))
+                self.wfile.flush()
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd
+
+
+async def buffered(url: str):
+    start = time.perf_counter()
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url)
+    papers = [parse_entry(e) for e in ET.fromstring(response.content).findall('atom:entry', ATOM_NS)]
+    elapsed = time.perf_counter() - start
+    return elapsed, elapsed, len(papers)
+
+
+async def streamed(url: str, cache_dir: str):
+    client = ArxivWrapper(url, cache_dir=cache_dir, ttl=0, min_interval=0, timeout=60)
+    start = time.perf_counter()
+    first, count = None, 0
+    async for _ in client.iter_papers("bench", 10):
+        count += 1
+        first = first or time.perf_counter() - start
+    await client.aclose()
+    return first, time.perf_counter() - start, count
+
+
+def parse_peak(feed: bytes, streaming: bool) -> int:
+    tracemalloc.start()
+    if streaming:
+        parser = FeedParser()
+        for i in range(0, len(feed), 1 << 16):
+            parser.feed(feed[i:i + (1 << 16)])
+    else:
+        root = ET.fromstring(feed)
+        [parse_entry(e) for e in root.findall('atom:entry', ATOM_NS)]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--entries', type=int, default=20)
+    parser.add_argument('--gap', type=float, default=0.05, help="Seconds between entries on the wire")
+    parser.add_argument('--bulk', type=int, default=2000, help="Entries in the memory test feed")
+    args = parser.parse_args()
+
+    httpd = serve(atom_feed(args.entries), args.gap)
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/api/query"
+    with tempfile.TemporaryDirectory() as tmp:
+        for label, run in (("buffered", buffered(url)), ("iter_papers", streamed(url, tmp))):
+            first, total, count = asyncio.run(run)
+            print(f"{label:<12} first paper {first * 1000:7.1f} ms   all {count} papers {total * 1000:7.1f} ms")
+    httpd.shutdown()
+
+    feed = atom_feed(args.bulk)
+    print(f"Parse peak for {args.bulk} entries ({len(feed) / 1e6:.1f} MB feed): "
+          f"ElementTree {parse_peak(feed, False) / 1e6:.1f} MB, FeedParser {parse_peak(feed, True) / 1e6:.1f} MB")
+
+
+if __name__ == '__main__':
+    main()
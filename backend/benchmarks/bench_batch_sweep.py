@@ -0,0 +1,52 @@
+"""
+Benchmark: feasibility sweep with one analyze_strategy call per pair vs analyze_batch.
+
+    python benchmarks/bench_batch_sweep.py --strategies 200 --investments 100
+"""
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from reasoning.llm_engine import OracleEngine
+
+PROMPTS = [
+    "Use Cloud Seeding to help Maharashtra farmers",
+    "Improve IMD monsoon forecast accuracy",
+    "Drought resistant crop insurance for Vidarbha",
+    "Cool roof coating for Delhi heat",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--strategies', type=int, default=200)
+    parser.add_argument('--investments', type=int, default=100)
+    args = parser.parse_args()
+
+    strategies = [f"{PROMPTS[i % len(PROMPTS)]} variant {i}" for i in range(args.strategies)]
+    investments = [i * 10000000 for i in range(args.investments)]
+
+    engine = OracleEngine(cache_size=0)
+    start = time.perf_counter()
+    for s in strategies:
+        for inv in investments:
+            engine.analyze_strategy(s, inv)
+    per_pair = time.perf_counter() - start
+
+    engine = OracleEngine()
+    start = time.perf_counter()
+    engine.analyze_batch(strategies, investments)
+    batch = time.perf_counter() - start
+
+    pairs = args.strategies * args.investments
+    print(f"Pairs:          {pairs}")
+    print(f"Per-pair calls: {per_pair * 1000:.1f} ms")
+    print(f"analyze_batch:  {batch * 1000:.1f} ms ({per_pair / batch:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""
+Benchmark: push fan-out to many idle subscribers.
+
+The default mode drives the in-process EventBus only: memory per Subscriber and
+the time to publish one event to all of them, then checks that a burst of metric
+updates stays coalesced to one pending message per stream. It does not include
+sockets, the ASGI server or per-connection handler tasks.
+
+--http runs the stream routes under uvicorn in a separate process and opens real
+SSE (and WebSocket, when the server has a WebSocket library installed) subscribers
+against it, reporting server RSS per idle connection and the time for one published
+alert to reach every client.
+
+    python benchmarks/bench_event_fanout.py --subscribers 5000
+    python benchmarks/bench_event_fanout.py --http --subscribers 1000
+"""
+import argparse
+import asyncio
+import base64
+import json
+import multiprocessing
+import os
+import socket
+import sys
+import time
+import tracemalloc
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from streams.event_bus import EventBus, ALERT_TRIGGER, STREAM_UPDATE
+
+
+async def run(n_subscribers: int, events: int):
+    bus = EventBus()
+
+    tracemalloc.start()
+    subscribers = [bus.subscribe() for _ in range(n_subscribers)]
+    idle_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # Idle clients parked on get(), like connected SSE/WebSocket handlers
+    waiters = [asyncio.create_task(s.get(timeout=60)) for s in subscribers]
+    await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    bus.publish(ALERT_TRIGGER, {"stream_id": "climate", "new": [], "resolved": ["alert_x"]})
+    publish_ms = (time.perf_counter() - start) * 1000
+    await asyncio.gather(*waiters)
+    delivered_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for i in range(events):
+        bus.publish(STREAM_UPDATE, {"stream_id": "climate", "metrics": {"rainfall_total": float(i)}},
+                    update_key="climate")
+    burst_ms = (time.perf_counter() - start) * 1000
+    pending = sum(len(s.updates) + len(s.queue) for s in subscribers)
+
+    print(f"Subscribers:          {n_subscribers}")
+    print(f"Memory / subscriber:  {idle_bytes / n_subscribers:.0f} bytes")
+    print(f"Publish one alert:    {publish_ms:.1f} ms ({publish_ms * 1000 / n_subscribers:.2f} us/subscriber)")
+    print(f"Delivered to all:     {delivered_ms:.1f} ms")
+    print(f"{events} updates burst:    {burst_ms:.1f} ms, {pending / n_subscribers:.1f} pending message(s)/subscriber")
+    print(f"Bus stats:            {bus.get_stats()}")
+
+
+def fanout_app() -> FastAPI:
+    """The stream routes plus a hook to publish from the server process; no scheduler runs."""
+    from api import stream_routes
+    from streams.stream_manager import stream_manager
+
+    app = FastAPI()
+    app.include_router(stream_routes.router)
+
+    @app.post("/publish")
+    async def publish():
+        stream_manager.events.publish(ALERT_TRIGGER, {"stream_id": "climate", "new": [], "resolved": ["alert_x"]})
+        return {"subscribers": stream_manager.events.get_stats()}
+
+    return app
+
+
+def run_server(port: int):
+    uvicorn.run(fanout_app(), host="127.0.0.1", port=port, log_level="warning")
+
+
+def serve() -> multiprocessing.Process:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = multiprocessing.Process(target=run_server, args=(port,), daemon=True)
+    server.start()
+    server.url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            httpx.get(f"{server.url}/docs")
+            return server
+        except httpx.TransportError:
+            time.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+def rss_bytes(pid: int) -> int:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) * 1024
+    return 0
+
+
+async def open_sse(host: str, port: int):
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(f"GET /streams/events HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    assert b" 200 " in head.split(b"\r\n", 1)[0], head
+
+    async def receive() -> dict:
+        # One chunk per message: "<size>\r\ndata: {...}\n\n\r\n"
+        size = int((await reader.readuntil(b"\r\n")).strip(), 16)
+        chunk = await reader.readexactly(size + 2)
+        return json.loads(chunk[len(b"data: "):size].strip())
+
+    return receive, writer
+
+
+async def open_ws(host: str, port: int):
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET /streams/ws HTTP/1.1\r\nHost: {host}\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                  f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    if b" 101 " not in head.split(b"\r\n", 1)[0]:
+        writer.close()
+        return None
+
+    async def receive() -> dict:
+        # Server frames are unmasked text frames
+        _, length = await reader.readexactly(2)
+        if length == 126:
+            length = int.from_bytes(await reader.readexactly(2), "big")
+        elif length == 127:
+            length = int.from_bytes(await reader.readexactly(8), "big")
+        return json.loads(await reader.readexactly(length))
+
+    return receive, writer
+
+
+async def until_alert(receive) -> float:
+    while (await receive())["channel"] != ALERT_TRIGGER:
+        pass
+    return time.perf_counter()
+
+
+async def run_http(server, transport: str, n_subscribers: int):
+    url = httpx.URL(server.url)
+    opener = open_sse if transport == "sse" else open_ws
+    base_rss = rss_bytes(server.pid)
+
+    clients = []
+    for _ in range(n_subscribers):
+        client = await opener(url.host, url.port)
+        if client is None:
+            print(f"{transport:<4} skipped: the server refused the WebSocket upgrade (no websockets/wsproto)")
+            return
+        receive, writer = client
+        assert (await receive())["channel"] == "snapshot"
+        clients.append((receive, writer))
+    idle_rss = rss_bytes(server.pid)
+
+    waiters = [asyncio.create_task(until_alert(receive)) for receive, _ in clients]
+    await asyncio.sleep(0)
+    async with httpx.AsyncClient() as http:
+        start = time.perf_counter()
+        await http.post(f"{server.url}/publish")
+    delivered_ms = (max(await asyncio.gather(*waiters)) - start) * 1000
+
+    for _, writer in clients:
+        writer.close()
+    print(f"{transport:<4} {n_subscribers} connections: {(idle_rss - base_rss) / n_subscribers:.0f} bytes RSS/connection, "
+          f"alert delivered to all in {delivered_ms:.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--subscribers', type=int, default=5000)
+    parser.add_argument('--events', type=int, default=50)
+    parser.add_argument('--http', action='store_true', help='real SSE/WebSocket clients against a uvicorn server')
+    args = parser.parse_args()
+    if not args.http:
+        asyncio.run(run(args.subscribers, args.events))
+        return
+    for transport in ("sse", "ws"):
+        # Fresh server per transport so RSS is not carried over
+        server = serve()
+        try:
+            asyncio.run(run_http(server, transport, args.subscribers))
+        finally:
+            server.terminate()
+
+
+if __name__ == '__main__':
+    main()
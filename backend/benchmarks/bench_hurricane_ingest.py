@@ -0,0 +1,62 @@
+"""
+Benchmark: in-memory vs streaming IBTrACS ingestion.
+Reports rows/sec and peak RSS; each mode runs in a fresh interpreter so RSS is not shared.
+
+    python benchmarks/bench_hurricane_ingest.py --storms 20000
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from benchmarks.synthetic_ibtracs import write_synthetic_ibtracs
+from scripts.process_hurricanes import process_hurricanes
+
+
+def run_child(input_csv, output, stream):
+    start = time.perf_counter()
+    process_hurricanes(input_csv, output, start_year=0, stream=stream)
+    elapsed = time.perf_counter() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({"elapsed": elapsed, "peak_rss_mb": peak_kb / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--storms', type=int, default=5000)
+    parser.add_argument('--points', type=int, default=60)
+    parser.add_argument('--child', choices=['memory', 'stream'])
+    parser.add_argument('--input')
+    parser.add_argument('--output')
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.input, args.output, args.child == 'stream')
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_csv = os.path.join(tmp, 'ibtracs.csv')
+        rows = write_synthetic_ibtracs(input_csv, args.storms, args.points)
+        size_mb = os.path.getsize(input_csv) / 1e6
+        print(f"Input: {rows} rows, {size_mb:.1f} MB")
+
+        for mode in ('memory', 'stream'):
+            out = subprocess.run(
+                [sys.executable, __file__, '--child', mode, '--input', input_csv,
+                 '--output', os.path.join(tmp, f'{mode}.json')],
+                capture_output=True, text=True, check=True, cwd=BACKEND_DIR,
+            )
+            result = json.loads(out.stdout.strip().splitlines()[-1])
+            print(f"{mode:>7}: {rows / result['elapsed']:>12,.0f} rows/s   "
+                  f"peak RSS {result['peak_rss_mb']:>8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark: MechanismIndex build, incremental update and query time
+at 10, 100 and 1000 synthetic mechanisms.
+
+    python benchmarks/bench_mechanism_index.py --queries 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from reasoning.mechanism_index import MechanismIndex
+
+
+def synthetic_catalog(n: int, vocab: list, rng: random.Random):
+    def sentence(words):
+        return " ".join(rng.choice(vocab) for _ in range(words))
+    return {
+        f"Mechanism_{i}": {
+            "name": sentence(4),
+            "description": sentence(25),
+            "research_focus": [sentence(6) for _ in range(3)],
+        }
+        for i in range(n)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--queries', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(8000)]
+    queries = [" ".join(rng.choice(vocab) for _ in range(8)) for _ in range(args.queries)]
+
+    print(f"{'mechanisms':>10} {'build ms':>9} {'add one ms':>11} {'query us':>9} {'matrix MB':>10}")
+    for n in (10, 100, 1000):
+        catalog = synthetic_catalog(n, vocab, rng)
+
+        start = time.perf_counter()
+        index = MechanismIndex(catalog)
+        index.matrix
+        build = time.perf_counter() - start
+
+        catalog["Mechanism_new"] = synthetic_catalog(1, vocab, rng)["Mechanism_0"]
+        start = time.perf_counter()
+        index.update(catalog)
+        index.matrix
+        add_one = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for q in queries:
+            index.search(q, k=5)
+        query = (time.perf_counter() - start) / len(queries)
+
+        print(f"{n:>10} {build * 1000:>9.1f} {add_one * 1000:>11.1f} {query * 1e6:>9.1f} {index.matrix.nbytes / 1e6:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark: substring trigger loop vs the compiled MechanismMatcher
+at 10, 100 and 1000 synthetic mechanisms.
+
+    python benchmarks/bench_mechanism_matcher.py --queries 2000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from reasoning.mechanism_matcher import MechanismMatcher
+
+
+def synthetic_triggers(n_mechanisms: int, keywords: int, vocab: list, rng: random.Random):
+    return {f"Mechanism_{i}": rng.sample(vocab, keywords) for i in range(n_mechanisms)}
+
+
+def naive_best(triggers, text):
+    """The original loop: substring check of every keyword of every mechanism."""
+    text = text.lower()
+    best, max_matches = None, 0
+    for key, keywords in triggers.items():
+        matches = sum(1 for k in keywords if k in text)
+        if matches > max_matches:
+            best, max_matches = key, matches
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--keywords', type=int, default=8)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9))) for _ in range(5000)]
+    queries = [" ".join(rng.choice(vocab) for _ in range(25)) for _ in range(args.queries)]
+
+    print(f"{'mechanisms':>10} {'build ms':>9} {'naive us/query':>15} {'matcher us/query':>17} {'speedup':>8}")
+    for n in (10, 100, 1000):
+        triggers = synthetic_triggers(n, args.keywords, vocab, rng)
+
+        start = time.perf_counter()
+        matcher = MechanismMatcher(triggers)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for q in queries:
+            naive_best(triggers, q)
+        naive = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for q in queries:
+            matcher.best(q)
+        compiled = (time.perf_counter() - start) / len(queries)
+
+        print(f"{n:>10} {build * 1000:>9.1f} {naive * 1e6:>15.1f} {compiled * 1e6:>17.1f} {naive / compiled:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
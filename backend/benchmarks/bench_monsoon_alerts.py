@@ -0,0 +1,44 @@
+"""
+Benchmark: AlertRuleEngine over a synthetic century of regional, state and
+district monsoon data.
+
+    python benchmarks/bench_monsoon_alerts.py --start 1901 --end 2023 --districts 700
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from benchmarks.bench_monsoon_store import synthetic_records
+from streams.climate.monsoon_alerts import AlertRuleEngine
+from streams.climate.monsoon_store import MonsoonStore
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--start', type=int, default=1901)
+    parser.add_argument('--end', type=int, default=2023)
+    parser.add_argument('--states', type=int, default=36)
+    parser.add_argument('--districts', type=int, default=700)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    store = MonsoonStore.from_records(synthetic_records(args.start, args.end, args.states, args.districts, random.Random(7)))
+    engine = AlertRuleEngine()
+    print(f"Years: {len(store)}, observations: {len(store.obs_year)}, rules: {len(engine.rules)}")
+
+    for label, start, end in (("single year", args.end, args.end), ("all years", args.start, args.end)):
+        timings = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            alerts = engine.evaluate(store, start=start, end=end)
+            timings.append(time.perf_counter() - t0)
+        print(f"{label:<12} {min(timings) * 1000:8.1f} ms   {len(alerts):6d} alerts")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark: requests/sec for the monsoon read endpoints, dict-returning handlers
+(previous behaviour) vs the pre-serialized ETag cache, under a local load generator.
+
+    python benchmarks/bench_monsoon_http.py --concurrency 32 --duration 3
+"""
+import argparse
+import asyncio
+import os
+import multiprocessing
+import socket
+import sys
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from api import monsoon_routes
+
+
+def baseline_app() -> FastAPI:
+    """The handlers as they were: build the dict and let FastAPI encode it on every hit."""
+    app = FastAPI()
+    client = monsoon_routes.monsoon_client
+
+    @app.get("/streams/climate/monsoon/current")
+    async def current(year: int = 2019):
+        context = client.context(year)
+        data = context.get_current_metrics()
+        return {
+            "status": "healthy",
+            "timestamp": time.time(),
+            "metrics": {
+                "deviation_percent": data["deviation_percent"],
+                "onset_delay_days": context.get_onset_delay(),
+                "rainfall_total": data["all_india_rainfall_mm"],
+            },
+            "metadata": data,
+        }
+
+    @app.get("/streams/climate/monsoon/historical/{year}")
+    async def historical(year: int):
+        return client.get_year(year)
+
+    return app
+
+
+def cached_app() -> FastAPI:
+    app = FastAPI()
+    app.include_router(monsoon_routes.router)
+    return app
+
+
+def run_server(factory: str, port: int):
+    uvicorn.run(globals()[factory](), host="127.0.0.1", port=port, log_level="warning")
+
+
+def serve(factory: str) -> str:
+    """Runs the app in its own process, so the load generator does not share its GIL."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    multiprocessing.Process(target=run_server, args=(factory, port), daemon=True).start()
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            httpx.get(f"{url}/docs")
+            return url
+        except httpx.TransportError:
+            time.sleep(0.05)
+    raise RuntimeError(f"{factory} did not start")
+
+
+async def load(url: str, concurrency: int, duration: float, headers=None) -> float:
+    """
+    Closed-loop load: `concurrency` keep-alive connections issuing GETs for
+    `duration` seconds. Raw HTTP/1.1 over asyncio streams keeps the generator's
+    own overhead well below the server's.
+    """
+    parsed = httpx.URL(url)
+    target = parsed.raw_path.decode()
+    extra = "".join(f"{k}: {v}\r\n" for k, v in (headers or {}).items())
+    request = f"GET {target} HTTP/1.1\r\nHost: {parsed.host}\r\n{extra}\r\n".encode()
+    done = 0
+
+    async def worker(deadline: float):
+        nonlocal done
+        reader, writer = await asyncio.open_connection(parsed.host, parsed.port)
+        while time.perf_counter() < deadline:
+            writer.write(request)
+            head = await reader.readuntil(b"\r\n\r\n")
+            status = int(head.split(b" ", 2)[1])
+            assert status in (200, 304), head
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    await reader.readexactly(int(line.split(b":")[1]))
+            done += 1
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(start + duration) for _ in range(concurrency)))
+    return done / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=3.0)
+    args = parser.parse_args()
+
+    before, after = serve("baseline_app"), serve("cached_app")
+    etag = httpx.get(f"{after}/streams/climate/monsoon/historical/2019").headers["etag"]
+
+    cases = [
+        ("historical  before", f"{before}/streams/climate/monsoon/historical/2019", None),
+        ("historical  after", f"{after}/streams/climate/monsoon/historical/2019", None),
+        ("historical  after 304", f"{after}/streams/climate/monsoon/historical/2019", {"If-None-Match": etag}),
+        ("current     before", f"{before}/streams/climate/monsoon/current?year=2022", None),
+        ("current     after", f"{after}/streams/climate/monsoon/current?year=2022", None),
+    ]
+    print(f"concurrency {args.concurrency}, {args.duration:.0f}s per case")
+    for label, url, headers in cases:
+        rps = asyncio.run(load(url, args.concurrency, args.duration, headers))
+        print(f"{label:<24} {rps:8.0f} req/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark: JSON-dict monsoon records vs the columnar MonsoonStore on a synthetic
+century of regional, state and district data.
+
+    python benchmarks/bench_monsoon_store.py --start 1901 --end 2023 --districts 700
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from streams.climate.monsoon_store import MonsoonStore
+
+REGIONS = ["North West India", "Central India", "South Peninsula", "East & North East India"]
+STATUS = ["Deficient", "Normal", "Excess"]
+RISK = ["Low", "Medium", "High", "Critical"]
+
+
+def synthetic_records(start: int, end: int, states: int, districts: int, rng: random.Random):
+    state_names = ["Maharashtra"] + [f"State {i}" for i in range(1, states)]
+    district_state = [state_names[i % states] for i in range(districts)]
+
+    def cell():
+        deviation = round(rng.gauss(0, 20))
+        return {"rainfall_mm": round(rng.uniform(200, 2500), 1), "deviation": deviation,
+                "status": STATUS[(deviation > -20) + (deviation > 20)], "risk_level": rng.choice(RISK)}
+
+    records = {}
+    for year in range(start, end + 1):
+        records[str(year)] = {
+            "year": year,
+            "scenario_name": f"Season {year}",
+            "all_india_rainfall_mm": round(rng.uniform(700, 1100), 1),
+            "lpa_mm": 868.6,
+            "deviation_percent": round(rng.gauss(0, 10)),
+            "onset_date": f"{year}-06-{rng.randint(1, 14):02d}",
+            "normal_onset_date": f"{year}-06-01",
+            "withdrawal_date": f"{year}-10-{rng.randint(1, 20):02d}",
+            "status": rng.choice(STATUS),
+            "regional_data": [{"region": r, **{k: v for k, v in cell().items() if k != "risk_level"}} for r in REGIONS],
+            "states": {s: cell() for s in state_names},
+            "districts": {f"District {i}": {"state": district_state[i], **cell()} for i in range(districts)},
+        }
+    return records
+
+
+def timed(fn, repeat: int = 200) -> float:
+    fn()  # warm lazily built indexes
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--start', type=int, default=1901)
+    parser.add_argument('--end', type=int, default=2023)
+    parser.add_argument('--states', type=int, default=36)
+    parser.add_argument('--districts', type=int, default=700)
+    args = parser.parse_args()
+
+    records = synthetic_records(args.start, args.end, args.states, args.districts, random.Random(7))
+    years = list(range(args.start, args.end + 1))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, 'monsoon.json')
+        store_path = os.path.join(tmp, 'monsoon.npz')
+        with open(json_path, 'w') as f:
+            json.dump(records, f)
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        with open(json_path, 'r') as f:
+            data = json.load(f)
+        json_load = time.perf_counter() - start
+        json_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        MonsoonStore.from_json(json_path).save(store_path)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = MonsoonStore.load(store_path)
+        first = store.series("Maharashtra", args.start, args.end)
+        lazy_first = time.perf_counter() - start
+
+        npz_size = os.path.getsize(store_path)
+        json_size = os.path.getsize(json_path)
+
+    def dict_series():
+        return [data[str(y)]["states"]["Maharashtra"]["rainfall_mm"] for y in years if str(y) in data]
+
+    def dict_district(year=2000, name=f"District {args.districts - 1}"):
+        return data[str(year)]["districts"][name]["rainfall_mm"]
+
+    def dict_onset():
+        from datetime import datetime
+        d = data[str(args.end)]
+        return (datetime.strptime(d["onset_date"], "%Y-%m-%d") - datetime.strptime(d["normal_onset_date"], "%Y-%m-%d")).days
+
+    assert dict_series() == [round(float(v), 1) for v in first["rainfall_mm"]]
+
+    areas = 4 + args.states + args.districts
+    print(f"Years: {len(years)}, areas: {areas}, observations: {len(years) * areas}")
+    print(f"json.load          : {json_load * 1000:8.1f} ms   {json_bytes / 1e6:7.1f} MB in memory   {json_size / 1e6:6.1f} MB on disk")
+    print(f"store build + save : {build * 1000:8.1f} ms   {store.nbytes / 1e6:7.1f} MB in memory   {npz_size / 1e6:6.1f} MB on disk")
+    print(f"store lazy open + first series: {lazy_first * 1000:.1f} ms")
+    print(f"{'query':<28} {'dict ms':>9} {'store ms':>9}")
+    print(f"{'Maharashtra ' + str(args.start) + '-' + str(args.end):<28} {timed(dict_series):9.4f} {timed(lambda: store.series('Maharashtra', args.start, args.end)):9.4f}")
+    print(f"{'district rainfall':<28} {timed(dict_district):9.4f} {timed(lambda: store.rainfall(2000, f'District {args.districts - 1}')):9.4f}")
+    print(f"{'onset delay':<28} {timed(dict_onset):9.4f} {timed(lambda: store.onset_delay(args.end)):9.4f}")
+
+
+if __name__ == '__main__':
+    main()
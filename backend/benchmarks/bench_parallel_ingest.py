@@ -0,0 +1,47 @@
+"""
+Benchmark: process_hurricanes_parallel scaling from 1 to N worker processes.
+
+    python benchmarks/bench_parallel_ingest.py --storms 20000 --max-workers 8
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from benchmarks.synthetic_ibtracs import write_synthetic_ibtracs
+from scripts.process_hurricanes import process_hurricanes, process_hurricanes_parallel
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--storms', type=int, default=5000)
+    parser.add_argument('--points', type=int, default=60)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_csv = os.path.join(tmp, 'ibtracs.csv')
+        rows = write_synthetic_ibtracs(input_csv, args.storms, args.points)
+        output = os.path.join(tmp, 'out.json')
+
+        start = time.perf_counter()
+        process_hurricanes(input_csv, output, start_year=1980, stream=True)
+        baseline = time.perf_counter() - start
+        print(f"serial stream : {baseline:6.2f} s  {rows / baseline:>10,.0f} rows/s")
+
+        workers = 1
+        while workers <= args.max_workers:
+            start = time.perf_counter()
+            process_hurricanes_parallel([input_csv], output, start_year=1980, end_year=2023, workers=workers)
+            elapsed = time.perf_counter() - start
+            print(f"workers={workers:<5}: {elapsed:6.2f} s  {rows / elapsed:>10,.0f} rows/s  "
+                  f"speedup x{baseline / elapsed:.2f}")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
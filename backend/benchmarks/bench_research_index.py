@@ -0,0 +1,76 @@
+"""
+Benchmark: IndianResearchClient BM25 index build time, memory and query latency
+on synthetic corpora.
+
+    python benchmarks/bench_research_index.py --sizes 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from reasoning.indian_research_client import IndianResearchClient
+
+INSTITUTIONS = ["IIT Bombay", "IIT Delhi", "IITM Pune", "IISc Bangalore", "ICAR", "ICRISAT", "TERI", "NCMRWF"]
+
+
+def synthetic_papers(n: int, rng: random.Random):
+    vocab = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 10))) for _ in range(20000)]
+    # Zipf-like term popularity, like real abstracts
+    weights = [1 / (i + 1) for i in range(len(vocab))]
+    def text(words):
+        return " ".join(rng.choices(vocab, weights, k=words))
+    papers = [{
+        "title": text(8),
+        "summary": text(40),
+        "institution": rng.choice(INSTITUTIONS),
+        "year": rng.randint(2000, 2024),
+    } for _ in range(n)]
+    return papers, vocab
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--queries', type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    print(f"{'papers':>8} {'build s':>8} {'index MB':>9} {'p50 ms':>7} {'p95 ms':>7} {'filtered p50 ms':>16}")
+    for n in args.sizes:
+        papers, vocab = synthetic_papers(n, rng)
+        queries = [" ".join(rng.choices(vocab[:2000], k=4)) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        client = IndianResearchClient(papers=papers)
+        build = time.perf_counter() - start
+
+        # Second build under tracemalloc for the index footprint (papers themselves excluded)
+        tracemalloc.start()
+        footprint = IndianResearchClient(papers=papers)
+        index_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del footprint
+
+        def latencies(**filters):
+            out = []
+            for q in queries:
+                t = time.perf_counter()
+                client.search_page(q, limit=10, **filters)
+                out.append(time.perf_counter() - t)
+            out.sort()
+            return out
+
+        plain = latencies()
+        filtered = latencies(institution="IIT", year_from=2015)
+        print(f"{n:>8} {build:>8.2f} {index_bytes / 1e6:>9.1f} {plain[len(plain) // 2] * 1000:>7.2f} "
+              f"{plain[int(len(plain) * 0.95)] * 1000:>7.2f} {filtered[len(filtered) // 2] * 1000:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
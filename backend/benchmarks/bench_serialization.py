@@ -0,0 +1,65 @@
+"""
+Benchmark: encode throughput (MB/s) and p99 encode time for the payloads the
+API streams, stdlib json vs the shared serializer (models/serialization.py).
+
+    python benchmarks/bench_serialization.py --iterations 5000
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from models import serialization
+from models.serialization import frame, ndjson
+from reasoning.llm_engine import OracleEngine
+
+
+def measure(encode, payload, iterations: int):
+    """(MB/s, p99 microseconds) over `iterations` encodes."""
+    timings = np.empty(iterations)
+    size = 0
+    for i in range(iterations):
+        start = time.perf_counter()
+        out = encode(payload)
+        timings[i] = time.perf_counter() - start
+        size += len(out)
+    return size / timings.sum() / 1e6, np.percentile(timings, 99) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+
+    engine = OracleEngine()
+    analysis = engine.analyze_strategy("Cloud seeding over Maharashtra", investment_inr=5e8)
+    final = {"status": "oracle_analysis", "progress": 100, "message": "Analysis Complete", "cached": False, "data": analysis}
+    batch = engine.analyze_batch([f"strategy {i} cloud seeding" for i in range(200)], list(np.linspace(1e7, 5e9, 50)))
+    progress = {"status": "progress", "progress": 30, "message": "Mechanism identified: Monsoon Cloud Seeding",
+                "stage": "mechanism_detection"}
+
+    def stdlib(payload):
+        return (json.dumps(payload) + "\n").encode()
+
+    cases = [
+        ("progress frame", progress, stdlib, ndjson, lambda p: frame(**p)),
+        ("final analysis", final, stdlib, ndjson, None),
+        ("batch 200x50", batch, stdlib, ndjson, None),
+    ]
+    print(f"serializer backend: {serialization.BACKEND}")
+    print(f"{'payload':<16} {'bytes':>7} {'stdlib MB/s':>12} {'p99 us':>8} {'fast MB/s':>10} {'p99 us':>8} {'frame p99 us':>13}")
+    for label, payload, slow, fast, cached in cases:
+        slow_rate, slow_p99 = measure(slow, payload, args.iterations)
+        fast_rate, fast_p99 = measure(fast, payload, args.iterations)
+        cached_p99 = f"{measure(cached, payload, args.iterations)[1]:13.2f}" if cached else f"{'-':>13}"
+        print(f"{label:<16} {len(fast(payload)):7d} {slow_rate:12.1f} {slow_p99:8.2f} {fast_rate:10.1f} {fast_p99:8.2f} {cached_p99}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: /api/simulate/stream latency under concurrent load.
+Drives the ASGI app in-process and reports p50/p95 time to the final analysis.
+The demo prompts repeat, so the result cache serves most requests; --no-cache
+measures the full pipeline.
+
+    python benchmarks/bench_simulate_stream.py --requests 500 --concurrency 50 [--no-cache]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from main import app
+from reasoning.llm_engine import llm_engine
+
+logging.getLogger().setLevel(logging.WARNING)
+
+STRATEGIES = [
+    "Use Cloud Seeding to help Maharashtra farmers",
+    "Improve IMD monsoon forecast accuracy",
+    "Drought resistant crop insurance for Vidarbha",
+    "Cool roof coating for Delhi heat",
+]
+
+
+async def one_request(client, i):
+    start = time.perf_counter()
+    payload = {"user_input": STRATEGIES[i % len(STRATEGIES)], "investment": 50.0}
+    async with client.stream("POST", "/api/simulate/stream", json=payload) as response:
+        async for line in response.aiter_lines():
+            if line and json.loads(line)["status"] == "oracle_analysis":
+                break
+    return time.perf_counter() - start
+
+
+async def run(n_requests: int, concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def bounded(i):
+            async with semaphore:
+                return await one_request(client, i)
+
+        start = time.perf_counter()
+        latencies = sorted(await asyncio.gather(*(bounded(i) for i in range(n_requests))))
+        wall = time.perf_counter() - start
+
+    def pct(p):
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+    print(f"Requests:    {n_requests} ({concurrency} concurrent)")
+    print(f"p50 latency: {pct(0.50):.1f} ms")
+    print(f"p95 latency: {pct(0.95):.1f} ms")
+    print(f"Throughput:  {n_requests / wall:.0f} req/s")
+    print(f"Cache:       {llm_engine.cache.get_stats()}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=50)
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+    if args.no_cache:
+        llm_engine.cache.maxsize = 0
+    asyncio.run(run(args.requests, args.concurrency))
+
+
+if __name__ == '__main__':
+    main()
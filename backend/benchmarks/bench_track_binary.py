@@ -0,0 +1,60 @@
+"""
+Benchmark: segmented GeoJSON vs the .htrk binary track format.
+Reports file size and load time (json.load vs mmap decode).
+
+    python benchmarks/bench_track_binary.py --storms 5000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from benchmarks.synthetic_ibtracs import write_synthetic_ibtracs
+from scripts.process_hurricanes import process_hurricanes, build_track_store
+from streams.climate.track_binary import read_binary, write_binary
+
+
+def best_of(fn, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--storms', type=int, default=5000)
+    parser.add_argument('--points', type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_csv = os.path.join(tmp, 'ibtracs.csv')
+        write_synthetic_ibtracs(input_csv, args.storms, args.points)
+        geojson = os.path.join(tmp, 'tracks.json')
+        process_hurricanes(input_csv, geojson, start_year=0, stream=True)
+        store = build_track_store(input_csv, start_year=0)
+
+        def load_json():
+            with open(geojson) as f:
+                json.load(f)
+
+        rows = [("GeoJSON", geojson, load_json)]
+        for compress in (False, True):
+            path = os.path.join(tmp, f"tracks{'.z' if compress else ''}.htrk")
+            write_binary(store, path, compress=compress)
+            rows.append((f".htrk{' + zlib' if compress else ''}", path, lambda p=path: read_binary(p)))
+
+        print(f"{'format':<14}{'size MB':>10}{'load ms':>10}")
+        for label, path, load in rows:
+            print(f"{label:<14}{os.path.getsize(path) / 1e6:>10.2f}{best_of(load) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark: per-point dict tracks vs the columnar TrackStore.
+Reports bytes/point and segment-build time.
+
+    python benchmarks/bench_track_store.py --storms 5000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+from benchmarks.synthetic_ibtracs import write_synthetic_ibtracs
+from scripts.process_hurricanes import load_tracks, build_features, build_track_store
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--storms', type=int, default=5000)
+    parser.add_argument('--points', type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_csv = os.path.join(tmp, 'ibtracs.csv')
+        rows = write_synthetic_ibtracs(input_csv, args.storms, args.points)
+
+        tracemalloc.start()
+        tracks = load_tracks(input_csv, start_year=0)
+        dict_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        store = build_track_store(input_csv, start_year=0)
+
+        start = time.perf_counter()
+        features = build_features(tracks)
+        dict_segments = time.perf_counter() - start
+
+        start = time.perf_counter()
+        segments = store.segments()
+        store_segments = time.perf_counter() - start
+
+    print(f"Points: {rows}, segments: {len(features)} / {len(segments['lat0'])}")
+    print(f"dict tracks : {dict_bytes / rows:8.1f} bytes/point   segments {dict_segments * 1000:8.1f} ms")
+    print(f"TrackStore  : {store.nbytes / rows:8.1f} bytes/point   segments {store_segments * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
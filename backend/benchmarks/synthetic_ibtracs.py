@@ -0,0 +1,48 @@
+"""
+Synthetic IBTrACS CSV generator for benchmarks.
+Produces files with the same header/units layout as the NOAA exports.
+"""
+import csv
+import random
+
+HEADER = ['SID', 'SEASON', 'NUMBER', 'BASIN', 'SUBBASIN', 'NAME', 'ISO_TIME',
+          'NATURE', 'LAT', 'LON', 'WMO_WIND', 'WMO_PRES', 'USA_WIND']
+UNITS = [' ', 'Year', ' ', ' ', ' ', ' ', ' ', ' ', 'degrees_north', 'degrees_east', 'kts', 'mb', 'kts']
+BASINS = ['NA', 'EP', 'WP', 'NI', 'SI', 'SP', 'SA']
+
+
+def write_synthetic_ibtracs(path, n_storms=1000, points_per_storm=60,
+                            start_season=1980, end_season=2023, basins=BASINS, seed=42):
+    """Writes n_storms tracks sorted by SID. Returns the number of data rows."""
+    rng = random.Random(seed)
+    seasons = list(range(start_season, end_season + 1))
+    storms = []
+    for i in range(n_storms):
+        season = seasons[i * len(seasons) // n_storms]
+        day = 1 + (i % 365)
+        lat0 = rng.uniform(-30, 30)
+        lon0 = rng.uniform(-180, 170)
+        sid = f"{season}{day:03d}{'N' if lat0 >= 0 else 'S'}{abs(int(lat0)):02d}{int(lon0) % 360:03d}"
+        storms.append((sid, season, basins[i % len(basins)], lat0, lon0))
+    storms.sort()
+
+    rows = 0
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADER)
+        writer.writerow(UNITS)
+        for number, (sid, season, basin, lat, lon) in enumerate(storms):
+            name = f"STORM{number % 500}"
+            for p in range(points_per_storm):
+                lat += rng.uniform(-0.3, 0.8)
+                lon += rng.uniform(-1.0, 0.4)
+                wind = '' if p % 17 == 0 else str(rng.randint(20, 150))
+                hour = (p * 6) % 24
+                day_offset = p // 4
+                writer.writerow([
+                    sid, season, number, basin, 'MM', name,
+                    f"{season}-08-{1 + day_offset % 28:02d} {hour:02d}:00:00",
+                    'TS', f"{lat:.4f}", f"{((lon + 180) % 360) - 180:.4f}", wind, '', wind
+                ])
+                rows += 1
+    return rows
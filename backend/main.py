@@ -1,8 +1,11 @@
 import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+from typing import List, Literal
 from fastapi.responses import StreamingResponse
+import asyncio
 import os
 import json
 
@@ -10,9 +13,21 @@ import json
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-from api import monsoon_routes
+from api import monsoon_routes, stream_routes, track_routes
+from models.serialization import ORJSONResponse
+from streams.stream_manager import stream_manager
+from reasoning.arxiv_wrapper import arxiv_client
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background stream scans run for the lifetime of the server
+    stream_manager.start()
+    yield
+    await stream_manager.stop()
+    await arxiv_client.aclose()
+
+# Plain dict responses render through the shared fast serializer
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -23,14 +38,38 @@ app.add_middleware(
 )
 
 app.include_router(monsoon_routes.router, prefix="/api")
+app.include_router(track_routes.router, prefix="/api")
+app.include_router(stream_routes.router, prefix="/api")
 
 class Intervention(BaseModel):
     user_input: str
     investment: float = 1.0
 
+class BatchIntervention(BaseModel):
+    strategies: List[str] = Field(..., min_length=1, max_length=1000)
+    investments: List[float] = Field(..., min_length=1, max_length=1000)  # Crores, like Intervention.investment
+    format: Literal["matrix", "ndjson"] = "matrix"
+
 from reasoning.llm_engine import llm_engine
 
 
+@app.get("/api/simulate/cache")
+async def get_simulation_cache_stats():
+    """Hit/miss counters for the analysis result cache."""
+    return llm_engine.cache.get_stats()
+
+
+@app.post("/api/simulate/batch")
+async def analyze_simulation_batch(data: BatchIntervention):
+    """Feasibility matrix (strategies x investments) for scenario sweeps."""
+    investments_inr = [v * 10000000 for v in data.investments] # Same mock conversion as /simulate/stream
+    if data.format == "ndjson":
+        return StreamingResponse(llm_engine.stream_batch(data.strategies, investments_inr),
+                                 media_type="application/x-ndjson")
+    # Already JSON-ready; returning the response skips FastAPI's jsonable_encoder pass over the matrix
+    return ORJSONResponse(await asyncio.to_thread(llm_engine.analyze_batch, data.strategies, investments_inr))
+
+
 @app.post("/api/simulate/stream")
 async def analyze_simulation_stream(data: Intervention):
     try:
@@ -0,0 +1,164 @@
+"""
+Typed domain models for the Oracle engine.
+
+Frozen dataclasses: mechanisms and policies are validated once when the
+knowledge tables are loaded, and an AnalysisResult is built from shared,
+immutable parts. orjson/msgspec encode these dataclasses directly (see
+models/serialization.py), so a result never goes through an intermediate dict.
+They are deliberately not slotted: orjson serializes __dict__-backed
+dataclasses several times faster than slotted ones.
+"""
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+def _field(data: Mapping[str, Any], name: str, types, owner: str):
+    if name not in data:
+        raise ValueError(f"{owner}: missing '{name}'")
+    value = data[name]
+    if not isinstance(value, types) or isinstance(value, bool):
+        raise ValueError(f"{owner}: '{name}' must be {getattr(types, '__name__', types)}, got {type(value).__name__}")
+    return value
+
+def _strings(data: Mapping[str, Any], name: str, owner: str) -> Tuple[str, ...]:
+    values = _field(data, name, (list, tuple), owner)
+    if not all(isinstance(v, str) for v in values):
+        raise ValueError(f"{owner}: '{name}' must contain only strings")
+    return tuple(values)
+
+@dataclass(frozen=True)
+class EconomicContext:
+    cost_per_unit_inr: float
+    roi_years: float
+    benefit_description: str
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "economic_context") -> "EconomicContext":
+        return cls(
+            cost_per_unit_inr=_field(data, "cost_per_unit_inr", (int, float), owner),
+            roi_years=_field(data, "roi_years", (int, float), owner),
+            benefit_description=_field(data, "benefit_description", str, owner),
+        )
+
+@dataclass(frozen=True)
+class Bottleneck:
+    current_capability: str
+    required_capability: float
+    gap_ratio: float
+    description: str
+
+@dataclass(frozen=True)
+class ResearchVector:
+    focus: str
+    institutions: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class Mechanism:
+    key: str
+    name: str
+    description: str
+    current_capability: str
+    required_capability_base: float
+    gap_ratio: float
+    research_focus: Tuple[str, ...]
+    indian_institutions: Tuple[str, ...]
+    economic_context: EconomicContext
+    # Derived once here and shared by every AnalysisResult for this mechanism
+    bottleneck: Bottleneck
+    research_vectors: Tuple[ResearchVector, ...]
+
+    @classmethod
+    def from_dict(cls, key: str, data: Mapping[str, Any]) -> "Mechanism":
+        owner = f"mechanism '{key}'"
+        gap_ratio = _field(data, "gap_ratio", (int, float), owner)
+        if gap_ratio <= 0:
+            raise ValueError(f"{owner}: 'gap_ratio' must be positive")
+        current = _field(data, "current_capability", str, owner)
+        required = _field(data, "required_capability_base", (int, float), owner)
+        institutions = _strings(data, "indian_institutions", owner)
+        focus = _strings(data, "research_focus", owner)
+        return cls(
+            key=key,
+            name=_field(data, "name", str, owner),
+            description=_field(data, "description", str, owner),
+            current_capability=current,
+            required_capability_base=required,
+            gap_ratio=gap_ratio,
+            research_focus=focus,
+            indian_institutions=institutions,
+            economic_context=EconomicContext.from_dict(_field(data, "economic_context", Mapping, owner),
+                                                       f"{owner} economic_context"),
+            bottleneck=Bottleneck(current, required, gap_ratio,
+                                  f"Gap of {gap_ratio}x between current pilots and required scale."),
+            research_vectors=tuple(ResearchVector(f, institutions) for f in focus),
+        )
+
+@dataclass(frozen=True)
+class PolicyContext:
+    relevant_ministries: Tuple[str, ...]
+    existing_programs: Tuple[str, ...]
+    political_feasibility_score: float
+    alignment_notes: str
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any], owner: str = "policy") -> "PolicyContext":
+        score = _field(data, "political_feasibility_score", (int, float), owner)
+        if not 0 <= score <= 1:
+            raise ValueError(f"{owner}: 'political_feasibility_score' must be within [0, 1]")
+        return cls(
+            relevant_ministries=_strings(data, "relevant_ministries", owner),
+            existing_programs=_strings(data, "existing_programs", owner),
+            political_feasibility_score=score,
+            alignment_notes=_field(data, "alignment_notes", str, owner),
+        )
+
+@dataclass(frozen=True)
+class ResearchPaper:
+    """
+    A paper from any research source. Local repository papers carry authors/
+    institution/year/url, arXiv papers author/journal/relevance; fields a source
+    does not provide are None.
+    """
+    title: str
+    summary: Optional[str] = None
+    authors: Optional[Tuple[str, ...]] = None
+    author: Optional[str] = None
+    institution: Optional[str] = None
+    journal: Optional[str] = None
+    year: Optional[int] = None
+    url: Optional[str] = None
+    doi: Optional[str] = None
+    relevance: Optional[str] = None
+    score: Optional[float] = None
+    sources: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ResearchPaper":
+        title = data.get("title")
+        if not isinstance(title, str):
+            raise ValueError("research paper: 'title' must be str")
+        get = data.get
+        authors, sources = get("authors"), get("sources")
+        return cls(title, get("summary"), tuple(authors) if authors is not None else None, get("author"),
+                   get("institution"), get("journal"), get("year"), get("url"), get("doi"), get("relevance"),
+                   get("score"), tuple(sources) if sources is not None else None)
+
+@dataclass(frozen=True)
+class AnalysisResult:
+    """The oracle_analysis payload; field order is the JSON key order."""
+    mechanism: str
+    description: str
+    feasibility_score: float
+    bottleneck: Bottleneck
+    research_vectors: Tuple[ResearchVector, ...]
+    active_papers: Tuple[ResearchPaper, ...]
+    research_sources: Mapping[str, Mapping[str, Any]]
+    economic_context: EconomicContext
+    policy_context: PolicyContext
+
+    def __post_init__(self):
+        # Results are shared through the result cache, so per-source stats are exposed as read-only views.
+        # The stats dicts are handed over by the engine (built per result), so they are wrapped, not copied.
+        if type(self.research_sources) is not MappingProxyType:
+            object.__setattr__(self, "research_sources", MappingProxyType(
+                {name: MappingProxyType(stats) for name, stats in self.research_sources.items()}))
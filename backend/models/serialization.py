@@ -0,0 +1,85 @@
+"""
+Shared JSON encoding for API responses and NDJSON streams.
+
+The backend is picked once at import: orjson, then msgspec, then the stdlib
+json module (set ORACLE_JSON=orjson|msgspec|json to force one). Every backend
+emits compact UTF-8 JSON bytes and handles numpy values, dataclasses and
+pydantic models.
+"""
+import dataclasses
+import json
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+import numpy as np
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+def _default(obj: Any) -> Any:
+    """Types none of the backends encode natively; anything else falls back to str(), like json.dumps(default=str)."""
+    if type(obj) is MappingProxyType:
+        # Exact type check first: read-only views are frequent (AnalysisResult) and the ABC checks below are slow
+        return dict(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow: json.dumps calls back here for nested dataclasses (orjson and msgspec encode them natively)
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return str(obj)
+
+def _orjson_dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+def _select_backend():
+    requested = os.environ.get("ORACLE_JSON", "").lower()
+    available = {"json": _json_dumps}
+    if msgspec is not None:
+        available["msgspec"] = msgspec.json.Encoder(enc_hook=_default).encode
+    if orjson is not None:
+        available["orjson"] = _orjson_dumps
+    if requested in available:
+        return requested, available[requested]
+    for name in ("orjson", "msgspec", "json"):
+        if name in available:
+            return name, available[name]
+
+BACKEND, dumps = _select_backend()
+
+def ndjson(obj: Any) -> bytes:
+    """One NDJSON line."""
+    return dumps(obj) + b"\n"
+
+@lru_cache(maxsize=1024)
+def frame(**fields) -> bytes:
+    """
+    NDJSON line for a small, repeated event (progress steps, fixed errors),
+    encoded once and then served from memory. Field values must be hashable.
+    """
+    return ndjson(fields)
+
+class ORJSONResponse(JSONResponse):
+    """Default response class: renders through dumps(), so it works with or without orjson installed."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
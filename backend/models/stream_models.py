@@ -27,3 +27,13 @@ class Alert(BaseModel):
     message: str
     created_at: float
     context: Dict[str, Any] = {}
+
+class AlertDiff(BaseModel):
+    new: List[Alert] = []
+    resolved: List[Alert] = []
+
+class WorldState(BaseModel):
+    timestamp: float
+    streams: Dict[str, StreamData] = {}
+    alerts: List[Alert] = []
+    scan_latency_ms: Optional[float] = None
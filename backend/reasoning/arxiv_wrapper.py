@@ -1,65 +1,272 @@
-import urllib.request
-import urllib.parse
+import asyncio
+import hashlib
+import json
+import os
+import time
 import xml.etree.ElementTree as ET
 import logging
+from contextlib import aclosing
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
+
+import httpx
 
 logger = logging.getLogger(__name__)
 
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'arxiv')
+CACHE_TTL = 24 * 3600     # Seconds a cached result counts as fresh
+TIMEOUT = 10.0            # Seconds per upstream search, including time spent waiting on the rate limit
+RATE_LIMIT_SECONDS = 3.0  # arXiv API terms: at most one request every 3 seconds
+MAX_CONNECTIONS = 4
+
+ATOM_NS = {'atom': 'http://www.w3.org/2005/Atom'} # Arxiv uses Atom namespace
+ARXIV_NS = {'arxiv': 'http://arxiv.org/schemas/atom'}
+ENTRY_TAG = '{http://www.w3.org/2005/Atom}entry'
+
+class DiskTTLCache:
+    """One JSON file per query under directory; entries older than ttl are stale but kept for fallback."""
+
+    def __init__(self, directory: str, ttl: float = CACHE_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[Tuple[List[Dict[str, Any]], float]]:
+        """(papers, age in seconds) or None."""
+        try:
+            with open(self._path(key), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry["papers"], time.time() - entry["fetched_at"]
+
+    def put(self, key: str, papers: List[Dict[str, Any]]):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"key": key, "fetched_at": time.time(), "papers": papers}, f)
+        os.replace(tmp_path, path)
+
+def parse_entry(entry) -> Dict[str, Any]:
+    title = entry.find('atom:title', ATOM_NS).text.strip().replace('\n', ' ')
+    summary = entry.find('atom:summary', ATOM_NS).text.strip().replace('\n', ' ')
+    published = entry.find('atom:published', ATOM_NS).text[:4] # Year only
+
+    # Get first author
+    author = entry.find('atom:author', ATOM_NS).find('atom:name', ATOM_NS).text
+
+    # Calculate a mock relevance score for UI flair
+    relevance = f"{90 + (len(title) % 10)}%"
+
+    paper = {
+        "title": title,
+        "author": f"{author} et al.",
+        "journal": f"ArXiv ({published})",
+        "relevance": relevance,
+        "summary": summary[:150] + "..." # Truncate for UI
+    }
+
+    # Published version, when the authors linked one (used for cross-source dedup)
+    doi = entry.find('arxiv:doi', ARXIV_NS)
+    if doi is not None and doi.text:
+        paper["doi"] = doi.text.strip()
+    return paper
+
+class FeedParser:
+    """
+    Incremental Atom parser: feed() response chunks, get back the papers whose
+    <entry> closed in them. Finished entries are detached from the tree, so
+    memory stays bounded by one entry regardless of max_results.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root = None
+
+    def feed(self, chunk: bytes) -> List[Dict[str, Any]]:
+        self._parser.feed(chunk)
+        papers = []
+        for event, elem in self._parser.read_events():
+            if self._root is None:
+                self._root = elem
+            elif event == "end" and elem.tag == ENTRY_TAG:
+                papers.append(parse_entry(elem))
+                self._root.remove(elem)
+        return papers
+
 class ArxivWrapper:
     """
     Fetches real scientific papers from the Arxiv API.
+    - Async httpx client with pooled keep-alive connections and a per-search timeout.
+    - Responses are parsed as they download; iter_papers yields each paper as its entry arrives.
+    - Per-query TTL cache persisted to disk; stale entries are served when upstream fails or is slow.
+    - Concurrent identical searches share one upstream request.
+    - Upstream requests are spaced at least RATE_LIMIT_SECONDS apart.
     """
-    
+
     BASE_URL = "http://export.arxiv.org/api/query"
-    
-    def search_papers(self, query: str, max_results: int = 5):
+
+    def __init__(self, base_url: Optional[str] = None, cache_dir: str = CACHE_DIR, ttl: float = CACHE_TTL,
+                 timeout: float = TIMEOUT, min_interval: float = RATE_LIMIT_SECONDS):
+        self.base_url = base_url or self.BASE_URL
+        self.cache = DiskTTLCache(cache_dir, ttl)
+        self.timeout = timeout
+        self.min_interval = min_interval
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "upstream": 0, "stale_served": 0, "failures": 0}
+        self._loop = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._rate_lock: Optional[asyncio.Lock] = None
+        self._next_slot = 0.0
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _bind_loop(self):
+        """Client, lock and in-flight table belong to one event loop; recreate them if the loop changed."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            if self._client is not None:
+                self._retire_client(self._client, self._loop)
+            self._loop = loop
+            self._client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.timeout),
+                limits=httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS),
+            )
+            self._rate_lock = asyncio.Lock()
+            self._inflight = {}
+
+    @staticmethod
+    def _retire_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop):
         """
-        Queries Arxiv and returns a list of papers.
+        Closes a client left over from a previous event loop. Its pooled connections can
+        only be closed on that loop, so if it is no longer running the client is dropped
+        and its sockets are released when it is collected (the app's lifespan and callers
+        of asyncio.run should aclose() before their loop ends).
+        """
+        if loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+        else:
+            logger.debug("Arxiv client outlived its event loop; discarding it")
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+        self._loop = self._client = None
+
+    def query_url(self, query: str, max_results: int) -> str:
+        # We search in title (ti) and abstract (abs)
+        # Example: http://export.arxiv.org/api/query?search_query=all:electron&start=0&max_results=1
+        params = httpx.QueryParams({
+            "search_query": f"all:{query}", "start": 0, "max_results": max_results,
+            "sortBy": "relevance", "sortOrder": "descending",
+        })
+        return f"{self.base_url}?{params}"
+
+    async def _wait_for_slot(self):
+        async with self._rate_lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.min_interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _stream_entries(self, query: str, max_results: int, timeout: float) -> AsyncIterator[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        await asyncio.wait_for(self._wait_for_slot(), deadline - loop.time())
+
+        url = self.query_url(query, max_results)
+        logger.info(f"Fetching Arxiv data from: {url}")
+        self.stats["upstream"] += 1
+        parser = FeedParser()
+        # The deadline covers waiting for the response headers as well as the body
+        request = self._client.build_request("GET", url)
+        response = await asyncio.wait_for(self._client.send(request, stream=True), deadline - loop.time())
+        try:
+            response.raise_for_status()
+            chunks = response.aiter_bytes()
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(chunks.__anext__(), deadline - loop.time())
+                except StopAsyncIteration:
+                    break
+                for paper in parser.feed(chunk):
+                    yield paper
+        finally:
+            await response.aclose()
+
+    async def iter_papers(self, query: str, max_results: int = 5, timeout: Optional[float] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields papers as soon as each Atom entry has been received.
+        Serves fresh cache hits, joins an identical in-flight search, and falls
+        back to the last cached result (even if expired) when upstream fails or
+        exceeds timeout before delivering anything.
         """
+        self._bind_loop()
+        key = f"{' '.join(query.lower().split())}|{max_results}"
+
+        # Cache reads and writes are file I/O, kept off the event loop
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None and cached[1] < self.cache.ttl:
+            self.stats["hits"] += 1
+            for paper in cached[0]:
+                yield paper
+            return
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            for paper in await asyncio.shield(pending):
+                yield paper
+            return
+
+        self.stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        papers = []
+        completed = False
         try:
-            # Construct API query
-            # We search in title (ti) and abstract (abs)
-            # Example: http://export.arxiv.org/api/query?search_query=all:electron&start=0&max_results=1
-            
-            # Clean query for URL
-            safe_query = urllib.parse.quote(f"all:{query}")
-            url = f"{self.BASE_URL}?search_query={safe_query}&start=0&max_results={max_results}&sortBy=relevance&sortOrder=descending"
-            
-            logger.info(f"Fetching Arxiv data from: {url}")
-            
-            with urllib.request.urlopen(url) as response:
-                xml_data = response.read()
-                
-            # Parse XML
-            root = ET.fromstring(xml_data)
-            ns = {'atom': 'http://www.w3.org/2005/Atom'} # Arxiv uses Atom namespace
-            
-            papers = []
-            for entry in root.findall('atom:entry', ns):
-                title = entry.find('atom:title', ns).text.strip().replace('\n', ' ')
-                summary = entry.find('atom:summary', ns).text.strip().replace('\n', ' ')
-                published = entry.find('atom:published', ns).text[:4] # Year only
-                
-                # Get first author
-                author = entry.find('atom:author', ns).find('atom:name', ns).text
-                
-                # Calculate a mock relevance score for UI flair
-                relevance = f"{90 + (len(title) % 10)}%" 
-                
-                papers.append({
-                    "title": title,
-                    "author": f"{author} et al.",
-                    "journal": f"ArXiv ({published})",
-                    "relevance": relevance,
-                    "summary": summary[:150] + "..." # Truncate for UI
-                })
-                
-            return papers
-            
-        except Exception as e:
-            logger.error(f"Arxiv fetch failed: {e}")
-            # Fallback to empty list or placeholders if critical
-            return []
+            try:
+                async with aclosing(self._stream_entries(query, max_results, timeout or self.timeout)) as entries:
+                    async for paper in entries:
+                        papers.append(paper)
+                        yield paper
+            except Exception as e:
+                self.stats["failures"] += 1
+                stale = await asyncio.to_thread(self.cache.get, key)
+                if stale is not None and not papers:
+                    logger.warning(f"Arxiv fetch failed ({e!r}), serving cached result from {stale[1]:.0f}s ago")
+                    self.stats["stale_served"] += 1
+                    papers = stale[0]
+                    for paper in papers:
+                        yield paper
+                else:
+                    # Fallback to empty list (or whatever arrived) if critical
+                    logger.error(f"Arxiv fetch failed after {len(papers)} papers: {e!r}")
+            else:
+                await asyncio.to_thread(self.cache.put, key, papers)
+            completed = True
+        finally:
+            stale = None
+            try:
+                if not completed and not future.done():
+                    # A leader closed or cancelled mid-feed hands joined searches the cached result, not its partial list
+                    stale = await asyncio.to_thread(self.cache.get, key)
+            finally:
+                # Joined searches are always released, even if the cache read above is cancelled
+                if not future.done():
+                    future.set_result(stale[0] if stale is not None else papers)
+                if self._inflight.get(key) is future:
+                    del self._inflight[key]
+
+    async def search_papers(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
+        """
+        Queries Arxiv and returns a list of papers.
+        """
+        return [paper async for paper in self.iter_papers(query, max_results)]
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
 
 # Global Instance
 arxiv_client = ArxivWrapper()
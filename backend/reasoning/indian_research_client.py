@@ -1,68 +1,134 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import json
 import logging
-import random
+import os
+
+import numpy as np
+
+from reasoning.mechanism_matcher import tokenize
 
 logger = logging.getLogger(__name__)
 
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'indian_research_papers.json')
+
+# BM25 parameters; titles count TITLE_WEIGHT times towards term frequency
+K1 = 1.2
+B = 0.75
+TITLE_WEIGHT = 2
+STOPWORDS = {"a", "an", "and", "for", "in", "of", "on", "the", "to", "with", "research", "india", "indian"}
+
+def terms(text: str) -> List[str]:
+    return [t for t in tokenize(text) if t not in STOPWORDS]
+
 class IndianResearchClient:
     """
-    Simulates searching Indian academic repositories.
+    Searches a local corpus of Indian academic papers.
     Prioritizes IITs, ICAR, and CSIR.
+    Papers are loaded from a JSON file into an in-memory inverted index ranked with BM25.
     """
-    
-    def search(self, query: str, limit: int = 5) -> List[Dict[str, Any]]:
-        # Mock results based on query keywords
-        results = []
-        
-        keywords = query.lower().split()
-        
-        if "cloud seeding" in query.lower():
-            results.append({
-                "title": "Aerosol-Cloud Interaction in the Indian Monsoon Region",
-                "authors": ["Pradeep Kumar", "R. S. Maheskumar"],
-                "institution": "IITM Pune - Cloud Physics Lab",
-                "year": 2023,
-                "summary": "Observational campaign (CAIPEEX) results on hygroscopic seeding efficacy.",
-                "url": "https://www.tropmet.res.in/caipeex"
-            })
-            results.append({
-                "title": "Optimization of Flare Hygroscopicity for Rain Shadow Regions",
-                "authors": ["S. K. Paul", "A. K. Kamra"],
-                "institution": "IIT Bombay",
-                "year": 2022,
-                "summary": "Study on particle size distribution for seeding over the Western Ghats shadow.",
-                "url": "https://iitb.ac.in/research"
-            })
-            
-        if "prediction" in query.lower() or "forecast" in query.lower():
-             results.append({
-                "title": "Deep Learning for Monsoon Intraseasonal Oscillations",
-                "authors": ["V. Mishra", "B. N. Goswami"],
-                "institution": "IISc Bangalore",
-                "year": 2024,
-                "summary": "LSTM-based approach to predict active/break spells 3 weeks in advance.",
-                "url": "https://iisc.ac.in"
-            })
-             
-        if "heat" in query.lower() or "roof" in query.lower():
-             results.append({
-                "title": "Thermal Performance of Low-Cost Cool Roof Coatings",
-                "authors": ["R. Garg", "P. Mathur"],
-                "institution": "IIIT Hyderabad - Building Science",
-                "year": 2023,
-                "summary": "Field test of lime-based coatings in Hyderabad low-income settlements.",
-                "url": "https://iiit.ac.in"
-            })
+
+    def __init__(self, corpus_path: str = CORPUS_PATH, papers: Optional[List[Dict[str, Any]]] = None):
+        if papers is None:
+            try:
+                with open(corpus_path, 'r') as f:
+                    papers = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.error(f"Could not load research corpus {corpus_path}: {e}")
+                papers = []
+        self.build(papers)
+
+    def build(self, papers: List[Dict[str, Any]]):
+        """(Re)builds the inverted index: term -> (doc ids, term frequencies) as NumPy arrays."""
+        self.papers = papers
+        postings: Dict[str, Dict[int, int]] = {}
+        doc_len = np.zeros(len(papers), dtype=np.float32)
+        for doc_id, paper in enumerate(papers):
+            tokens = terms(paper.get("title", "")) * TITLE_WEIGHT + terms(paper.get("summary", ""))
+            doc_len[doc_id] = len(tokens)
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        n = len(papers)
+        self.doc_len = doc_len
+        self.avg_len = float(doc_len.mean()) if n else 0.0
+        self.index = {}
+        for token, counts in postings.items():
+            ids = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+            tf = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            idf = np.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+            self.index[token] = (ids, tf, np.float32(idf))
+
+        # Filter columns
+        self.years = np.array([p.get("year") or 0 for p in papers], dtype=np.int32)
+        institutions = [p.get("institution", "") for p in papers]
+        self.institution_names = sorted(set(institutions))
+        lookup = {name: i for i, name in enumerate(self.institution_names)}
+        self.institution_ids = np.array([lookup[name] for name in institutions], dtype=np.int32)
+
+    def _filter_mask(self, institution: Optional[str], year_from: Optional[int], year_to: Optional[int]):
+        mask = np.ones(len(self.papers), dtype=bool)
+        if institution:
+            needle = institution.lower()
+            wanted = [i for i, name in enumerate(self.institution_names) if needle in name.lower()]
+            mask &= np.isin(self.institution_ids, wanted)
+        if year_from is not None:
+            mask &= self.years >= year_from
+        if year_to is not None:
+            mask &= self.years <= year_to
+        return mask
+
+    def search_page(self, query: str, limit: int = 5, offset: int = 0, institution: Optional[str] = None,
+                    year_from: Optional[int] = None, year_to: Optional[int] = None) -> Dict[str, Any]:
+        """
+        BM25-ranked page of papers matching query.
+        institution is a case-insensitive substring ("IIT" matches every IIT).
+        """
+        if limit < 0 or offset < 0:
+            raise ValueError("limit and offset must be non-negative")
+        scores = np.zeros(len(self.papers), dtype=np.float32)
+        norm = K1 * (1 - B + B * self.doc_len / (self.avg_len or 1))
+        for token in set(terms(query)):
+            posting = self.index.get(token)
+            if posting is None:
+                continue
+            ids, tf, idf = posting
+            scores[ids] += idf * tf * (K1 + 1) / (tf + norm[ids])
+
+        candidates = np.flatnonzero((scores > 0) & self._filter_mask(institution, year_from, year_to))
+        total = len(candidates)
+        end = min(offset + limit, total)
+        if end <= offset:
+            return {"total": int(total), "offset": offset, "limit": limit, "results": []}
+        if end < total:
+            # Only the first offset+limit ranks need ordering; ties at the cut are kept so
+            # the id tie-break (and therefore every page) does not depend on the page size
+            cut = np.partition(scores[candidates], total - end)[total - end]
+            candidates = candidates[scores[candidates] >= cut]
+        top = candidates[np.lexsort((candidates, -scores[candidates]))][offset:end]
+
+        return {
+            "total": int(total),
+            "offset": offset,
+            "limit": limit,
+            "results": [{**self.papers[i], "score": round(float(scores[i]), 3)} for i in top],
+        }
+
+    def generic_review(self, query: str) -> Dict[str, Any]:
+        return {
+            "title": f"Review of {query} applications in Indian Context",
+            "authors": ["A. Sharma", "K. Singh"],
+            "institution": "DST Centre of Excellence",
+            "year": 2023,
+            "summary": "Comprehensive review of technologies and policy implications.",
+            "url": "https://dst.gov.in"
+        }
+
+    def search(self, query: str, limit: int = 5, **filters) -> List[Dict[str, Any]]:
+        results = self.search_page(query, limit, **filters)["results"]
 
         # Fill with generic Indian result if empty
         if not results:
-             results.append({
-                "title": f"Review of {query} applications in Indian Context",
-                "authors": ["A. Sharma", "K. Singh"],
-                "institution": "DST Centre of Excellence",
-                "year": 2023,
-                "summary": "Comprehensive review of technologies and policy implications.",
-                "url": "https://dst.gov.in"
-            })
-
-        return results[:limit]
+            results.append(self.generic_review(query))
+
+        return results
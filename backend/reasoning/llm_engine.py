@@ -1,9 +1,45 @@
-from typing import Dict, Any, List, AsyncGenerator
+from typing import Dict, Any, List, AsyncGenerator, Optional, Tuple
 import json
 import asyncio
-from reasoning.mechanism_database import MECHANISMS
-from reasoning.policy_context import PolicyContextAnalyzer
+import hashlib
+import logging
+import os
+import time
+from dataclasses import replace
+
+import numpy as np
+from reasoning.mechanism_database import MECHANISMS, load_mechanisms
+from reasoning.mechanism_index import MechanismIndex
+from reasoning.mechanism_matcher import MechanismMatcher
+from reasoning.policy_context import PolicyContextAnalyzer, POLICY_MAPPING
 from reasoning.indian_research_client import IndianResearchClient
+from reasoning.arxiv_wrapper import ArxivWrapper, arxiv_client
+from reasoning.research_aggregator import ResearchAggregator, IndianRepositorySource, ArxivSource
+from reasoning.result_cache import ResultCache
+from models.oracle_models import AnalysisResult, Mechanism, PolicyContext, ResearchPaper
+from models.serialization import frame, ndjson
+
+logger = logging.getLogger(__name__)
+
+# Seconds to hold each progress stage on screen (presentations); 0 streams at full speed
+DEMO_PACING = float(os.getenv("ORACLE_DEMO_PACING", "0"))
+
+# Analysis cache: one entry per normalized strategy; feasibility is scored per request for the exact investment
+CACHE_SIZE = 256
+CACHE_TTL = 600.0
+KNOWLEDGE_CHECK_INTERVAL = 5.0  # Seconds between MECHANISMS/POLICY_MAPPING change checks
+
+# Adds arXiv as a live research source for stream_analysis (needs network; off by default)
+ARXIV_PAPERS = os.getenv("ORACLE_ARXIV_PAPERS", "0") == "1"
+RESEARCH_LIMIT = 5
+
+# Cosine similarity needed before vector retrieval overrides the default mechanism
+MIN_SIMILARITY = 0.15
+
+ERROR_FRAME = frame(status="error", message="Internal server error during simulation.")
+
+def normalize_strategy(user_input: str) -> str:
+    return " ".join(user_input.lower().split())
 
 class OracleEngine:
     """
@@ -11,9 +47,18 @@ class OracleEngine:
     Connects Strategy -> Mechanism -> Policy + Research + Economics.
     """
     
-    def __init__(self):
+    def __init__(self, demo_pacing: Optional[float] = None, cache_size: int = CACHE_SIZE, cache_ttl: float = CACHE_TTL,
+                 arxiv: Optional[ArxivWrapper] = None):
+        self.demo_pacing = DEMO_PACING if demo_pacing is None else demo_pacing
+        self.arxiv = arxiv
+        self.cache = ResultCache(cache_size, cache_ttl)
+        self._knowledge_checked = float("-inf")
         self.policy_analyzer = PolicyContextAnalyzer()
         self.research_client = IndianResearchClient()
+        sources = [IndianRepositorySource(self.research_client)]
+        if arxiv is not None:
+            sources.append(ArxivSource(arxiv))
+        self.research = ResearchAggregator(sources)
         
         # Keyword triggers for India-specific mechanisms
         self.triggers = {
@@ -22,103 +67,265 @@ class OracleEngine:
             "Agricultural_Adaptation_Systems": ["crop", "seed", "drought", "resistant", "insurance", "farmer", "yield"],
             "Urban_Heat_Mitigation": ["heat", "cool", "roof", "coating", "urban", "city", "temperature", "delhi"]
         }
+        self.matcher = MechanismMatcher(self.triggers)
+        self.index = MechanismIndex(MECHANISMS)
+        self.mechanisms = load_mechanisms(MECHANISMS)
+
+    def detect_mechanism(self, user_input: str) -> Tuple[str, Mechanism]:
+        """Keyword match, then vector retrieval for paraphrases -> (mechanism key, Mechanism)."""
+        detected_key = self.matcher.best(user_input)
+        if detected_key is None:
+            matches = self.index.search(user_input, k=1)
+            if matches and matches[0][1] >= MIN_SIMILARITY:
+                detected_key = matches[0][0]
+            else:
+                detected_key = "Monsoon_Cloud_Seeding" # Fallback
+        return detected_key, self.mechanism(detected_key)
 
-    def analyze_strategy(self, user_input: str, investment_inr: float = 0) -> Dict[str, Any]:
+    def mechanism(self, key: str) -> Mechanism:
+        return self.mechanisms.get(key) or self.mechanisms["Monsoon_Cloud_Seeding"]
+
+    def research_query(self, mechanism: Mechanism) -> str:
+        # We construct a query based on the mechanism name + "India"
+        return f"{mechanism.name} research India"
+
+    def _knowledge_fingerprint(self) -> str:
+        payload = json.dumps([MECHANISMS, POLICY_MAPPING, self.triggers], sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def cache_key(self, user_input: str) -> str:
+        """
+        Normalized strategy.
+        Also drops cached results once MECHANISMS/POLICY_MAPPING change (checked every few seconds).
+        """
+        now = time.monotonic()
+        if now - self._knowledge_checked >= KNOWLEDGE_CHECK_INTERVAL:
+            self._knowledge_checked = now
+            fingerprint = self._knowledge_fingerprint()
+            if self.cache.version is not None and fingerprint != self.cache.version:
+                self._reload_knowledge()
+            self.cache.validate(fingerprint)
+        return normalize_strategy(user_input)
+
+    def invalidate_cache(self):
+        """Call after editing MECHANISMS/POLICY_MAPPING/triggers to drop results immediately."""
+        self._knowledge_checked = float("-inf")
+        self._reload_knowledge()
+        self.cache.invalidate()
+
+    def _reload_knowledge(self):
+        """Rebuilds matcher, index and the validated Mechanism/PolicyContext tables from the source dicts."""
+        self.matcher = MechanismMatcher(self.triggers)
+        self.index.update(MECHANISMS)
+        self.mechanisms = load_mechanisms(MECHANISMS)
+        self.policy_analyzer.reload()
+
+    def analyze_strategy(self, user_input: str, investment_inr: float = 0) -> AnalysisResult:
         """
         Deconstructs the user's strategy and enriches it with:
         1. Mechanism Details (Ground Truth)
         2. Policy Alignment (Ministries)
-        3. Active Research (Indian Inst)
+        3. Active Research (Indian Inst; live sources such as arXiv are only queried by stream_analysis)
+        The investment-independent parts are cached per normalized strategy and
+        shared, hence immutable; feasibility is scored for investment_inr on every call.
         """
-        user_input_lower = user_input.lower()
-        
+        key = self.cache_key(user_input)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._for_investment(*cached, investment_inr)
+
         # 1. Mechanism Detection
-        detected_key = "Monsoon_Cloud_Seeding" # Fallback
-        max_matches = 0
-        
-        for key, keywords in self.triggers.items():
-            matches = sum(1 for k in keywords if k in user_input_lower)
-            if matches > max_matches:
-                max_matches = matches
-                detected_key = key
-                
+        detected_key, mechanism_data = self.detect_mechanism(key)
+
         # 2. Fetch Data
-        mechanism_data = MECHANISMS.get(detected_key, MECHANISMS["Monsoon_Cloud_Seeding"])
         policy_data = self.policy_analyzer.get_analysis(detected_key)
         
         # 3. Dynamic Research Query
-        # We construct a query based on the mechanism name + "India"
-        search_query = f"{mechanism_data['name']} research India"
-        research_papers = self.research_client.search(search_query)
+        start = time.perf_counter()
+        research_papers = self.research_client.search(self.research_query(mechanism_data), RESEARCH_LIMIT)
+        research_sources = {IndianRepositorySource.name: {
+            "status": "ok", "latency_ms": round((time.perf_counter() - start) * 1000, 1), "count": len(research_papers)}}
 
         # 4. Construct Response
-        return {
-            "mechanism": mechanism_data["name"],
-            "description": mechanism_data["description"],
-            "feasibility_score": self._calculate_feasibility(mechanism_data, policy_data, investment_inr),
-            
-            "bottleneck": {
-                "current_capability": mechanism_data["current_capability"],
-                "required_capability": mechanism_data["required_capability_base"],
-                "gap_ratio": mechanism_data["gap_ratio"],
-                "description": f"Gap of {mechanism_data['gap_ratio']}x between current pilots and required scale."
-            },
-            
-            "research_vectors": [
-                {
-                    "focus": focus,
-                    "institutions": mechanism_data["indian_institutions"]
-                } for focus in mechanism_data["research_focus"]
-            ],
-            "active_papers": research_papers,
-            
-            "economic_context": mechanism_data["economic_context"],
-            "policy_context": policy_data
-        }
+        result = self._build_response(mechanism_data, policy_data, research_papers, research_sources, investment_inr)
+        self.cache.put(key, (mechanism_data, result))
+        return result
+
+    def _for_investment(self, mechanism: Mechanism, result: AnalysisResult, investment_inr: float) -> AnalysisResult:
+        """A cached result rescored for this request's investment (the same object if the score is unchanged)."""
+        score = self._calculate_feasibility(mechanism, result.policy_context, investment_inr)
+        return result if score == result.feasibility_score else replace(result, feasibility_score=score)
+
+    def _build_response(self, mechanism: Mechanism, policy: PolicyContext, research_papers: List[Dict[str, Any]],
+                        research_sources: Dict[str, Dict[str, Any]], investment_inr: float) -> AnalysisResult:
+        # Bottleneck, research vectors, economics and policy are the shared load-time objects
+        return AnalysisResult(
+            mechanism=mechanism.name,
+            description=mechanism.description,
+            feasibility_score=self._calculate_feasibility(mechanism, policy, investment_inr),
+            bottleneck=mechanism.bottleneck,
+            research_vectors=mechanism.research_vectors,
+            active_papers=tuple(ResearchPaper.from_dict(p) for p in research_papers),
+            research_sources=research_sources,
+            economic_context=mechanism.economic_context,
+            policy_context=policy,
+        )
 
-    def _calculate_feasibility(self, mech_data, policy_data, investment):
+    def _calculate_feasibility(self, mechanism: Mechanism, policy: PolicyContext, investment):
+        """
+        Feasibility for one investment (returns a float) or a whole grid
+        (array in, array out) in a single vectorized pass.
+        """
         # Simple heuristic: 
         # Base (Gap) + Policy Support + Investment Factor
-        base = 1.0 / mech_data["gap_ratio"] # Lower gap = Higher feasibility
-        policy = policy_data["political_feasibility_score"]
+        base = 1.0 / mechanism.gap_ratio # Lower gap = Higher feasibility
+        support = policy.political_feasibility_score
         
         # Investment saturation (diminishing returns)
         # Assuming typical project cost ~50 Cr
-        funding_adequacy = min(1.0, investment / (mech_data["economic_context"]["cost_per_unit_inr"] or 1))
+        investment = np.asarray(investment, dtype=np.float64)
+        funding_adequacy = np.minimum(1.0, investment / (mechanism.economic_context.cost_per_unit_inr or 1))
         
-        score = (base * 0.4) + (policy * 0.4) + (funding_adequacy * 0.2)
-        return round(min(0.99, max(0.1, score)), 2)
+        score = (base * 0.4) + (support * 0.4) + (funding_adequacy * 0.2)
+        score = np.round(np.clip(score, 0.1, 0.99), 2)
+        return float(score) if score.ndim == 0 else score
 
-    async def stream_analysis(self, user_input: str, investment_inr: float = 0) -> AsyncGenerator[str, None]:
+    def analyze_batch(self, strategies: List[str], investments_inr: List[float]) -> Dict[str, Any]:
         """
-        Streaming wrapper for the analysis.
-        Yields progress updates -> Final Oracle Analysis.
+        Feasibility matrix for every (strategy, investment) pair, for scenario sweeps.
+        Mechanism detection and policy lookup run once per unique strategy / mechanism;
+        each mechanism's investment grid is scored in one vectorized pass.
+        Research papers are not fetched (use analyze_strategy for the full report).
+        Investments are scored as given.
         """
-        # 1. Parsing User Input
-        yield json.dumps({"status": "progress", "progress": 10, "message": "Parsing tactical input..."}) + "\n"
-        await asyncio.sleep(0.5)
-        
-        # 2. Scanning Database
-        yield json.dumps({"status": "progress", "progress": 30, "message": "Querying Mechanism Database..."}) + "\n"
-        await asyncio.sleep(0.5)
-        
-        # 3. Policy Check
-        yield json.dumps({"status": "progress", "progress": 60, "message": "Aligning with MoES Policy..."}) + "\n"
-        await asyncio.sleep(0.5)
-        
-        # 4. Perform Logic
-        analysis_result = self.analyze_strategy(user_input, investment_inr)
-        
-        yield json.dumps({"status": "progress", "progress": 85, "message": "Fetching Research Vectors..."}) + "\n"
-        await asyncio.sleep(0.5)
-        
-        # 5. Final Result
-        yield json.dumps({
+        investments = np.array([v or 0 for v in investments_inr], dtype=np.float64)
+
+        detected = {}
+        for strategy in dict.fromkeys(normalize_strategy(s) for s in strategies):
+            detected[strategy] = self.detect_mechanism(strategy)[0]
+
+        rows = {}
+        for key in set(detected.values()):
+            rows[key] = self._calculate_feasibility(self.mechanism(key), self.policy_analyzer.get_analysis(key), investments)
+
+        mechanism_keys = [detected[normalize_strategy(s)] for s in strategies]
+        return {
+            "strategies": list(strategies),
+            "investments_inr": investments.tolist(),
+            "mechanisms": mechanism_keys,
+            "mechanism_names": {key: self.mechanism(key).name for key in rows},
+            "feasibility": np.stack([rows[key] for key in mechanism_keys]).tolist() if strategies else [],
+        }
+
+    def stream_batch(self, strategies: List[str], investments_inr: List[float]):
+        """analyze_batch as NDJSON: one row per strategy."""
+        batch = self.analyze_batch(strategies, investments_inr)
+        yield ndjson({"status": "batch", "investments_inr": batch["investments_inr"]})
+        for strategy, key, row in zip(batch["strategies"], batch["mechanisms"], batch["feasibility"]):
+            yield ndjson({"strategy": strategy, "mechanism": key, "feasibility": row})
+
+    def _progress(self, progress: int, message: str, stage: str) -> bytes:
+        # Few distinct (progress, message, stage) combinations exist, so frames are encoded once
+        return frame(status="progress", progress=progress, message=message, stage=stage)
+
+    def _final(self, analysis_result: AnalysisResult, cached: bool) -> bytes:
+        return ndjson({
             "status": "oracle_analysis",
             "progress": 100,
             "message": "Analysis Complete",
+            "cached": cached,
             "data": analysis_result
-        }) + "\n"
+        })
+
+    async def _pump_research(self, query: str, queue: asyncio.Queue):
+        """Feeds research aggregator events into queue; None marks the end."""
+        try:
+            async for event in self.research.stream(query, RESEARCH_LIMIT):
+                await queue.put(event)
+        finally:
+            queue.put_nowait(None)
+
+    async def _pace(self):
+        if self.demo_pacing > 0:
+            await asyncio.sleep(self.demo_pacing)
+
+    async def stream_analysis(self, user_input: str, investment_inr: float = 0) -> AsyncGenerator[bytes, None]:
+        """
+        Streaming wrapper for the analysis.
+        Each progress event is emitted when its pipeline stage actually finishes:
+        mechanism detection -> policy lookup + research fetch (concurrent, off the event loop) -> scoring.
+        With an arXiv client, a "paper" event is sent for each result as it downloads, alongside the stages.
+        A cached result skips straight to the final event.
+        """
+        pending = set()
+        try:
+            key = self.cache_key(user_input)
+            cached = self.cache.get(key)
+            if cached is not None:
+                yield self._final(self._for_investment(*cached, investment_inr), cached=True)
+                return
+
+            # 1. Mechanism Detection
+            detected_key, mechanism_data = self.detect_mechanism(key)
+            yield self._progress(30, f"Mechanism identified: {mechanism_data.name}", "mechanism_detection")
+            await self._pace()
+
+            # 2 + 3. Policy check and research fan-out are independent
+            query = self.research_query(mechanism_data)
+            policy_task = asyncio.create_task(asyncio.to_thread(self.policy_analyzer.get_analysis, detected_key))
+            research_events: asyncio.Queue = asyncio.Queue()
+            next_research = asyncio.create_task(research_events.get())
+            pump_task = asyncio.create_task(self._pump_research(query, research_events))
+            pending = {policy_task, next_research, pump_task}
+            research = None
+            progress = 30
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task is pump_task:
+                        if task.exception() is not None:
+                            # Scoring goes ahead with whatever research arrived (or the generic review)
+                            logger.warning(f"Research fan-out failed: {task.exception()!r}")
+                    elif task is policy_task:
+                        progress += 25
+                        yield self._progress(progress, "Aligned with MoES Policy", "policy_lookup")
+                        await self._pace()
+                    elif task is next_research:
+                        event = task.result()
+                        if event is None:
+                            continue
+                        next_research = asyncio.create_task(research_events.get())
+                        pending.add(next_research)
+                        research = event
+                        if event["type"] == "ready":
+                            progress += 25
+                            answered = sum(1 for s in event["sources"].values() if s["status"] == "ok")
+                            yield self._progress(progress, f"Fetched {len(event['papers'])} research papers "
+                                                           f"from {answered}/{len(event['sources'])} sources", "research_fetch")
+                            await self._pace()
+                        else:
+                            # Late sources stream their papers in before the final result
+                            for paper in event["new"]:
+                                yield ndjson({"status": "paper", "progress": progress, "message": paper["title"],
+                                              "source": event["source"], "data": paper})
+
+            # 4. Scoring
+            if research is None:
+                research = {"papers": [], "sources": {source.name: {"status": "error", "latency_ms": None, "count": 0}
+                                                      for source in self.research.sources}}
+            papers = research["papers"] or [self.research_client.generic_review(query)]
+            analysis_result = self._build_response(mechanism_data, policy_task.result(), papers, research["sources"],
+                                                   investment_inr)
+            self.cache.put(key, (mechanism_data, analysis_result))
+
+            # 5. Final Result
+            yield self._final(analysis_result, cached=False)
+        except Exception as e:
+            logger.exception(f"Streaming analysis failed: {e}")
+            yield ERROR_FRAME
+        finally:
+            for task in pending:
+                task.cancel()
 
 # Global Instance
-llm_engine = OracleEngine()
+llm_engine = OracleEngine(arxiv=arxiv_client if ARXIV_PAPERS else None)
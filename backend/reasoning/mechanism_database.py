@@ -2,6 +2,9 @@
 Database of India-specific Climate Intervention Mechanisms.
 Source: Indian Institute of Tropical Meteorology (IITM), ICAR, and Ministry of Earth Sciences reports.
 """
+from typing import Any, Dict, Mapping
+
+from models.oracle_models import Mechanism
 
 MECHANISMS = {
     "Monsoon_Cloud_Seeding": {
@@ -96,3 +99,7 @@ MECHANISMS = {
         }
     }
 }
+
+def load_mechanisms(mechanisms: Mapping[str, Mapping[str, Any]] = MECHANISMS) -> Dict[str, Mechanism]:
+    """Validated, immutable Mechanism per key (raises ValueError on a malformed entry)."""
+    return {key: Mechanism.from_dict(key, data) for key, data in mechanisms.items()}
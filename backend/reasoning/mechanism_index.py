@@ -0,0 +1,126 @@
+"""
+Offline vector retrieval over the mechanism catalog.
+
+Each mechanism's name, description and research_focus are turned into hashed
+features (stemmed words plus character trigrams, so paraphrases and inflections
+still overlap), weighted by TF-IDF and L2-normalized into one NumPy matrix.
+A query is ranked against every mechanism with a single matrix-vector product.
+Hashing keeps the feature space fixed, so adding or editing a mechanism only
+re-vectorizes that row; IDF is recomputed from the document-frequency vector.
+"""
+import hashlib
+import zlib
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from reasoning.mechanism_matcher import tokenize
+
+DIM = 1 << 12
+NGRAM = 3
+
+
+def mechanism_text(mechanism: Dict[str, Any]) -> str:
+    return " ".join([mechanism.get("name", ""), mechanism.get("description", ""),
+                     *mechanism.get("research_focus", [])])
+
+
+def hashed_features(text: str, dim: int = DIM) -> np.ndarray:
+    """Sublinear term counts of word stems and in-word character trigrams, hashed into dim buckets."""
+    counts = np.zeros(dim, dtype=np.float32)
+    for token in tokenize(text):
+        counts[zlib.crc32(b"w:" + token.encode()) % dim] += 1
+        padded = f" {token} "
+        for i in range(len(padded) - NGRAM + 1):
+            counts[zlib.crc32(padded[i:i + NGRAM].encode()) % dim] += 1
+    nz = counts > 0
+    counts[nz] = 1 + np.log(counts[nz])
+    return counts
+
+
+class MechanismIndex:
+    """TF-IDF matrix over the mechanism catalog; rows follow self.keys."""
+
+    def __init__(self, mechanisms: Optional[Dict[str, Dict[str, Any]]] = None, dim: int = DIM):
+        self.dim = dim
+        self.keys: List[str] = []
+        self.tf = np.zeros((0, dim), dtype=np.float32)
+        self.df = np.zeros(dim, dtype=np.float32)
+        self._digests: Dict[str, str] = {}
+        self._matrix: Optional[np.ndarray] = None
+        if mechanisms:
+            self.update(mechanisms)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def update(self, mechanisms: Dict[str, Dict[str, Any]]) -> int:
+        """
+        Syncs the index with the catalog: vectorizes new or edited mechanisms and drops removed ones.
+        Returns the number of rows (re)vectorized.
+        """
+        removed = [k for k in self.keys if k not in mechanisms]
+        if removed:
+            keep = np.array([k in mechanisms for k in self.keys])
+            self.df -= (self.tf[~keep] > 0).sum(axis=0)
+            self.tf = self.tf[keep]
+            self.keys = [k for k in self.keys if k in mechanisms]
+            for k in removed:
+                del self._digests[k]
+
+        rows = {k: i for i, k in enumerate(self.keys)}
+        changed = 0
+        new_rows = []
+        for key, mechanism in mechanisms.items():
+            text = mechanism_text(mechanism)
+            digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+            if self._digests.get(key) == digest:
+                continue
+            self._digests[key] = digest
+            vector = hashed_features(text, self.dim)
+            self.df += vector > 0
+            changed += 1
+            if key in rows:
+                self.df -= self.tf[rows[key]] > 0
+                self.tf[rows[key]] = vector
+            else:
+                self.keys.append(key)
+                new_rows.append(vector)
+
+        if new_rows:
+            self.tf = np.vstack([self.tf, np.stack(new_rows)])
+        if changed or removed:
+            self._matrix = None
+        return changed
+
+    def idf(self) -> np.ndarray:
+        return np.log((1 + len(self.keys)) / (1 + self.df)) + 1
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """L2-normalized TF-IDF rows, rebuilt lazily after updates."""
+        if self._matrix is None:
+            weighted = self.tf * self.idf()
+            norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+            self._matrix = weighted / np.maximum(norms, 1e-12)
+        return self._matrix
+
+    def scores(self, query: str) -> np.ndarray:
+        """Cosine similarity of the query to every mechanism."""
+        if not self.keys:
+            return np.zeros(0, dtype=np.float32)
+        q = hashed_features(query, self.dim) * self.idf()
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return np.zeros(len(self.keys), dtype=np.float32)
+        return self.matrix @ (q / norm)
+
+    def search(self, query: str, k: int = 3) -> List[Tuple[str, float]]:
+        """Top-k (mechanism key, cosine score), best first."""
+        scores = self.scores(query)
+        if len(scores) == 0:
+            return []
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(self.keys[i], round(float(scores[i]), 4)) for i in top]
@@ -0,0 +1,88 @@
+"""
+Single-pass keyword matcher for mechanism detection.
+
+Trigger phrases are tokenized and stemmed once into a table keyed by their first
+stem. Matching tokenizes the input (word boundaries only, so "seed" no longer hits
+"exceed"), stems it the same way and walks the tokens once, looking up the phrases
+that can start at each position. Each phrase counts once per input and is
+weighted 1/(number of mechanisms sharing it), so generic words like "drought" do
+not outvote a mechanism-specific match.
+"""
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+TOKEN = re.compile(r"[a-z0-9]+")
+
+# Longest suffix first; a stem keeps at least 3 characters
+SUFFIXES = [
+    ("ations", ""), ("ation", ""), ("ions", ""), ("ion", ""), ("ings", ""), ("ing", ""), ("ies", "y"),
+    ("ers", ""), ("er", ""), ("ed", ""), ("es", ""), ("s", ""),
+]
+
+
+@lru_cache(maxsize=65536)
+def stem(word: str) -> str:
+    for suffix, replacement in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[: -len(suffix)] + replacement
+            break
+    # Fold doubled finals so "planned" and "plan" meet
+    if len(word) > 3 and word[-1] == word[-2] and word[-1] not in "ls":
+        word = word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    return [stem(t) for t in TOKEN.findall(text.lower())]
+
+
+class MechanismMatcher:
+    """Built once from {mechanism_key: [trigger phrases]}; scores every mechanism in one pass."""
+
+    def __init__(self, triggers: Dict[str, List[str]]):
+        self.keys = list(triggers)
+        owners: Dict[Tuple[str, ...], set] = defaultdict(set)
+        for i, phrases in enumerate(triggers.values()):
+            for phrase in phrases:
+                tokens = tuple(tokenize(phrase))
+                if tokens:
+                    owners[tokens].add(i)
+
+        # phrase -> (mechanism indices, weights); phrases grouped by first stem
+        self.phrase_ids: Dict[Tuple[str, ...], int] = {}
+        self.phrase_owners: List[np.ndarray] = []
+        self.phrase_weights: List[float] = []
+        self.by_first: Dict[str, List[Tuple[Tuple[str, ...], int]]] = defaultdict(list)
+        for tokens, mechanisms in owners.items():
+            pid = len(self.phrase_owners)
+            self.phrase_ids[tokens] = pid
+            self.phrase_owners.append(np.array(sorted(mechanisms), dtype=np.int64))
+            self.phrase_weights.append(1.0 / len(mechanisms))
+            self.by_first[tokens[0]].append((tokens, pid))
+
+    def matched_phrases(self, text: str) -> set:
+        tokens = tokenize(text)
+        found = set()
+        for pos, token in enumerate(tokens):
+            for phrase, pid in self.by_first.get(token, ()):
+                if len(phrase) == 1 or tuple(tokens[pos:pos + len(phrase)]) == phrase:
+                    found.add(pid)
+        return found
+
+    def scores(self, text: str) -> np.ndarray:
+        """Weighted score per mechanism, in self.keys order."""
+        scores = np.zeros(len(self.keys))
+        for pid in self.matched_phrases(text):
+            scores[self.phrase_owners[pid]] += self.phrase_weights[pid]
+        return scores
+
+    def best(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """Highest scoring mechanism (earliest on ties), or default when nothing matches."""
+        scores = self.scores(text)
+        if not len(scores) or scores.max() <= 0:
+            return default
+        return self.keys[int(np.argmax(scores))]
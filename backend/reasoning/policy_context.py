@@ -1,6 +1,9 @@
 """
 Maps interventions to Indian Government Policies and Ministries.
 """
+from typing import Any, Dict, Mapping
+
+from models.oracle_models import PolicyContext
 
 POLICY_MAPPING = {
     "Monsoon_Cloud_Seeding": {
@@ -41,11 +44,24 @@ POLICY_MAPPING = {
     }
 }
 
+DEFAULT_POLICY = PolicyContext(
+    relevant_ministries=("NITI Aayog",),
+    existing_programs=("Unknown",),
+    political_feasibility_score=0.5,
+    alignment_notes="Requires further policy analysis."
+)
+
 class PolicyContextAnalyzer:
-    def get_analysis(self, mechanism_key: str):
-        return POLICY_MAPPING.get(mechanism_key, {
-            "relevant_ministries": ["NITI Aayog"],
-            "existing_programs": ["Unknown"],
-            "political_feasibility_score": 0.5,
-            "alignment_notes": "Requires further policy analysis."
-        })
+    """Typed view of a policy mapping, validated when loaded; call reload() after editing the mapping."""
+
+    def __init__(self, mapping: Mapping[str, Mapping[str, Any]] = POLICY_MAPPING):
+        self.mapping = mapping
+        self.reload()
+
+    def reload(self):
+        self.policies: Dict[str, PolicyContext] = {
+            key: PolicyContext.from_dict(data, f"policy '{key}'") for key, data in self.mapping.items()
+        }
+
+    def get_analysis(self, mechanism_key: str) -> PolicyContext:
+        return self.policies.get(mechanism_key, DEFAULT_POLICY)
@@ -0,0 +1,182 @@
+"""
+Fan-out research search across every configured source.
+
+All sources are queried concurrently, each under its own deadline. stream()
+first yields whatever arrived within the latency budget, then one "paper"
+event whenever a still-running source delivers more papers and one "late"
+event per source that finishes afterwards. Papers are deduplicated by DOI or
+normalized title and ranked by reciprocal rank fusion across sources.
+"""
+import asyncio
+import re
+from contextlib import aclosing
+from typing import Dict, Any, AsyncIterator, List, Optional
+
+from reasoning.arxiv_wrapper import ArxivWrapper
+from reasoning.indian_research_client import IndianResearchClient
+
+RESEARCH_BUDGET = 0.5  # Seconds before the ready set is returned
+RRF_K = 60             # Reciprocal rank fusion damping
+
+class ResearchSource:
+    name = "source"
+    deadline = 2.0
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def stream(self, query: str, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Papers as they arrive, within the source's deadline (asyncio.TimeoutError
+        past it). By default the whole search() result at once; sources that can
+        deliver incrementally override this.
+        """
+        for paper in await asyncio.wait_for(self.search(query, limit), self.deadline):
+            yield paper
+
+class IndianRepositorySource(ResearchSource):
+    """Local BM25 corpus (IndianResearchClient), searched in a worker thread."""
+
+    name = "indian_repositories"
+
+    def __init__(self, client: IndianResearchClient, deadline: float = 1.0):
+        self.client = client
+        self.deadline = deadline
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        page = await asyncio.to_thread(self.client.search_page, query, limit)
+        return page["results"]
+
+class ArxivSource(ResearchSource):
+    """
+    arXiv feed, streamed entry by entry. The deadline is the wrapper's own
+    timeout rather than an outer cancellation, so a slow upstream still falls
+    back to the wrapper's stale cache.
+    """
+
+    name = "arxiv"
+
+    def __init__(self, client: ArxivWrapper, deadline: float = 5.0):
+        self.client = client
+        self.deadline = deadline
+
+    async def search(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        return [paper async for paper in self.stream(query, limit)]
+
+    async def stream(self, query: str, limit: int) -> AsyncIterator[Dict[str, Any]]:
+        async with aclosing(self.client.iter_papers(query, limit, timeout=self.deadline)) as papers:
+            async for paper in papers:
+                yield paper
+
+def paper_key(paper: Dict[str, Any]) -> str:
+    doi = paper.get("doi")
+    if doi:
+        return "doi:" + doi.strip().lower()
+    return "title:" + " ".join(re.findall(r"[a-z0-9]+", paper.get("title", "").lower()))
+
+def fuse(results: Dict[str, List[Dict[str, Any]]], limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Deduplicated papers ranked by the sum of 1/(RRF_K + rank) over the sources that returned them."""
+    merged: Dict[str, Dict[str, Any]] = {}
+    scores: Dict[str, float] = {}
+    for source, papers in results.items():
+        for rank, paper in enumerate(papers):
+            key = paper_key(paper)
+            if key not in merged:
+                merged[key] = {**paper, "sources": []}
+                scores[key] = 0.0
+            merged[key]["sources"].append(source)
+            scores[key] += 1.0 / (RRF_K + rank + 1)
+    ranked = sorted(merged, key=lambda k: -scores[k])  # stable: ties keep first-seen order
+    return [merged[k] for k in ranked[:limit]]
+
+class ResearchAggregator:
+    def __init__(self, sources: List[ResearchSource], budget: float = RESEARCH_BUDGET):
+        self.sources = sources
+        self.budget = budget
+
+    async def stream(self, query: str, limit: int = 5) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yields {"type": "ready", ...} once the budget elapses (or every source has
+        answered), then {"type": "paper", "source": ...} whenever a running source
+        streams in papers not sent before and {"type": "late", "source": ...} as
+        each straggler finishes. Every event carries the merged top papers, the
+        papers not sent before ("new", restricted to the event's source after
+        "ready") and per-source status/latency.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        stats = {s.name: {"status": "pending", "latency_ms": None, "count": 0} for s in self.sources}
+        results: Dict[str, List[Dict[str, Any]]] = {s.name: [] for s in self.sources}
+        updates: asyncio.Queue = asyncio.Queue()  # (source name, finished)
+
+        async def collect(source: ResearchSource):
+            entry = stats[source.name]
+            try:
+                async with aclosing(source.stream(query, limit)) as papers:
+                    async for paper in papers:
+                        results[source.name].append(paper)
+                        entry["count"] += 1
+                        updates.put_nowait((source.name, False))
+                entry["status"] = "ok"
+            except asyncio.CancelledError:
+                entry["status"] = "cancelled"
+                raise
+            except asyncio.TimeoutError:
+                entry["status"] = "timeout"
+            except Exception:
+                entry["status"] = "error"
+            finally:
+                entry["latency_ms"] = round((loop.time() - start) * 1000, 1)
+            updates.put_nowait((source.name, True))
+
+        def running() -> bool:
+            return any(s["status"] == "pending" for s in stats.values())
+
+        sent = set()
+
+        def event(kind: str, source: Optional[str] = None, **extra) -> Dict[str, Any]:
+            papers = fuse(results, limit)
+            new = [p for p in fuse(results)
+                   if paper_key(p) not in sent and (source is None or source in p["sources"])]
+            sent.update(paper_key(p) for p in new)
+            if source is not None:
+                extra["source"] = source
+            return {"type": kind, "papers": papers, "new": new,
+                    "sources": {name: dict(s) for name, s in stats.items()}, **extra}
+
+        tasks = [asyncio.create_task(collect(source)) for source in self.sources]
+        try:
+            deadline = start + self.budget
+            while running() and loop.time() < deadline:
+                try:
+                    await asyncio.wait_for(updates.get(), deadline - loop.time())
+                except asyncio.TimeoutError:
+                    break
+            # Anything queued so far is covered by the ready event
+            while not updates.empty():
+                updates.get_nowait()
+            yield event("ready", complete=not running())
+
+            while running() or not updates.empty():
+                batch = [await updates.get()]
+                while not updates.empty():
+                    batch.append(updates.get_nowait())
+                # One event per source per wake-up: a batch source's papers and completion arrive together
+                for name in dict.fromkeys(name for name, _ in batch):
+                    if any(finished for n, finished in batch if n == name):
+                        yield event("late", name, complete=not running())
+                    else:
+                        update = event("paper", name, complete=False)
+                        if update["new"]:
+                            yield update
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def gather(self, query: str, limit: int = 5) -> Dict[str, Any]:
+        """Merged results available within the budget; stragglers are cancelled."""
+        events = self.stream(query, limit)
+        try:
+            return await events.__anext__()
+        finally:
+            await events.aclose()
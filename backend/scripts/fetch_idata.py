@@ -1,37 +1,212 @@
+import argparse
+import hashlib
+import json
 import os
+import time
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# IBTrACS URL (North Atlantic Subset for performance)
-# Provides data updated regularly by NOAA
-DATA_URL = "https://www.ncei.noaa.gov/data/international-best-track-archive-for-climate-stewardship-ibtracs/v04r00/access/csv/ibtracs.NA.list.v04r00.csv"
+# IBTrACS per-basin CSV exports, updated regularly by NOAA
+# North Atlantic is the default subset for performance
+BASE_URL = "https://www.ncei.noaa.gov/data/international-best-track-archive-for-climate-stewardship-ibtracs/v04r00/access/csv"
+BASINS = ["NA", "SA", "EP", "WP", "SP", "SI", "NI"]
+DATA_URL = f"{BASE_URL}/ibtracs.NA.list.v04r00.csv"
 
 OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'raw')
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'ibtracs_NA.csv')
 
-def fetch_data():
-    """Downloads the IBTrACS CSV file."""
-    if not os.path.exists(OUTPUT_DIR):
-        os.makedirs(OUTPUT_DIR)
-        
-    logger.info(f"Downloading data from {DATA_URL}...")
-    
+CHUNK_SIZE = 1 << 20  # 1 MB reads
+TIMEOUT = 30          # Seconds per connect/read
+
+# Sidecar files next to the output:
+#   <file>.meta.json  validators + sha256 of the completed download (conditional GET)
+#   <file>.part       bytes downloaded so far (single stream)
+#   <file>.part.N     bytes downloaded so far for range segment N
+#   <file>.part.json  validators the partial bytes belong to (resume)
+META_SUFFIX = '.meta.json'
+PART_SUFFIX = '.part'
+
+def basin_url(basin: str) -> str:
+    return f"{BASE_URL}/ibtracs.{basin}.list.v04r00.csv"
+
+def basin_output_file(basin: str) -> str:
+    return os.path.join(OUTPUT_DIR, f'ibtracs_{basin}.csv')
+
+def _read_json(path: str) -> dict:
     try:
-        response = requests.get(DATA_URL, stream=True)
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_json(path: str, data: dict):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+def _remove(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def _validators(response) -> dict:
+    length = response.headers.get('Content-Length')
+    return {
+        "etag": response.headers.get('ETag'),
+        "last_modified": response.headers.get('Last-Modified'),
+        "size": int(length) if length is not None else None,
+        "accept_ranges": response.headers.get('Accept-Ranges', '').lower() == 'bytes',
+    }
+
+def _download_range(session, url, part_path, start=0, end=None, if_range=None):
+    """
+    Downloads bytes [start, end] of url into part_path, resuming from whatever it holds.
+    end=None means "to EOF". Returns the number of bytes fetched.
+    """
+    have = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if end is not None and have >= end - start + 1:
+        return 0
+
+    headers = {}
+    if start + have > 0 or end is not None:
+        headers['Range'] = f"bytes={start + have}-{'' if end is None else end}"
+        if if_range:
+            headers['If-Range'] = if_range
+
+    fetched = 0
+    with session.get(url, headers=headers, stream=True, timeout=TIMEOUT) as response:
         response.raise_for_status()
-        
-        with open(OUTPUT_FILE, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
+        if 'Range' in headers and response.status_code != 206:
+            if end is not None:
+                raise IOError(f"Server ignored range request for segment starting at {start}")
+            # Full body returned (no range support or the file changed): start over
+            mode = 'wb'
+        else:
+            mode = 'ab'
+
+        with open(part_path, mode) as f:
+            for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
                 f.write(chunk)
-                
-        logger.info(f"Download complete: {OUTPUT_FILE}")
-        
+                fetched += len(chunk)
+    return fetched
+
+def _segment_bounds(size: int, segments: int):
+    step = -(-size // segments)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+def _sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def fetch_data(url: str = DATA_URL, output_file: str = OUTPUT_FILE, segments: int = 1, force: bool = False) -> str:
+    """
+    Downloads the IBTrACS CSV file.
+    - Skips the transfer when the server's ETag/Last-Modified match the last download.
+    - Resumes interrupted downloads with HTTP Range requests.
+    - segments > 1 fetches that many byte ranges in parallel when the server supports it.
+    - Writes to <file>.part and renames into place only after the size check passes.
+    Returns "not_modified", "downloaded" or "failed".
+    """
+    output_dir = os.path.dirname(output_file) or '.'
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    meta_path = output_file + META_SUFFIX
+    part_path = output_file + PART_SUFFIX
+    part_state_path = part_path + '.json'
+
+    try:
+        session = requests.Session()
+        meta = {} if force or not os.path.exists(output_file) else _read_json(meta_path)
+
+        conditional = {}
+        if meta.get('etag'):
+            conditional['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            conditional['If-Modified-Since'] = meta['last_modified']
+
+        probe = session.head(url, headers=conditional, allow_redirects=True, timeout=TIMEOUT)
+        if probe.status_code == 304:
+            logger.info(f"Not modified since last download, skipping: {output_file}")
+            return "not_modified"
+        probe.raise_for_status()
+        remote = _validators(probe)
+        if meta and remote["etag"] and remote["etag"] == meta.get("etag") and remote["size"] == meta.get("size"):
+            logger.info(f"ETag unchanged, skipping: {output_file}")
+            return "not_modified"
+
+        if_range = remote["etag"] or remote["last_modified"]
+        can_split = segments > 1 and remote["accept_ranges"] and remote["size"]
+        bounds = _segment_bounds(remote["size"], segments) if can_split else []
+
+        # Partial bytes are only reusable if they belong to the same remote version and layout
+        part_state = _read_json(part_state_path)
+        new_state = {**remote, "segments": len(bounds)}
+        if part_state != new_state:
+            _remove(part_path, *(f"{part_path}.{i}" for i in range(part_state.get("segments", 0))))
+            _write_json(part_state_path, new_state)
+
+        logger.info(f"Downloading data from {url} ({len(bounds) or 1} stream(s))...")
+        start = time.perf_counter()
+
+        if bounds:
+            segment_paths = [f"{part_path}.{i}" for i in range(len(bounds))]
+            with ThreadPoolExecutor(max_workers=len(bounds)) as pool:
+                fetched = sum(pool.map(
+                    lambda args: _download_range(session, url, args[0], *args[1], if_range=if_range),
+                    zip(segment_paths, bounds),
+                ))
+            with open(part_path, 'wb') as out:
+                for segment_path in segment_paths:
+                    with open(segment_path, 'rb') as f:
+                        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+                            out.write(chunk)
+            _remove(*segment_paths)
+        else:
+            end = remote["size"] - 1 if remote["size"] and remote["accept_ranges"] else None
+            fetched = _download_range(session, url, part_path, end=end, if_range=if_range)
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        size = os.path.getsize(part_path)
+        if remote["size"] is not None and size != remote["size"]:
+            raise IOError(f"Size mismatch: got {size} bytes, expected {remote['size']}")
+
+        digest = _sha256(part_path)
+        os.replace(part_path, output_file)
+        _write_json(meta_path, {
+            "url": url,
+            "etag": remote["etag"],
+            "last_modified": remote["last_modified"],
+            "size": size,
+            "sha256": digest,
+        })
+        _remove(part_state_path)
+
+        logger.info(f"Download complete: {output_file} ({fetched / 1e6:.1f} MB fetched in {elapsed:.1f}s, "
+                    f"{fetched / 1e6 / elapsed:.2f} MB/s, sha256 {digest[:12]})")
+        return "downloaded"
+
     except Exception as e:
-        logger.error(f"Failed to download data: {e}")
+        logger.error(f"Failed to download data (partial progress kept for resume): {e}")
+        return "failed"
+
+def fetch_basins(basins=("NA",), segments: int = 1, force: bool = False):
+    """Downloads one CSV per basin, for process_hurricanes.py --input ... --workers N."""
+    return {basin: fetch_data(basin_url(basin), basin_output_file(basin), segments, force) for basin in basins}
 
 if __name__ == "__main__":
-    fetch_data()
+    parser = argparse.ArgumentParser(description="Download IBTrACS CSV exports.")
+    parser.add_argument('--basins', nargs='+', default=["NA"], choices=BASINS + ["ALL"])
+    parser.add_argument('--segments', type=int, default=1, help="Parallel byte-range connections per file")
+    parser.add_argument('--force', action='store_true', help="Ignore ETag/Last-Modified and re-download")
+    args = parser.parse_args()
+    fetch_basins(BASINS if "ALL" in args.basins else args.basins, args.segments, args.force)
@@ -1,111 +1,539 @@
+import argparse
 import csv
+import hashlib
+import heapq
+import itertools
 import json
 import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+# Allow `python scripts/process_hurricanes.py` to import backend packages
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
 # Configuration
 INPUT_CSV = 'data/raw/ibtracs_NA.csv'
 OUTPUT_GEOJSON = '../frontend/public/data/hurricanes_baseline.json'
+OUTPUT_STORE = 'data/processed/hurricane_tracks.npz'
+OUTPUT_TILES = 'data/processed/track_tiles'  # Served by api/track_routes.py
+OUTPUT_BINARY = 'data/processed/hurricane_tracks.htrk'
 START_YEAR = 2004
+CHUNK_ROWS = 10000  # Rows pulled from the CSV per batch in streaming mode
+CACHE_DIR = 'data/cache/hurricanes'  # Per-storm segment cache for --incremental
+PIPELINE_VERSION = 1  # Bump when segment output changes to invalidate the cache
 
-def process_hurricanes():
-    print(f"Processing hurricane data from {INPUT_CSV}...")
-    
-    if not os.path.exists(INPUT_CSV):
-        print(f"Error: {INPUT_CSV} not found.")
-        return
+# IBTrACS columns used by the pipeline
+COLUMNS = ('SID', 'SEASON', 'NAME', 'ISO_TIME', 'LAT', 'LON', 'USA_WIND')
 
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(OUTPUT_GEOJSON), exist_ok=True)
 
+def read_header(reader):
+    """Consumes the IBTrACS header + units rows and returns {column: index}."""
+    header = next(reader)  # Column names
+    next(reader)           # Units (skip)
+    return {name: header.index(name) for name in COLUMNS}
+
+
+def parse_row(row, cols, start_year=START_YEAR, end_year=None):
+    """
+    Parses one CSV row into (sid, name, season, point).
+    Returns None for rows outside [start_year, end_year] or with malformed values.
+    """
+    try:
+        season = int(row[cols['SEASON']])
+        if season < start_year or (end_year is not None and season > end_year):
+            return None
+
+        sid = row[cols['SID']]
+        name = row[cols['NAME']].strip()
+        time = row[cols['ISO_TIME']]
+        lat = float(row[cols['LAT']])
+        lon = float(row[cols['LON']])
+
+        # Handle missing wind values (US agency wind speed in kts)
+        wind_val = row[cols['USA_WIND']].strip()
+        wind = float(wind_val) if wind_val else 0
+
+        return sid, name, season, {
+            "time": time,
+            "lat": lat,
+            "lon": lon,
+            "wind": wind
+        }
+    except (ValueError, IndexError):
+        return None
+
+
+def load_tracks(input_csv=INPUT_CSV, start_year=START_YEAR, end_year=None):
+    """Loads every track into memory as {sid: {"name", "season", "points"}}."""
     tracks = {}
-    
-    with open(INPUT_CSV, 'r', encoding='utf-8') as f:
+
+    with open(input_csv, 'r', encoding='utf-8') as f:
         reader = csv.reader(f)
-        header = next(reader)  # Column names
-        units = next(reader)   # Units (skip)
-        
-        # Identify column indices
-        col_sid = header.index('SID')
-        col_season = header.index('SEASON')
-        col_name = header.index('NAME')
-        col_time = header.index('ISO_TIME')
-        col_lat = header.index('LAT')
-        col_lon = header.index('LON')
-        col_wind = header.index('USA_WIND') # US agency wind speed in kts
+        cols = read_header(reader)
 
         for row in reader:
-            try:
-                season = int(row[col_season])
-                if season < START_YEAR:
-                    continue
-                
-                sid = row[col_sid]
-                name = row[col_name].strip()
-                time = row[col_time]
-                lat = float(row[col_lat])
-                lon = float(row[col_lon])
-                
-                # Handle missing wind values
-                wind_val = row[col_wind].strip()
-                wind = float(wind_val) if wind_val and wind_val != ' ' else 0
-                
-                if sid not in tracks:
-                    tracks[sid] = {
-                        "name": name,
-                        "points": []
-                    }
-                
-                tracks[sid]["points"].append({
-                    "time": time,
-                    "lat": lat,
-                    "lon": lon,
-                    "wind": wind
-                })
-            except (ValueError, IndexError):
+            parsed = parse_row(row, cols, start_year, end_year)
+            if parsed is None:
                 continue
+            sid, name, season, point = parsed
+
+            if sid not in tracks:
+                tracks[sid] = {
+                    "name": name,
+                    "season": season,
+                    "points": []
+                }
+            tracks[sid]["points"].append(point)
+
+    return tracks
+
+
+def iter_row_chunks(reader, chunk_rows=CHUNK_ROWS):
+    """Pulls rows from a csv reader in lists of at most chunk_rows."""
+    while True:
+        chunk = list(itertools.islice(reader, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_storm_rows(reader, col_sid, chunk_rows=CHUNK_ROWS):
+    """
+    Groups raw CSV rows by SID, yielding (sid, rows) as soon as the SID changes.
+    IBTrACS files are sorted by SID, so only the storm in progress is held in memory.
+    """
+    current_sid, rows = None, []
+    for chunk in iter_row_chunks(reader, chunk_rows):
+        for row in chunk:
+            if len(row) <= col_sid:
+                continue
+            sid = row[col_sid]
+            if sid != current_sid:
+                if rows:
+                    yield current_sid, rows
+                current_sid, rows = sid, []
+            rows.append(row)
+    if rows:
+        yield current_sid, rows
+
+
+def parse_storm(rows, cols, start_year=START_YEAR, end_year=None):
+    """Parses one storm's raw rows into (name, season, points)."""
+    name, season, points = None, None, []
+    for row in rows:
+        parsed = parse_row(row, cols, start_year, end_year)
+        if parsed is None:
+            continue
+        _, row_name, row_season, point = parsed
+        if name is None:
+            name, season = row_name, row_season
+        points.append(point)
+    return name, season, points
+
 
-    # Convert to segmented GeoJSON for individual segment coloring
+def iter_storms(input_csv=INPUT_CSV, start_year=START_YEAR, chunk_rows=CHUNK_ROWS, end_year=None):
+    """Streams (sid, name, season, points) one finished storm at a time."""
+    with open(input_csv, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        cols = read_header(reader)
+        for sid, rows in iter_storm_rows(reader, cols['SID'], chunk_rows):
+            name, season, points = parse_storm(rows, cols, start_year, end_year)
+            if points:
+                yield sid, name, season, points
+
+
+def storm_segments(sid, name, points):
+    """Yields one LineString feature per consecutive pair of track points."""
+    # Storms with fewer than 2 points produce no segments
+    for p1, p2 in zip(points, points[1:]):
+        # Simple GeoJSON Feature for a segment
+        yield {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": [
+                    [p1["lon"], p1["lat"]],
+                    [p2["lon"], p2["lat"]]
+                ]
+            },
+            "properties": {
+                "sid": sid,
+                "name": name,
+                "wind": p1["wind"], # Color based on start point wind
+                "time": p1["time"]
+            }
+        }
+
+
+def build_features(tracks):
+    """Converts an in-memory track dict to segmented GeoJSON features."""
     features = []
     for sid, data in tracks.items():
-        points = data["points"]
-        # Skip storms with fewer than 2 points
-        if len(points) < 2:
+        features.extend(storm_segments(sid, data["name"], data["points"]))
+    return features
+
+
+def write_fragments(fragments, f):
+    """
+    Writes a FeatureCollection from pre-serialized, comma-joined feature fragments.
+    Output is byte-identical to json.dump() of the equivalent dict.
+    Returns the number of fragments written.
+    """
+    f.write('{"type": "FeatureCollection", "features": [')
+    count = 0
+    for fragment in fragments:
+        if count:
+            f.write(', ')
+        f.write(fragment)
+        count += 1
+    f.write(']}')
+    return count
+
+
+def write_feature_collection(features, f):
+    """Writes a FeatureCollection one feature at a time; returns the feature count."""
+    return write_fragments((json.dumps(feature) for feature in features), f)
+
+
+def plan_shards(inputs, start_year=START_YEAR, end_year=None, workers=1):
+    """
+    Splits the work into (input_csv, first_season, last_season) shards.
+    Several inputs (one IBTrACS file per basin) give one shard per basin;
+    a single input is split into one season range per worker.
+    """
+    if len(inputs) > 1:
+        return [(path, start_year, end_year) for path in inputs]
+
+    if end_year is None:
+        # The last range stays open-ended so no future season is dropped
+        end_year = max(start_year, datetime.now().year)
+        open_ended = True
+    else:
+        open_ended = False
+
+    n = max(1, min(workers, end_year - start_year + 1))
+    span = end_year - start_year + 1
+    bounds = [start_year + span * i // n for i in range(n + 1)]
+    shards = [(inputs[0], lo, hi - 1) for lo, hi in zip(bounds, bounds[1:])]
+    if open_ended:
+        shards[-1] = (inputs[0], shards[-1][1], None)
+    return shards
+
+
+def process_shard(shard, shard_path, chunk_rows=CHUNK_ROWS):
+    """
+    Worker: writes one tab-separated line per storm: sid, segment count, fragment.
+    Returns shard_path.
+    """
+    input_csv, first_season, last_season = shard
+    with open(shard_path, 'w') as out:
+        for sid, name, _, points in iter_storms(input_csv, first_season, chunk_rows, last_season):
+            features = [json.dumps(feature) for feature in storm_segments(sid, name, points)]
+            if features:
+                out.write(f"{sid}\t{len(features)}\t{', '.join(features)}\n")
+    return shard_path
+
+
+def iter_shard(shard_path):
+    with open(shard_path, 'r') as f:
+        for line in f:
+            sid, count, fragment = line.rstrip('\n').split('\t', 2)
+            yield sid, int(count), fragment
+
+
+def merge_shards(shard_paths):
+    """
+    K-way merge of shards by SID, so output order never depends on worker timing.
+    Storms listed in several basin files are emitted once.
+    """
+    last_sid = None
+    for sid, count, fragment in heapq.merge(*(iter_shard(p) for p in shard_paths), key=lambda s: s[0]):
+        if sid == last_sid:
             continue
-            
-        # Create a LineString segment for each pair of points
-        for i in range(len(points) - 1):
-            p1 = points[i]
-            p2 = points[i+1]
-            
-            # Simple GeoJSON Feature for a segment
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "LineString",
-                    "coordinates": [
-                        [p1["lon"], p1["lat"]],
-                        [p2["lon"], p2["lat"]]
-                    ]
-                },
-                "properties": {
-                    "sid": sid,
-                    "name": data["name"],
-                    "wind": p1["wind"], # Color based on start point wind
-                    "time": p1["time"]
-                }
-            }
-            features.append(feature)
+        last_sid = sid
+        yield count, fragment
+
+
+def process_hurricanes_parallel(inputs, output_geojson=OUTPUT_GEOJSON, start_year=START_YEAR,
+                                end_year=None, workers=2, chunk_rows=CHUNK_ROWS):
+    """Processes basin files / season ranges across a process pool and merges the shards."""
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    for path in inputs:
+        if not os.path.exists(path):
+            print(f"Error: {path} not found.")
+            return
+
+    shards = plan_shards(inputs, start_year, end_year, workers)
+    print(f"Processing {len(shards)} shards from {len(inputs)} file(s) with {workers} workers...")
+    os.makedirs(os.path.dirname(output_geojson) or '.', exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shard_paths = [os.path.join(tmp, f"shard_{i:04d}.tsv") for i in range(len(shards))]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(process_shard, shards, shard_paths, [chunk_rows] * len(shards)))
+
+        count = 0
+
+        def fragments():
+            nonlocal count
+            for n, fragment in merge_shards(shard_paths):
+                count += n
+                yield fragment
+
+        with open(output_geojson, 'w') as f:
+            write_fragments(fragments(), f)
+
+    print(f"Successfully generated {output_geojson} with {count} segments.")
+    return count
+
+
+def storm_fingerprint(sid, rows, start_year=START_YEAR, end_year=None):
+    """Content hash of one storm's raw rows plus everything that shapes its segments."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{PIPELINE_VERSION}\x1e{start_year}\x1e{sid}".encode())
+    if end_year is not None:
+        # Open-ended runs keep the fingerprints (and cache entries) of earlier versions
+        h.update(f"\x1e{end_year}".encode())
+    for row in rows:
+        h.update(b"\x1e")
+        h.update("\x1f".join(row).encode())
+    return h.hexdigest()
+
+
+class SegmentCache:
+    """
+    Content-addressed store of serialized storm segments.
+    objects/<ab>/<fingerprint> holds the segment count on its first line, then the
+    comma-joined fragment;
+    manifest.json maps SID -> fingerprint for the last completed run.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+
+    def _object_path(self, fingerprint):
+        return os.path.join(self.cache_dir, 'objects', fingerprint[:2], fingerprint)
+
+    def load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_manifest(self, manifest):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self.manifest_path)
+
+    def get(self, fingerprint):
+        """Returns (count, fragment) or None on a miss."""
+        try:
+            with open(self._object_path(fingerprint), 'r') as f:
+                count = int(f.readline())
+                return count, f.read()
+        except (OSError, ValueError):
+            return None
+
+    def put(self, fingerprint, count, fragment):
+        path = self._object_path(fingerprint)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(f"{count}\n{fragment}")
+        os.replace(tmp_path, path)
+
+    def prune(self, keep):
+        """Deletes objects whose fingerprint is not in keep; returns the number removed."""
+        removed = 0
+        objects_dir = os.path.join(self.cache_dir, 'objects')
+        if not os.path.isdir(objects_dir):
+            return 0
+        for bucket in os.listdir(objects_dir):
+            for fingerprint in os.listdir(os.path.join(objects_dir, bucket)):
+                if fingerprint not in keep:
+                    os.remove(os.path.join(objects_dir, bucket, fingerprint))
+                    removed += 1
+        return removed
+
+
+def process_hurricanes_incremental(input_csv=INPUT_CSV, output_geojson=OUTPUT_GEOJSON,
+                                   start_year=START_YEAR, cache_dir=CACHE_DIR, chunk_rows=CHUNK_ROWS,
+                                   end_year=None):
+    """
+    Rebuilds the GeoJSON re-processing only storms whose rows changed since the last run.
+    Unchanged storms are copied from the segment cache as pre-serialized fragments.
+    Returns a stats dict.
+    """
+    print(f"Incrementally processing hurricane data from {input_csv}...")
+
+    if not os.path.exists(input_csv):
+        print(f"Error: {input_csv} not found.")
+        return
+
+    os.makedirs(os.path.dirname(output_geojson) or '.', exist_ok=True)
+    cache = SegmentCache(cache_dir)
+    previous = cache.load_manifest()
+    manifest = {}
+    stats = {"storms": 0, "new": 0, "changed": 0, "reused": 0, "segments": 0}
+
+    def fragments(f):
+        reader = csv.reader(f)
+        cols = read_header(reader)
+        for sid, rows in iter_storm_rows(reader, cols['SID'], chunk_rows):
+            fingerprint = storm_fingerprint(sid, rows, start_year, end_year)
+            manifest[sid] = fingerprint
+            stats["storms"] += 1
+
+            cached = cache.get(fingerprint)
+            if cached is None:
+                stats["changed" if sid in previous else "new"] += 1
+                name, _, points = parse_storm(rows, cols, start_year, end_year)
+                features = [json.dumps(feature) for feature in storm_segments(sid, name, points)]
+                cached = (len(features), ', '.join(features))
+                cache.put(fingerprint, *cached)
+            else:
+                stats["reused"] += 1
+
+            count, fragment = cached
+            if count:
+                stats["segments"] += count
+                yield fragment
+
+    tmp_output = output_geojson + '.tmp'
+    with open(input_csv, 'r', encoding='utf-8') as f, open(tmp_output, 'w') as out:
+        write_fragments(fragments(f), out)
+    os.replace(tmp_output, output_geojson)
+
+    stats["removed"] = len(set(previous) - set(manifest))
+    cache.save_manifest(manifest)
+    cache.prune(set(manifest.values()))
+
+    print(f"Successfully generated {output_geojson} with {stats['segments']} segments "
+          f"({stats['new']} new, {stats['changed']} changed, {stats['reused']} reused, "
+          f"{stats['removed']} removed storms).")
+    return stats
+
+
+def merge_storms(inputs, start_year=START_YEAR, chunk_rows=CHUNK_ROWS, end_year=None):
+    """Storms from every input in SID order; storms listed in several basin files are yielded once."""
+    last_sid = None
+    storms = heapq.merge(*(iter_storms(path, start_year, chunk_rows, end_year) for path in inputs), key=lambda s: s[0])
+    for storm in storms:
+        if storm[0] == last_sid:
+            continue
+        last_sid = storm[0]
+        yield storm
+
+
+def build_track_store(inputs=INPUT_CSV, start_year=START_YEAR, chunk_rows=CHUNK_ROWS, end_year=None):
+    """Streams the CSV(s) straight into a columnar TrackStore."""
+    from streams.climate.track_store import TrackStore
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    return TrackStore.from_storms(merge_storms(inputs, start_year, chunk_rows, end_year))
+
+
+def process_hurricanes(input_csv=INPUT_CSV, output_geojson=OUTPUT_GEOJSON,
+                       start_year=START_YEAR, stream=False, chunk_rows=CHUNK_ROWS, end_year=None):
+    print(f"Processing hurricane data from {input_csv}...")
+
+    if not os.path.exists(input_csv):
+        print(f"Error: {input_csv} not found.")
+        return
+
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_geojson) or '.', exist_ok=True)
+
+    if stream:
+        # Bounded memory: each storm is segmented and written as soon as its SID ends
+        features = (
+            feature
+            for sid, name, _, points in iter_storms(input_csv, start_year, chunk_rows, end_year)
+            for feature in storm_segments(sid, name, points)
+        )
+        with open(output_geojson, 'w') as f:
+            count = write_feature_collection(features, f)
+    else:
+        # Convert to segmented GeoJSON for individual segment coloring
+        features = build_features(load_tracks(input_csv, start_year, end_year))
+        geojson = {
+            "type": "FeatureCollection",
+            "features": features
+        }
+        with open(output_geojson, 'w') as f:
+            json.dump(geojson, f)
+        count = len(features)
+
+    print(f"Successfully generated {output_geojson} with {count} segments.")
+    return count
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Convert IBTrACS CSV to segmented GeoJSON.")
+    parser.add_argument('--input', nargs='+', default=[INPUT_CSV],
+                        help="IBTrACS CSV path(s); pass one file per basin to process basins in parallel")
+    parser.add_argument('--output', default=OUTPUT_GEOJSON, help="GeoJSON output path")
+    parser.add_argument('--start-year', type=int, default=START_YEAR)
+    parser.add_argument('--end-year', type=int, default=None)
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only re-process storms whose rows changed since the last run")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="Segment cache for --incremental")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes; >1 shards by basin file or season range")
+    parser.add_argument('--stream', action='store_true',
+                        help="Process storm-by-storm with flat memory (input must be sorted by SID)")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+                        help="Rows read per batch in streaming mode")
+    parser.add_argument('--store', nargs='?', const=OUTPUT_STORE, default=None,
+                        help=f"Also write the columnar track store (default path: {OUTPUT_STORE})")
+    parser.add_argument('--tiles', nargs='?', const=OUTPUT_TILES, default=None,
+                        help=f"Also write level-of-detail z/x/y track tiles (default dir: {OUTPUT_TILES})")
+    parser.add_argument('--max-zoom', type=int, default=5, help="Deepest tile zoom level")
+    parser.add_argument('--binary', nargs='?', const=OUTPUT_BINARY, default=None,
+                        help=f"Also write the compact binary track file (default path: {OUTPUT_BINARY})")
+    parser.add_argument('--compress', action='store_true', help="zlib-compress the binary track file")
+    args = parser.parse_args(argv)
+    if args.incremental and (len(args.input) > 1 or args.workers > 1):
+        parser.error("--incremental processes one --input file serially; "
+                     "it cannot be combined with several inputs or --workers")
+    return args
 
-    geojson = {
-        "type": "FeatureCollection",
-        "features": features
-    }
 
-    with open(OUTPUT_GEOJSON, 'w') as f:
-        json.dump(geojson, f)
+def main(argv=None):
+    args = parse_args(argv)
+    if args.incremental:
+        process_hurricanes_incremental(args.input[0], args.output, args.start_year,
+                                       cache_dir=args.cache_dir, chunk_rows=args.chunk_rows, end_year=args.end_year)
+    elif args.workers > 1 or len(args.input) > 1:
+        process_hurricanes_parallel(args.input, args.output, args.start_year, args.end_year,
+                                    workers=args.workers, chunk_rows=args.chunk_rows)
+    else:
+        process_hurricanes(args.input[0], args.output, args.start_year,
+                           stream=args.stream, chunk_rows=args.chunk_rows, end_year=args.end_year)
+    if (args.store or args.tiles or args.binary) and all(os.path.exists(path) for path in args.input):
+        # Same storms as the GeoJSON: every input, merged by SID
+        store = build_track_store(args.input, args.start_year, args.chunk_rows, args.end_year)
+        if args.store:
+            store.save(args.store)
+            print(f"Wrote {args.store}: {len(store)} storms, {store.n_points} points, {store.nbytes / 1e6:.1f} MB")
+        if args.tiles:
+            from streams.climate.track_tiles import build_tiles
+            manifest = build_tiles(store, args.tiles, args.max_zoom)
+            n_tiles = sum(len(level["tiles"]) for level in manifest["zooms"].values())
+            print(f"Wrote {n_tiles} tiles for zooms 0-{args.max_zoom} to {args.tiles}")
+        if args.binary:
+            from streams.climate.track_binary import write_binary
+            os.makedirs(os.path.dirname(args.binary) or '.', exist_ok=True)
+            size = write_binary(store, args.binary, compress=args.compress)
+            print(f"Wrote {args.binary}: {size / 1e6:.2f} MB")
 
-    print(f"Successfully generated {OUTPUT_GEOJSON} with {len(features)} segments.")
 
 if __name__ == "__main__":
-    process_hurricanes()
+    main()
@@ -1,15 +1,50 @@
-import json
 import os
 from typing import Dict, Any, Optional
-from datetime import datetime
+
+from streams.climate.monsoon_store import MonsoonStore, load_monsoon_store, reload_monsoon_store
+
+DEFAULT_YEAR = 2019 # Default demo year
+
+class MonsoonContext:
+    """
+    One request's (or session's) view of the monsoon data: a year over the
+    shared read-only MonsoonStore. Holds no data of its own, so creating one
+    per request is free and concurrent contexts never interfere.
+    """
+
+    __slots__ = ("store", "year")
+
+    def __init__(self, store: MonsoonStore, year: int = DEFAULT_YEAR):
+        self.store = store
+        # Unknown years fall back to the default scenario, as the demo always has
+        self.year = year if store.year_index(year) >= 0 else DEFAULT_YEAR
+
+    @property
+    def scenario(self) -> Optional[str]:
+        y = self.store.year_index(self.year)
+        return str(self.store.scenario_names[y]) if y >= 0 else None
+
+    def get_current_metrics(self) -> Optional[Dict[str, Any]]:
+        """Returns the full data packet for the context year (shared; treat as read-only)."""
+        return self.store.record(self.year)
+
+    def get_onset_delay(self) -> int:
+        """Returns days delayed (Positive = Late, Negative = Early)"""
+        return self.store.onset_delay(self.year)
+
+    def get_rainfall(self, region: str = "All India") -> float:
+        return self.store.rainfall(self.year, region)
 
 class MockMonsoonClient:
     """
     A simulated client for Indian Meteorological Department (IMD) data.
     Loads pre-canned scenarios for 2019, 2022, 2023 to ensure consistent demos.
+    Every client in the process reads the one shared MonsoonStore snapshot on
+    each access, so reload() on any client reaches all of them; per-user year
+    selection goes through context() rather than set_year().
     """
     
-    def __init__(self, mock_file_path: str = "backend/data/mock_monsoon_data.json"):
+    def __init__(self, mock_file_path: str = "backend/data/mock_monsoon_data.json", store: Optional[MonsoonStore] = None):
         # Resolve absolute path relative to project root if needed
         # Assuming current working dir is project root or backend
         if not os.path.exists(mock_file_path):
@@ -17,45 +52,61 @@ class MockMonsoonClient:
              mock_file_path = os.path.join(os.path.dirname(__file__), "../../data/mock_monsoon_data.json")
         
         self.mock_file_path = mock_file_path
-        self.data_cache = self._load_data()
-        self.current_year_focus = 2019 # Default demo year
+        self._pinned = store  # An explicitly passed store replaces the shared snapshot for this client
+        self._fallback: Optional[MonsoonStore] = None
+        self.current_year_focus = DEFAULT_YEAR
+        self.store  # Load (or report a broken data file) up front
 
-    def _load_data(self) -> Dict[str, Any]:
+    @property
+    def store(self) -> MonsoonStore:
+        if self._pinned is not None:
+            return self._pinned
+        if self._fallback is not None:
+            return self._fallback
         try:
-            with open(self.mock_file_path, 'r') as f:
-                return json.load(f)
+            return load_monsoon_store(self.mock_file_path)
         except Exception as e:
             print(f"Error loading mock monsoon data: {e}")
-            return {}
+            self._fallback = MonsoonStore.from_records({})
+            return self._fallback
+
+    def reload(self) -> MonsoonStore:
+        """
+        Replaces the process-wide snapshot, for every client. Contexts created
+        earlier keep the old store, whose archive is read into memory and closed.
+        """
+        self._pinned = self._fallback = None
+        reload_monsoon_store(self.mock_file_path)
+        return self.store
+
+    def context(self, year: Optional[int] = None, scenario: Optional[str] = None) -> MonsoonContext:
+        """
+        Lightweight view for one request/session. scenario selects by scenario_name
+        and wins over year; with neither, the client's own focus year is used.
+        """
+        store = self.store
+        if scenario is not None:
+            matches = (store.scenario_names == scenario).nonzero()[0]
+            if len(matches):
+                year = int(store.years[matches[0]])
+        return MonsoonContext(store, year if year is not None else self.current_year_focus)
 
     def set_year(self, year: int):
-        """Switches the simulated 'current' year."""
+        """Switches this client's simulated 'current' year (used by the StreamManager's world view)."""
         self.current_year_focus = year
 
+    def get_year(self, year: int) -> Optional[Dict[str, Any]]:
+        """Full data packet for a year, or None."""
+        return self.store.record(year)
+
     def get_current_metrics(self) -> Dict[str, Any]:
         """Returns the full data packet for the focused year."""
-        year_str = str(self.current_year_focus)
-        return self.data_cache.get(year_str, self.data_cache.get("2019"))
+        return self.context().get_current_metrics()
 
     def get_historical_rainfall(self, year: int, region: str = "All India") -> float:
-        """Returns specific rainfall mm for a year/region."""
-        data = self.data_cache.get(str(year))
-        if not data:
-            return 0.0
-            
-        if region == "All India":
-            return data["all_india_rainfall_mm"]
-            
-        # Linear search for region
-        for r_data in data.get("regional_data", []):
-            if r_data["region"] == region:
-                return r_data["rainfall_mm"]
-        return 0.0
+        """Returns specific rainfall mm for a year/region (region, state or district)."""
+        return self.store.rainfall(year, region)
 
     def get_onset_delay(self) -> int:
         """Returns days delayed (Positive = Late, Negative = Early)"""
-        data = self.get_current_metrics()
-        onset = datetime.strptime(data["onset_date"], "%Y-%m-%d")
-        normal = datetime.strptime(data["normal_onset_date"], "%Y-%m-%d")
-        delta = onset - normal
-        return delta.days
+        return self.context().get_onset_delay()
@@ -0,0 +1,159 @@
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+from models.stream_models import Alert, AlertSeverity
+from streams.climate.monsoon_store import MonsoonStore, REGION, STATE, DISTRICT
+
+LEVELS = {"national": None, "region": REGION, "state": STATE, "district": DISTRICT}
+
+# Rule column -> (national column, area observation column)
+COLUMNS = {
+    "deviation": ("deviation_percent", "obs_deviation"),
+    "onset_delay_days": ("onset_delay_days", None),
+    "risk": (None, "obs_risk"),
+}
+
+RISK_RANK = {"Low": 0, "Medium": 1, "High": 2, "Critical": 3}
+SEVERITY_RANK = {AlertSeverity.INFO: 0, AlertSeverity.MEDIUM: 1, AlertSeverity.HIGH: 2, AlertSeverity.CRITICAL: 3}
+
+COMPARE = {"lt": np.less, "le": np.less_equal, "gt": np.greater, "ge": np.greater_equal}
+
+
+@dataclass(frozen=True)
+class ThresholdRule:
+    """
+    One declarative rule evaluated over every (year, area) of a level.
+    bands are (threshold, severity) pairs, most severe first; a value gets the
+    first band it crosses. Risk thresholds are ranks from RISK_RANK.
+    message may use {area}, {year}, {value} and {threshold}.
+    """
+    name: str
+    level: str
+    column: str
+    op: str
+    bands: Tuple[Tuple[float, AlertSeverity], ...]
+    message: str
+    value_key: str = "value"
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self):
+        national, area = COLUMNS[self.column]
+        if self.level not in LEVELS or self.op not in COMPARE or not self.bands:
+            raise ValueError(f"Invalid rule {self.name!r}")
+        if (national if self.level == "national" else area) is None:
+            raise ValueError(f"Rule {self.name!r}: column {self.column!r} not available at {self.level} level")
+
+
+# IMD categories: below -10% LPA is a national deficit; -20% marks a deficient region/state/district, -60% large deficient
+DEFAULT_RULES = (
+    ThresholdRule("monsoon_deficit", "national", "deviation", "lt",
+                  ((-15, AlertSeverity.CRITICAL), (-10, AlertSeverity.HIGH)),
+                  "Critical Monsoon Deficit: {value:g}% below LPA. Agricultural impact imminent.",
+                  value_key="deviation", context={"impact_est": "High"}),
+    ThresholdRule("onset_delay", "national", "onset_delay_days", "gt",
+                  ((7, AlertSeverity.MEDIUM),),
+                  "Monsoon Onset Delayed by {value:g} days. Sowing windows at risk.",
+                  value_key="delay_days"),
+    ThresholdRule("region_deficit", "region", "deviation", "lt",
+                  ((-60, AlertSeverity.CRITICAL), (-20, AlertSeverity.HIGH)),
+                  "Rainfall Deficit in {area}: {value:g}% below normal.",
+                  value_key="deviation"),
+    ThresholdRule("state_deficit", "state", "deviation", "lt",
+                  ((-60, AlertSeverity.CRITICAL), (-20, AlertSeverity.HIGH)),
+                  "Rainfall Deficit in {area}: {value:g}% below normal.",
+                  value_key="deviation"),
+    ThresholdRule("state_risk", "state", "risk", "ge",
+                  ((RISK_RANK["Critical"], AlertSeverity.CRITICAL), (RISK_RANK["High"], AlertSeverity.HIGH)),
+                  "{area} at elevated agricultural risk.",
+                  value_key="risk_rank"),
+    ThresholdRule("district_deficit", "district", "deviation", "lt",
+                  ((-60, AlertSeverity.CRITICAL), (-20, AlertSeverity.HIGH)),
+                  "Rainfall Deficit in {area} district: {value:g}% below normal.",
+                  value_key="deviation"),
+)
+
+
+def slug(name: str) -> str:
+    return "".join(c if c.isalnum() else "_" for c in name.lower()).strip("_")
+
+
+class AlertRuleEngine:
+    """
+    Evaluates ThresholdRules against a MonsoonStore.
+    Each rule is one masked comparison over the year columns (national) or the
+    observation table (region/state/district); Python only touches the hits.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES):
+        self.rules = tuple(rules)
+
+    @staticmethod
+    def _candidates(store: MonsoonStore, rule: ThresholdRule, start: int, end: int):
+        """(years, area names or None, values) for the rule's level within [start, end]."""
+        national, area = COLUMNS[rule.column]
+        if rule.level == "national":
+            rows = np.nonzero((store.years >= start) & (store.years <= end))[0]
+            return store.years[rows], None, getattr(store, national)[rows].astype(np.float64)
+
+        mask = (store.obs_year >= start) & (store.obs_year <= end)
+        mask &= store.area_levels[store.obs_area] == LEVELS[rule.level]
+        rows = np.nonzero(mask)[0]
+        if rule.column == "risk":
+            # Label codes -> ranks; code -1 (no risk_level) lands on the trailing NaN
+            ranks = [RISK_RANK.get(label, np.nan) for label in store.risk_labels.tolist()]
+            values = np.array(ranks + [np.nan])[store.obs_risk[rows]]
+        else:
+            values = getattr(store, area)[rows].astype(np.float64)
+        return store.obs_year[rows], store.obs_area[rows], values
+
+    def evaluate(self, store: MonsoonStore, start: Optional[int] = None, end: Optional[int] = None,
+                 now: Optional[float] = None, stream_id: str = "climate") -> List[Alert]:
+        """
+        Alerts for every rule over years start..end (inclusive, default all).
+        Ids are stable per (rule, year, area); when several rules produce the
+        same id the most severe wins.
+        """
+        if not len(store):
+            return []
+        start = int(store.years.min()) if start is None else start
+        end = int(store.years.max()) if end is None else end
+        now = time.time() if now is None else now
+        names = store.area_names.tolist()
+
+        alerts: Dict[str, Alert] = {}
+        for rule in self.rules:
+            years, areas, values = self._candidates(store, rule, start, end)
+            compare = COMPARE[rule.op]
+            band = np.full(len(values), -1, dtype=np.int8)
+            for i in range(len(rule.bands) - 1, -1, -1):  # least severe first, so more severe bands overwrite
+                band[compare(values, rule.bands[i][0])] = i
+
+            for row in np.nonzero(band >= 0)[0].tolist():
+                year = int(years[row])
+                area = "All India" if areas is None else names[areas[row]]
+                threshold, severity = rule.bands[band[row]]
+                value = float(values[row])
+                value = int(value) if value.is_integer() else round(value, 1)
+                alert_id = f"alert_{rule.name}_{year}" if areas is None else f"alert_{rule.name}_{year}_{slug(area)}"
+
+                existing = alerts.get(alert_id)
+                if existing is not None and SEVERITY_RANK[existing.severity] >= SEVERITY_RANK[severity]:
+                    continue
+                # Fields are built here from typed columns, so skip pydantic validation on the hot path
+                alerts[alert_id] = Alert.model_construct(
+                    id=alert_id,
+                    stream_ids=[stream_id],
+                    severity=severity,
+                    message=rule.message.format(area=area, year=year, value=value, threshold=threshold),
+                    created_at=now,
+                    context={rule.value_key: value, "year": year, "area": area, "level": rule.level,
+                             "rule": rule.name, **rule.context},
+                )
+        return list(alerts.values())
+
+
+# Global Instance
+alert_engine = AlertRuleEngine()
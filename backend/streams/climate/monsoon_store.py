@@ -0,0 +1,351 @@
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_JSON_PATH = os.path.join(os.path.dirname(__file__), "../../data/mock_monsoon_data.json")
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(__file__), "../../data/cache/monsoon_store.npz")
+
+NORMAL_ONSET = "06-01"  # IMD normal onset over Kerala, used when a record has no normal_onset_date
+
+REGION, STATE, DISTRICT = 0, 1, 2
+NAT = np.datetime64("NaT", "D")
+
+
+def _dates(values: List[Optional[str]]) -> np.ndarray:
+    return np.array([v if v else "NaT" for v in values], dtype="datetime64[D]")
+
+
+def _num(value) -> Any:
+    """Columns are float32; hand back ints where the source had whole numbers."""
+    value = round(float(value), 1)
+    return int(value) if value.is_integer() else value
+
+
+class MonsoonStore:
+    """
+    Columnar monsoon store.
+
+    Year columns are indexed by position in the sorted years array. Regional,
+    state and district observations share one "obs" table sorted by area then
+    year, so area a owns rows area_offsets[a]:area_offsets[a + 1] - a contiguous
+    time series. cell[year_idx, area] maps (year, area) to its obs row (-1 if none).
+
+    A store opened with load() reads each column from the .npz only when first used.
+    Columns are read-only, so one store can be shared by every request and stream.
+    """
+
+    _FIELDS = ("years", "scenario_names", "rainfall_mm", "lpa_mm", "deviation_percent",
+               "onset", "normal_onset", "withdrawal", "onset_delay_days", "status",
+               "status_labels", "risk_labels", "area_names", "area_levels", "area_parent",
+               "area_offsets", "obs_area", "obs_year", "obs_rainfall_mm", "obs_deviation",
+               "obs_status", "obs_risk")
+
+    def __init__(self, archive=None, **columns):
+        self._archive = archive
+        for name, value in columns.items():
+            value.flags.writeable = False
+            setattr(self, name, value)
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self.loaded_at = time.time()
+
+    def __getattr__(self, name: str):
+        # Only reached for columns not loaded yet
+        archive = self.__dict__.get("_archive")
+        if archive is not None and name in self._FIELDS:
+            value = archive[name]
+            value.flags.writeable = False
+            setattr(self, name, value)
+            return value
+        raise AttributeError(name)
+
+    @classmethod
+    def from_records(cls, records: Dict[str, Dict[str, Any]]) -> "MonsoonStore":
+        """
+        Builds the store from mock_monsoon_data.json-style records: {year: {..., regional_data, states}}.
+        Records may also carry "districts": {name: {"state": ..., rainfall_mm, deviation, status, risk_level}}.
+        """
+        rows = sorted(records.values(), key=lambda r: r["year"])
+        years = np.array([r["year"] for r in rows], dtype=np.int16)
+
+        status_labels: List[str] = []
+        risk_labels: List[str] = []
+
+        def code(labels: List[str], value: Optional[str]) -> int:
+            if value is None:
+                return -1
+            if value not in labels:
+                labels.append(value)
+            return labels.index(value)
+
+        area_ids: Dict[tuple, int] = {}
+        area_names, area_levels, area_parent = [], [], []
+
+        def area(level: int, name: str, parent: int = -1) -> int:
+            key = (level, name)
+            if key not in area_ids:
+                area_ids[key] = len(area_names)
+                area_names.append(name)
+                area_levels.append(level)
+                area_parent.append(parent)
+            return area_ids[key]
+
+        obs = []  # (area, year, rainfall, deviation, status, risk)
+        for r in rows:
+            for item in r.get("regional_data", []):
+                obs.append((area(REGION, item["region"]), r["year"], item["rainfall_mm"], item["deviation"],
+                            code(status_labels, item.get("status")), -1))
+            for name, item in r.get("states", {}).items():
+                obs.append((area(STATE, name), r["year"], item["rainfall_mm"], item["deviation"],
+                            code(status_labels, item.get("status")), code(risk_labels, item.get("risk_level"))))
+            for name, item in r.get("districts", {}).items():
+                parent = area(STATE, item["state"]) if item.get("state") else -1
+                obs.append((area(DISTRICT, name, parent), r["year"], item["rainfall_mm"], item["deviation"],
+                            code(status_labels, item.get("status")), code(risk_labels, item.get("risk_level"))))
+
+        table = np.array(obs, dtype=np.float64).reshape(-1, 6)
+        table = table[np.lexsort((table[:, 1], table[:, 0]))]
+        obs_area = table[:, 0].astype(np.int32)
+
+        onset = _dates([r.get("onset_date") for r in rows])
+        normal = _dates([r.get("normal_onset_date") for r in rows])
+        withdrawal = _dates([r.get("withdrawal_date") for r in rows])
+        # Pre-computed delay; records without a normal date use 1 June of their year
+        fallback = _dates([f"{r['year']}-{NORMAL_ONSET}" for r in rows])
+        delay = (onset - np.where(np.isnat(normal), fallback, normal)).astype(np.int64)
+
+        return cls(
+            years=years,
+            scenario_names=np.array([r.get("scenario_name", "") for r in rows], dtype="U"),
+            rainfall_mm=np.array([r["all_india_rainfall_mm"] for r in rows], dtype=np.float32),
+            lpa_mm=np.array([r.get("lpa_mm", np.nan) for r in rows], dtype=np.float32),
+            deviation_percent=np.array([r["deviation_percent"] for r in rows], dtype=np.float32),
+            onset=onset,
+            normal_onset=normal,
+            withdrawal=withdrawal,
+            onset_delay_days=np.where(np.isnat(onset), 0, delay).astype(np.int16),
+            status=np.array([code(status_labels, r.get("status")) for r in rows], dtype=np.int8),
+            status_labels=np.array(status_labels or [""], dtype="U"),
+            risk_labels=np.array(risk_labels or [""], dtype="U"),
+            area_names=np.array(area_names or [""], dtype="U")[:len(area_names)],
+            area_levels=np.array(area_levels, dtype=np.int8),
+            area_parent=np.array(area_parent, dtype=np.int32),
+            area_offsets=np.searchsorted(obs_area, np.arange(len(area_names) + 1)).astype(np.int64),
+            obs_area=obs_area,
+            obs_year=table[:, 1].astype(np.int16),
+            obs_rainfall_mm=table[:, 2].astype(np.float32),
+            obs_deviation=table[:, 3].astype(np.float32),
+            obs_status=table[:, 4].astype(np.int8),
+            obs_risk=table[:, 5].astype(np.int8),
+        )
+
+    @classmethod
+    def from_json(cls, path: str) -> "MonsoonStore":
+        with open(path, 'r') as f:
+            return cls.from_records(json.load(f))
+
+    def save(self, path: str):
+        """Writes the store as an uncompressed .npz archive."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(path, **{f: getattr(self, f) for f in self._FIELDS})
+
+    @classmethod
+    def load(cls, path: str) -> "MonsoonStore":
+        """Opens the archive; columns are read on first access."""
+        return cls(archive=np.load(path))
+
+    def close(self):
+        """Reads the columns not loaded yet into memory and closes the archive, so holders of a retired store keep working."""
+        archive = self.__dict__.get("_archive")
+        if archive is None:
+            return
+        for name in self._FIELDS:
+            getattr(self, name)
+        self._archive = None
+        archive.close()
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, f).nbytes for f in self._FIELDS)
+
+    # Indexes
+
+    def year_index(self, year: int) -> int:
+        """Position of year in the year columns, or -1."""
+        index = self.__dict__.get("_year_index")
+        if index is None:
+            index = {y: i for i, y in enumerate(self.years.tolist())}
+            self._year_index = index
+        return index.get(year, -1)
+
+    @property
+    def area_index(self) -> Dict[tuple, int]:
+        """(level, name) -> area id."""
+        index = self.__dict__.get("_area_index")
+        if index is None:
+            index = {(int(level), name): i for i, (level, name)
+                     in enumerate(zip(self.area_levels.tolist(), self.area_names.tolist()))}
+            self._area_index = index
+        return index
+
+    def area_id(self, name: str, level: Optional[int] = None) -> int:
+        index = self.area_index
+        if level is not None:
+            return index.get((level, name), -1)
+        for lvl in (REGION, STATE, DISTRICT):
+            a = index.get((lvl, name))
+            if a is not None:
+                return a
+        return -1
+
+    @property
+    def cell(self) -> np.ndarray:
+        """(n_years, n_areas) -> obs row, -1 where an area has no data for a year."""
+        cell = self.__dict__.get("_cell")
+        if cell is None:
+            cell = np.full((len(self.years), len(self.area_names)), -1, dtype=np.int32)
+            cell[np.searchsorted(self.years, self.obs_year), self.obs_area] = np.arange(len(self.obs_area))
+            cell.flags.writeable = False
+            self._cell = cell
+        return cell
+
+    # Queries
+
+    def rainfall(self, year: int, area: str = "All India") -> float:
+        """Rainfall in mm for a year and region/state/district (0.0 when unknown)."""
+        y = self.year_index(year)
+        if y < 0:
+            return 0.0
+        if area == "All India":
+            return _num(self.rainfall_mm[y])
+        a = self.area_id(area)
+        row = int(self.cell[y, a]) if a >= 0 else -1
+        return _num(self.obs_rainfall_mm[row]) if row >= 0 else 0.0
+
+    def onset_delay(self, year: int) -> int:
+        """Days delayed (Positive = Late, Negative = Early); 0 for unknown years."""
+        y = self.year_index(year)
+        return int(self.onset_delay_days[y]) if y >= 0 else 0
+
+    def series(self, area: str, start: Optional[int] = None, end: Optional[int] = None,
+               level: Optional[int] = None) -> Dict[str, np.ndarray]:
+        """Time series of one area between start and end (inclusive) as array views, no per-year loop."""
+        a = self.area_id(area, level)
+        if a < 0:
+            return {"years": self.obs_year[:0], "rainfall_mm": self.obs_rainfall_mm[:0],
+                    "deviation": self.obs_deviation[:0], "status": self.obs_status[:0], "risk": self.obs_risk[:0]}
+        lo, hi = int(self.area_offsets[a]), int(self.area_offsets[a + 1])
+        years = self.obs_year[lo:hi]
+        i, j = np.searchsorted(years, [start if start is not None else -1 << 15,
+                                       (end if end is not None else (1 << 15) - 2) + 1])
+        rows = slice(lo + i, lo + j)
+        return {
+            "years": self.obs_year[rows],
+            "rainfall_mm": self.obs_rainfall_mm[rows],
+            "deviation": self.obs_deviation[rows],
+            "status": self.obs_status[rows],
+            "risk": self.obs_risk[rows],
+        }
+
+    def record(self, year: int) -> Optional[Dict[str, Any]]:
+        """The year in mock_monsoon_data.json shape (memoized; treat as read-only)."""
+        if year in self._records:
+            return self._records[year]
+        y = self.year_index(year)
+        if y < 0:
+            return None
+
+        rows = self.cell[y][self.cell[y] >= 0]
+        levels = self.area_levels[self.obs_area[rows]]
+        status = self.status_labels.tolist()
+        risk = self.risk_labels.tolist()
+
+        def item(row: int) -> Dict[str, Any]:
+            out = {"rainfall_mm": _num(self.obs_rainfall_mm[row]), "deviation": _num(self.obs_deviation[row])}
+            if self.obs_status[row] >= 0:
+                out["status"] = status[self.obs_status[row]]
+            if self.obs_risk[row] >= 0:
+                out["risk_level"] = risk[self.obs_risk[row]]
+            return out
+
+        names = self.area_names
+        record = {
+            "year": int(self.years[y]),
+            "scenario_name": str(self.scenario_names[y]),
+            "all_india_rainfall_mm": _num(self.rainfall_mm[y]),
+            "lpa_mm": _num(self.lpa_mm[y]),
+            "deviation_percent": _num(self.deviation_percent[y]),
+        }
+        for key, column in (("onset_date", self.onset), ("normal_onset_date", self.normal_onset),
+                            ("withdrawal_date", self.withdrawal)):
+            if not np.isnat(column[y]):
+                record[key] = str(column[y])
+        if self.status[y] >= 0:
+            record["status"] = status[self.status[y]]
+        record["regional_data"] = [{"region": str(names[self.obs_area[r]]), **item(r)} for r in rows[levels == REGION]]
+        record["states"] = {str(names[self.obs_area[r]]): item(r) for r in rows[levels == STATE]}
+        districts = rows[levels == DISTRICT]
+        if len(districts):
+            record["districts"] = {
+                str(names[self.obs_area[r]]): {"state": str(names[self.area_parent[self.obs_area[r]]]), **item(r)}
+                for r in districts
+            }
+
+        self._records[year] = record
+        return record
+
+
+# Process-wide snapshots by (json path, store path); replaced as a whole by reload_monsoon_store
+_stores: Dict[Tuple[str, str], MonsoonStore] = {}
+_stores_lock = threading.Lock()
+
+
+def load_monsoon_store(json_path: str = DEFAULT_JSON_PATH, store_path: str = DEFAULT_STORE_PATH) -> MonsoonStore:
+    """
+    Process-wide shared snapshot: every caller naming the same files gets the
+    same (read-only) store. Opens the columnar .npz when it is newer than the
+    JSON source; otherwise builds it from the JSON and writes the .npz for next time.
+    Cheap enough to call on every access, which is how clients see a reload.
+    """
+    key = _store_key(json_path, store_path)
+    store = _stores.get(key)
+    if store is None:
+        with _stores_lock:
+            store = _stores.get(key)
+            if store is None:
+                store = _stores[key] = _open_store(*key)
+    return store
+
+
+def reload_monsoon_store(json_path: str = DEFAULT_JSON_PATH, store_path: str = DEFAULT_STORE_PATH) -> MonsoonStore:
+    """Replaces the shared snapshot with a fresh one (rebuilding the .npz if the JSON changed) and closes the old archive."""
+    key = _store_key(json_path, store_path)
+    with _stores_lock:
+        old = _stores.get(key)
+        store = _stores[key] = _open_store(*key)
+    if old is not None:
+        old.close()
+    return store
+
+
+@lru_cache(maxsize=64)
+def _store_key(json_path: str, store_path: str) -> Tuple[str, str]:
+    return os.path.realpath(json_path), os.path.realpath(store_path)
+
+
+def _open_store(json_path: str, store_path: str) -> MonsoonStore:
+    if os.path.exists(store_path) and os.path.getmtime(store_path) >= os.path.getmtime(json_path):
+        return MonsoonStore.load(store_path)
+    store = MonsoonStore.from_json(json_path)
+    try:
+        store.save(store_path)
+    except OSError:
+        pass
+    return store
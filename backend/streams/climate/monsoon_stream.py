@@ -0,0 +1,38 @@
+import time
+from typing import Optional
+from streams.base_stream import BaseStream
+from streams.climate.mock_monsoon_client import MockMonsoonClient
+from models.stream_models import StreamData, StreamStatus
+
+class MonsoonStream(BaseStream):
+    """
+    Climate stream backed by the IMD monsoon client.
+    Metrics are the headline numbers; metadata carries the full record for the focused year.
+    """
+
+    def __init__(self, client: Optional[MockMonsoonClient] = None, stream_id: str = "climate"):
+        super().__init__(stream_id)
+        self.client = client or MockMonsoonClient()
+
+    async def scan(self) -> StreamData:
+        # One context per scan, so metrics and onset delay always describe the same year
+        context = self.client.context()
+        data = context.get_current_metrics()
+        if not data:
+            return StreamData(stream_id=self.stream_id, timestamp=time.time(),
+                              status=StreamStatus.OFFLINE, metrics={})
+
+        return StreamData(
+            stream_id=self.stream_id,
+            timestamp=time.time(),
+            status=StreamStatus.HEALTHY,
+            metrics={
+                "deviation_percent": data["deviation_percent"],
+                "onset_delay_days": context.get_onset_delay(),
+                "rainfall_total": data["all_india_rainfall_mm"],
+            },
+            metadata=data,
+        )
+
+    async def health_check(self) -> bool:
+        return len(self.client.store) > 0
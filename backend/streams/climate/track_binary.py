@@ -0,0 +1,189 @@
+"""
+Compact binary hurricane track format (.htrk).
+
+Layout (little-endian):
+    header   HEADER struct, see below
+    body     zlib-compressed when FLAG_ZLIB is set, otherwise raw:
+             string table offsets u32[n_strings + 1] + UTF-8 bytes (SIDs and names, deduplicated)
+             per storm: sid u32, name u32, season i16, point offset u32[n_storms + 1], base time i64
+             per point: lat, lon (i16, or i32 when a delta overflows), wind i16, time delta (i32 or i64)
+
+Coordinates are quantized to 1/coord_scale degrees. The first point of each storm is
+stored absolute and the rest as deltas from the previous point, so typical 6-hourly
+tracks fit in int16. Every section is padded to 8 bytes.
+"""
+import mmap
+import struct
+import zlib
+from typing import Dict, Any, List
+
+import numpy as np
+
+from streams.climate.track_store import TrackStore, NAT
+
+MAGIC = b"HTRK"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIdQ")  # magic, version, flags, n_storms, n_points, n_strings, coord_scale, body_len
+
+FLAG_ZLIB = 1
+FLAG_LAT32 = 2
+FLAG_LON32 = 4
+FLAG_TIME64 = 8
+
+COORD_SCALE = 100.0  # 0.01 degree resolution
+
+
+def _delta_encode(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Per-storm deltas; each storm's first value is kept absolute."""
+    deltas = np.empty_like(values)
+    if len(values):
+        deltas[0] = values[0]
+        deltas[1:] = np.diff(values)
+        starts = offsets[:-1][offsets[:-1] < offsets[1:]]
+        deltas[starts] = values[starts]
+    return deltas
+
+
+def _delta_decode(deltas: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Inverse of _delta_encode as one cumulative sum plus a per-storm correction."""
+    total = np.cumsum(deltas, dtype=np.int64)
+    before_start = np.concatenate([[0], total])[offsets[:-1]]
+    return total - np.repeat(before_start, np.diff(offsets))
+
+
+def _narrowest(deltas: np.ndarray, small, large):
+    info = np.iinfo(small)
+    if len(deltas) == 0 or (deltas.min() >= info.min and deltas.max() <= info.max):
+        return deltas.astype(small), False
+    return deltas.astype(large), True
+
+
+def _pad(buf: bytearray):
+    buf.extend(b"\0" * (-len(buf) % 8))
+
+
+def encode(store: TrackStore, compress: bool = False, coord_scale: float = COORD_SCALE) -> bytes:
+    """Serializes a TrackStore to .htrk bytes."""
+    offsets = store.offsets.astype(np.int64)
+    strings: List[str] = []
+    index: Dict[str, int] = {}
+
+    def intern(value: str) -> int:
+        if value not in index:
+            index[value] = len(strings)
+            strings.append(value)
+        return index[value]
+
+    sid_idx = np.array([intern(s) for s in store.sids.tolist()], dtype=np.uint32)
+    name_idx = np.array([intern(n) for n in store.names.tolist()], dtype=np.uint32)
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+    np.cumsum([len(e) for e in encoded], out=string_offsets[1:])
+
+    lat_q = np.round(store.lat.astype(np.float64) * coord_scale).astype(np.int64)
+    lon_q = np.round(store.lon.astype(np.float64) * coord_scale).astype(np.int64)
+    lat, lat32 = _narrowest(_delta_encode(lat_q, offsets), np.int16, np.int32)
+    lon, lon32 = _narrowest(_delta_encode(lon_q, offsets), np.int16, np.int32)
+    wind = np.round(store.wind).astype(np.int16)
+
+    # Times: per-storm base + int32 deltas; missing times force absolute-first int64 deltas
+    starts = offsets[:-1][offsets[:-1] < offsets[1:]]
+    base_time = np.zeros(len(store), dtype=np.int64)
+    dtime = _delta_encode(store.time, offsets)
+    if (store.time == NAT).any():
+        time64 = True
+    else:
+        base_time[np.searchsorted(offsets[:-1], starts, side="right") - 1] = store.time[starts]
+        dtime[starts] = 0
+        dtime, time64 = _narrowest(dtime, np.int32, np.int64)
+
+    body = bytearray()
+    for part in (string_offsets.tobytes(), b"".join(encoded)):
+        body.extend(part)
+        _pad(body)
+    for arr in (sid_idx, name_idx, store.seasons.astype(np.int16), offsets.astype(np.uint32),
+                base_time, lat, lon, wind, dtime):
+        body.extend(arr.tobytes())
+        _pad(body)
+
+    flags = (FLAG_LAT32 if lat32 else 0) | (FLAG_LON32 if lon32 else 0) | (FLAG_TIME64 if time64 else 0)
+    if compress:
+        body = zlib.compress(bytes(body), 6)
+        flags |= FLAG_ZLIB
+
+    header = HEADER.pack(MAGIC, VERSION, flags, len(store), store.n_points, len(strings), coord_scale, len(body))
+    return header + bytes(body)
+
+
+def write_binary(store: TrackStore, path: str, compress: bool = False) -> int:
+    """Writes the store to path; returns the file size."""
+    data = encode(store, compress)
+    with open(path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def read_header(buf) -> Dict[str, Any]:
+    magic, version, flags, n_storms, n_points, n_strings, coord_scale, body_len = HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("Not an .htrk track file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported .htrk version {version}")
+    return {"flags": flags, "n_storms": n_storms, "n_points": n_points,
+            "n_strings": n_strings, "coord_scale": coord_scale, "body_len": body_len}
+
+
+def decode(buf) -> TrackStore:
+    """Decodes .htrk bytes (or an mmap) into a TrackStore."""
+    h = read_header(buf)
+    flags, n, p = h["flags"], h["n_storms"], h["n_points"]
+    body = memoryview(buf)[HEADER.size:HEADER.size + h["body_len"]]
+    if flags & FLAG_ZLIB:
+        body = memoryview(zlib.decompress(body))
+
+    pos = 0
+
+    def take(dtype, count):
+        nonlocal pos
+        arr = np.frombuffer(body, dtype=dtype, count=count, offset=pos)
+        pos += arr.nbytes + (-arr.nbytes % 8)
+        return arr
+
+    string_offsets = take(np.uint32, h["n_strings"] + 1).astype(np.int64)
+    raw_strings = bytes(take(np.uint8, int(string_offsets[-1])))
+    strings = np.array([raw_strings[a:b].decode("utf-8") for a, b in zip(string_offsets[:-1], string_offsets[1:])]
+                       or [""], dtype="U")
+
+    sid_idx = take(np.uint32, n)
+    name_idx = take(np.uint32, n)
+    seasons = take(np.int16, n).copy()
+    offsets = take(np.uint32, n + 1).astype(np.int64)
+    base_time = take(np.int64, n)
+    lat_q = _delta_decode(take(np.int32 if flags & FLAG_LAT32 else np.int16, p), offsets)
+    lon_q = _delta_decode(take(np.int32 if flags & FLAG_LON32 else np.int16, p), offsets)
+    wind = take(np.int16, p).astype(np.float32)
+    dtime = take(np.int64 if flags & FLAG_TIME64 else np.int32, p)
+
+    if flags & FLAG_TIME64:
+        time = _delta_decode(dtime, offsets)
+    else:
+        time = _delta_decode(dtime, offsets) + np.repeat(base_time, np.diff(offsets))
+
+    scale = h["coord_scale"]
+    return TrackStore(
+        sids=strings[sid_idx] if n else np.array([], dtype="U"),
+        names=strings[name_idx] if n else np.array([], dtype="U"),
+        seasons=seasons,
+        offsets=offsets,
+        lat=(lat_q / scale).astype(np.float32),
+        lon=(lon_q / scale).astype(np.float32),
+        wind=wind,
+        time=time.astype(np.int64),
+    )
+
+
+def read_binary(path: str) -> TrackStore:
+    """Memory-maps an .htrk file and decodes it."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decode(mm)
@@ -0,0 +1,176 @@
+import os
+from array import array
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+DEFAULT_TRACKS_PATH = os.path.join(os.path.dirname(__file__), "../../data/processed/hurricane_tracks.npz")
+
+NAT = np.iinfo(np.int64).min  # Missing/unparseable ISO_TIME
+
+
+def _epoch_seconds(times: List[str]) -> np.ndarray:
+    """Vectorized ISO_TIME -> int64 epoch seconds, NAT for bad values."""
+    try:
+        return np.array(times, dtype="datetime64[s]").astype(np.int64)
+    except ValueError:
+        out = np.empty(len(times), dtype=np.int64)
+        for i, t in enumerate(times):
+            try:
+                out[i] = np.datetime64(t, "s").astype(np.int64)
+            except ValueError:
+                out[i] = NAT
+        return out
+
+
+class TrackStore:
+    """
+    Columnar store for hurricane tracks.
+    Storm i owns points offsets[i]:offsets[i + 1] of the lat/lon/wind/time columns.
+    """
+
+    _FIELDS = ("sids", "names", "seasons", "offsets", "lat", "lon", "wind", "time")
+
+    def __init__(self, sids: np.ndarray, names: np.ndarray, seasons: np.ndarray,
+                 offsets: np.ndarray, lat: np.ndarray, lon: np.ndarray,
+                 wind: np.ndarray, time: np.ndarray):
+        self.sids = sids
+        self.names = names
+        self.seasons = seasons
+        self.offsets = offsets
+        self.lat = lat
+        self.lon = lon
+        self.wind = wind
+        self.time = time
+
+    @classmethod
+    def from_storms(cls, storms: Iterable[Tuple[str, str, int, List[Dict[str, Any]]]]) -> "TrackStore":
+        """
+        Builds a store from (sid, name, season, points) tuples, e.g. process_hurricanes.iter_storms().
+        Points are copied into compact typed buffers as each storm arrives.
+        """
+        sids, names, seasons = [], [], array("h")
+        offsets = array("q", [0])
+        lat, lon, wind, time = array("f"), array("f"), array("f"), array("q")
+
+        for sid, name, season, points in storms:
+            sids.append(sid)
+            names.append(name)
+            seasons.append(season)
+            lat.extend(p["lat"] for p in points)
+            lon.extend(p["lon"] for p in points)
+            wind.extend(p["wind"] for p in points)
+            time.extend(_epoch_seconds([p["time"] for p in points]).tolist())
+            offsets.append(len(lat))
+
+        return cls(
+            sids=np.array(sids, dtype="U"),
+            names=np.array(names, dtype="U"),
+            seasons=np.frombuffer(seasons, dtype=np.int16).copy(),
+            offsets=np.frombuffer(offsets, dtype=np.int64).copy(),
+            lat=np.frombuffer(lat, dtype=np.float32).copy(),
+            lon=np.frombuffer(lon, dtype=np.float32).copy(),
+            wind=np.frombuffer(wind, dtype=np.float32).copy(),
+            time=np.frombuffer(time, dtype=np.int64).copy(),
+        )
+
+    def __len__(self) -> int:
+        return len(self.sids)
+
+    @property
+    def n_points(self) -> int:
+        return len(self.lat)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, f).nbytes for f in self._FIELDS)
+
+    def storm_index(self) -> np.ndarray:
+        """Storm index for every point."""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.offsets))
+
+    def filter_seasons(self, start: Optional[int] = None, end: Optional[int] = None) -> "TrackStore":
+        """Returns a new store with storms whose season is within [start, end]."""
+        keep = np.ones(len(self), dtype=bool)
+        if start is not None:
+            keep &= self.seasons >= start
+        if end is not None:
+            keep &= self.seasons <= end
+        return self.take(keep, np.repeat(keep, np.diff(self.offsets)))
+
+    def take(self, storm_mask: np.ndarray, point_mask: np.ndarray) -> "TrackStore":
+        """
+        Returns a new store with the selected storms and points.
+        Points of dropped storms must be dropped too.
+        """
+        storm_of_point = self.storm_index()[point_mask]
+        lengths = np.bincount(storm_of_point, minlength=len(self))[storm_mask]
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        return TrackStore(
+            sids=self.sids[storm_mask], names=self.names[storm_mask], seasons=self.seasons[storm_mask],
+            offsets=offsets,
+            lat=self.lat[point_mask], lon=self.lon[point_mask],
+            wind=self.wind[point_mask], time=self.time[point_mask],
+        )
+
+    def segments(self) -> Dict[str, np.ndarray]:
+        """
+        Every consecutive point pair within a storm, as parallel arrays.
+        Wind/time are taken from the segment's start point.
+        """
+        n = self.n_points
+        starts = np.ones(max(n - 1, 0), dtype=bool)
+        # The last point of each storm does not start a segment
+        ends = self.offsets[1:-1] - 1
+        starts[ends[(ends >= 0) & (ends < n - 1)]] = False
+        idx = np.flatnonzero(starts)
+
+        return {
+            "storm": self.storm_index()[idx],
+            "lon0": self.lon[idx], "lat0": self.lat[idx],
+            "lon1": self.lon[idx + 1], "lat1": self.lat[idx + 1],
+            "wind": self.wind[idx],
+            "time": self.time[idx],
+        }
+
+    def segment_features(self) -> Iterator[Dict[str, Any]]:
+        """Yields GeoJSON LineString features in the process_hurricanes.py layout."""
+        seg = self.segments()
+        coords = np.round(np.stack([seg["lon0"], seg["lat0"], seg["lon1"], seg["lat1"]], axis=1)
+                          .astype(np.float64), 4).tolist()
+        wind = np.round(seg["wind"].astype(np.float64), 1).tolist()
+        times = np.char.replace(np.datetime_as_string(seg["time"].astype("datetime64[s]")), "T", " ").tolist()
+        sids = self.sids[seg["storm"]].tolist()
+        names = self.names[seg["storm"]].tolist()
+
+        for (lon0, lat0, lon1, lat1), w, t, sid, name in zip(coords, wind, times, sids, names):
+            yield {
+                "type": "Feature",
+                "geometry": {
+                    "type": "LineString",
+                    "coordinates": [[lon0, lat0], [lon1, lat1]]
+                },
+                "properties": {"sid": sid, "name": name, "wind": w, "time": t}
+            }
+
+    def save(self, path: str):
+        """Writes the store as an uncompressed .npz archive."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        np.savez(path, **{f: getattr(self, f) for f in self._FIELDS})
+
+    @classmethod
+    def load(cls, path: str) -> "TrackStore":
+        with np.load(path) as archive:
+            return cls(**{f: archive[f] for f in cls._FIELDS})
+
+
+@lru_cache(maxsize=4)
+def load_track_store(path: str = DEFAULT_TRACKS_PATH) -> TrackStore:
+    """
+    Process-wide loader for the backend.
+    The .npz is written by scripts/process_hurricanes.py --store.
+    """
+    return TrackStore.load(path)
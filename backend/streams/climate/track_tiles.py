@@ -0,0 +1,173 @@
+"""
+Level-of-detail tiles for hurricane tracks.
+
+Tiles follow Cesium's GeographicTilingScheme: zoom z has 2^(z+1) x 2^z tiles of
+180/2^z degrees, x counted east from -180 and y counted south from +90.
+Each zoom level uses tracks simplified with Douglas-Peucker to about one pixel
+of a 256px tile, so low zooms stay small while deep zooms keep full detail.
+"""
+import json
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from typing import Dict, Any, List
+
+import numpy as np
+
+from streams.climate.track_store import TrackStore
+
+TILE_PIXELS = 256
+MAX_ZOOM = 5
+INDEX_FILE = "index.json"
+
+
+def tile_size_deg(z: int) -> float:
+    return 180.0 / (1 << z)
+
+
+def tile_xy(lon: np.ndarray, lat: np.ndarray, z: int):
+    """Vectorized lon/lat -> tile x/y at zoom z."""
+    size = tile_size_deg(z)
+    x = np.clip(np.floor((np.asarray(lon, dtype=np.float64) + 180.0) / size), 0, (2 << z) - 1).astype(np.int64)
+    y = np.clip(np.floor((90.0 - np.asarray(lat, dtype=np.float64)) / size), 0, (1 << z) - 1).astype(np.int64)
+    return x, y
+
+
+def douglas_peucker(lon: np.ndarray, lat: np.ndarray, tolerance: float) -> np.ndarray:
+    """Returns a keep-mask for one polyline; endpoints are always kept."""
+    n = len(lon)
+    keep = np.zeros(n, dtype=bool)
+    if n == 0:
+        return keep
+    keep[0] = keep[-1] = True
+    pts = np.stack([lon, lat], axis=1).astype(np.float64)
+
+    stack = [(0, n - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        a, b = pts[first], pts[last]
+        inner = pts[first + 1:last]
+        ab = b - a
+        length = np.hypot(*ab)
+        if length == 0:
+            dist = np.hypot(*(inner - a).T)
+        else:
+            dist = np.abs(ab[0] * (inner[:, 1] - a[1]) - ab[1] * (inner[:, 0] - a[0])) / length
+        i = int(np.argmax(dist))
+        if dist[i] > tolerance:
+            split = first + 1 + i
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return keep
+
+
+def simplify(store: TrackStore, tolerance: float) -> TrackStore:
+    """Douglas-Peucker simplification of every storm in the store."""
+    point_mask = np.zeros(store.n_points, dtype=bool)
+    for i in range(len(store)):
+        lo, hi = store.offsets[i], store.offsets[i + 1]
+        point_mask[lo:hi] = douglas_peucker(store.lon[lo:hi], store.lat[lo:hi], tolerance)
+    return store.take(np.ones(len(store), dtype=bool), point_mask)
+
+
+def _segment_tiles(seg: Dict[str, np.ndarray], z: int) -> List[List[tuple]]:
+    """Tiles touched by each segment's bounding box (endpoint tiles for antimeridian crossings)."""
+    x0, y0 = tile_xy(seg["lon0"], seg["lat0"], z)
+    x1, y1 = tile_xy(seg["lon1"], seg["lat1"], z)
+    wraps = np.abs(seg["lon1"] - seg["lon0"]) > 180
+
+    out = []
+    for ax, ay, bx, by, wrap in zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist(), wraps.tolist()):
+        if (ax, ay) == (bx, by):
+            out.append([(ax, ay)])
+        elif wrap:
+            out.append([(ax, ay), (bx, by)])
+        else:
+            out.append([(x, y) for x in range(min(ax, bx), max(ax, bx) + 1)
+                        for y in range(min(ay, by), max(ay, by) + 1)])
+    return out
+
+
+def build_tiles(store: TrackStore, out_dir: str, max_zoom: int = MAX_ZOOM) -> Dict[str, Any]:
+    """
+    Writes out_dir/{z}/{x}/{y}.json FeatureCollections plus out_dir/index.json.
+    Features keep the per-segment layout of hurricanes_baseline.json, plus an id
+    ("{sid}:{segment}") that is stable within a zoom: a segment crossing a tile
+    edge is written to every tile it touches, and clients dedupe on the id.
+    The tree is built in a sibling directory and swapped in whole, so tiles from
+    an earlier build never outlive it. Returns the manifest.
+    """
+    out_dir = os.path.abspath(out_dir)
+    parent = os.path.dirname(out_dir)
+    os.makedirs(parent, exist_ok=True)
+    staging = tempfile.mkdtemp(prefix=".tiles-", dir=parent)
+    os.chmod(staging, 0o755)  # mkdtemp is owner-only; the tree is served
+    try:
+        manifest = _write_tiles(store, staging, max_zoom)
+        _swap_dir(staging, out_dir)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return manifest
+
+
+def _swap_dir(staging: str, out_dir: str):
+    """Moves staging to out_dir; an existing out_dir is moved aside first, then deleted."""
+    if not os.path.exists(out_dir):
+        os.replace(staging, out_dir)
+        return
+    retired = tempfile.mkdtemp(prefix=".tiles-old-", dir=os.path.dirname(out_dir))
+    os.replace(out_dir, os.path.join(retired, "tiles"))
+    os.replace(staging, out_dir)
+    shutil.rmtree(retired, ignore_errors=True)
+
+
+def _write_tiles(store: TrackStore, out_dir: str, max_zoom: int) -> Dict[str, Any]:
+    manifest = {
+        "scheme": "geographic",
+        "tile_pixels": TILE_PIXELS,
+        "max_zoom": max_zoom,
+        "storms": len(store),
+        "zooms": {},
+    }
+
+    for z in range(max_zoom + 1):
+        tolerance = tile_size_deg(z) / TILE_PIXELS
+        # Full resolution at the deepest zoom
+        level = store if z == max_zoom else simplify(store, tolerance)
+        seg = level.segments()
+
+        # Segments are grouped by storm; number them from 0 within each storm
+        ordinal = np.arange(len(seg["storm"])) - np.searchsorted(seg["storm"], seg["storm"])
+        ids = [f"{sid}:{i}" for sid, i in zip(level.sids[seg["storm"]].tolist(), ordinal.tolist())]
+
+        tiles = defaultdict(list)
+        features = level.segment_features()
+        for feature, feature_id, touched in zip(features, ids, _segment_tiles(seg, z)):
+            encoded = json.dumps({"id": feature_id, **feature})
+            for xy in touched:
+                tiles[xy].append(encoded)
+
+        entries = []
+        for (x, y), encoded in sorted(tiles.items()):
+            path = os.path.join(out_dir, str(z), str(x), f"{y}.json")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            body = '{"type": "FeatureCollection", "features": [' + ', '.join(encoded) + ']}'
+            with open(path, 'w') as f:
+                f.write(body)
+            entries.append([x, y, len(encoded), len(body)])
+
+        manifest["zooms"][str(z)] = {
+            "tolerance_deg": tolerance if z < max_zoom else 0.0,
+            "points": level.n_points,
+            "segments": len(seg["lon0"]),
+            "tiles": entries,
+        }
+
+    with open(os.path.join(out_dir, INDEX_FILE), 'w') as f:
+        json.dump(manifest, f)
+    return manifest
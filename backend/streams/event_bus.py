@@ -0,0 +1,108 @@
+import asyncio
+import logging
+from collections import deque
+from typing import Dict, Any, Deque, Optional, Set
+
+from models.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Channels (see docs/architecture/4_stream_design.md)
+ALERT_TRIGGER = "alert_trigger"
+STREAM_UPDATE = "stream_update"
+WORLD_HEARTBEAT = "world_heartbeat"
+RESYNC = "resync"
+
+class Subscriber:
+    """
+    One connected client.
+    Alert events go through a bounded queue; overflowing it closes the subscriber
+    (the client must resync). Stream updates are coalesced per stream, so a slow
+    client only ever holds the latest pending metrics for each stream.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self.queue: Deque[bytes] = deque()
+        self.updates: Dict[str, Dict[str, Any]] = {}
+        self.closed = False
+        self.coalesced = 0
+        self._wake = asyncio.Event()
+
+    def offer(self, encoded: bytes, update_key: Optional[str] = None, update: Optional[Dict[str, Any]] = None):
+        if self.closed:
+            return
+        if update_key is not None:
+            pending = self.updates.get(update_key)
+            if pending is None:
+                self.updates[update_key] = {**update, "metrics": dict(update.get("metrics", {}))}
+            else:
+                pending["metrics"].update(update.get("metrics", {}))
+                pending.update({k: v for k, v in update.items() if k != "metrics"})
+                self.coalesced += 1
+        elif len(self.queue) >= self.maxsize:
+            self.closed = True
+        else:
+            self.queue.append(encoded)
+        self._wake.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Next encoded event (UTF-8 JSON), alerts before coalesced updates.
+        Returns None on timeout (send a heartbeat) or once closed and drained.
+        """
+        while not self.queue and not self.updates:
+            if self.closed:
+                return None
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+
+        if self.queue:
+            return self.queue.popleft()
+        key = next(iter(self.updates))
+        return dumps({"channel": STREAM_UPDATE, **self.updates.pop(key)})
+
+    def close(self):
+        self.closed = True
+        self._wake.set()
+
+class EventBus:
+    """In-process fan-out of scan results to every connected client."""
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.subscribers: Set[Subscriber] = set()
+        self.stats = {"published": 0, "dropped_subscribers": 0}
+
+    def subscribe(self) -> Subscriber:
+        subscriber = Subscriber(self.queue_size)
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        subscriber.close()
+        self.subscribers.discard(subscriber)
+
+    def publish(self, channel: str, payload: Dict[str, Any], update_key: Optional[str] = None):
+        """
+        Encodes once and offers the event to every subscriber without blocking.
+        update_key marks coalescible stream updates.
+        """
+        encoded = dumps({"channel": channel, **payload})
+        self.stats["published"] += 1
+        for subscriber in list(self.subscribers):
+            subscriber.offer(encoded, update_key, payload if update_key is not None else None)
+            if subscriber.closed:
+                logger.warning("Dropping slow event subscriber (queue full)")
+                self.stats["dropped_subscribers"] += 1
+                self.subscribers.discard(subscriber)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "subscribers": len(self.subscribers),
+            "coalesced_updates": sum(s.coalesced for s in self.subscribers),
+        }
@@ -1,21 +1,202 @@
 import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any
+import random
+import time
+from typing import Dict, List, Any, Awaitable, Callable, Optional
+from streams.base_stream import BaseStream
 from streams.climate.mock_monsoon_client import MockMonsoonClient
-from models.stream_models import Alert, AlertSeverity
+from streams.climate.monsoon_stream import MonsoonStream
+from streams.climate.monsoon_alerts import AlertRuleEngine
+from streams.event_bus import EventBus, ALERT_TRIGGER, STREAM_UPDATE
+from models.stream_models import Alert, AlertDiff, StreamData, StreamStatus, WorldState
 
 logger = logging.getLogger(__name__)
 
+class ScheduledStream:
+    """
+    Schedule + bookkeeping for one periodically scanned stream.
+    Delay between scans is interval +/- jitter, doubled per consecutive failure up to max_backoff.
+    """
+
+    def __init__(self, name: str, scan: Callable[[], Awaitable[Dict[str, Any]]],
+                 interval: float = 60.0, jitter: float = 0.1, max_backoff: float = 600.0):
+        self.name = name
+        self.scan = scan
+        self.interval = interval
+        self.jitter = jitter
+        self.max_backoff = max_backoff
+        self.failures = 0
+        self.stats = {
+            "scans": 0,
+            "skips": 0,
+            "errors": 0,
+            "last_scan_at": None,
+            "last_latency_ms": None,
+            "avg_latency_ms": None,
+        }
+
+    def next_delay(self) -> float:
+        delay = min(self.interval * (2 ** self.failures), max(self.max_backoff, self.interval))
+        return max(0.0, delay * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+    def record(self, latency: float, skipped: bool = False, error: bool = False):
+        stats = self.stats
+        latency_ms = latency * 1000
+        stats["scans"] += 1
+        stats["last_scan_at"] = time.time()
+        stats["last_latency_ms"] = round(latency_ms, 3)
+        prev = stats["avg_latency_ms"]
+        # Exponential moving average keeps the figure stable across long uptimes
+        stats["avg_latency_ms"] = round(latency_ms if prev is None else 0.8 * prev + 0.2 * latency_ms, 3)
+        if skipped:
+            stats["skips"] += 1
+        if error:
+            stats["errors"] += 1
+            self.failures += 1
+        else:
+            self.failures = 0
+
 class StreamManager:
     """
     Orchestrates the data gathering for all streams.
     Manages the 'World State' and triggers the Alert Engine.
     """
-    
-    def __init__(self):
+
+    def __init__(self, monsoon_interval: float = 60.0):
         self.monsoon_client = MockMonsoonClient()
+        self.alert_engine = AlertRuleEngine()
         self.active_alerts: List[Alert] = []
+        self.last_diff = AlertDiff()
+        self.world_state = WorldState(timestamp=time.time())
         self.is_running = False
+        self.registry: Dict[str, BaseStream] = {}
+        self.timeouts: Dict[str, float] = {}
+        self.evaluators: Dict[str, Callable[[StreamData], List[Alert]]] = {}
+        self.streams: Dict[str, ScheduledStream] = {}
+        self._fingerprints: Dict[str, str] = {}
+        self._last_results: Dict[str, Dict[str, Any]] = {}
+        self._tasks: List[asyncio.Task] = []
+        self.events = EventBus()
+
+        self.register(MonsoonStream(self.monsoon_client), interval=monsoon_interval,
+                      evaluate=self._evaluate_monsoon_alerts)
+
+    def register(self, stream: BaseStream, interval: float = 60.0, timeout: float = 10.0,
+                 evaluate: Optional[Callable[[StreamData], List[Alert]]] = None):
+        """Adds a BaseStream to the registry with its own schedule, timeout and alert rules."""
+        stream_id = stream.stream_id
+        self.registry[stream_id] = stream
+        self.timeouts[stream_id] = timeout
+        if evaluate:
+            self.evaluators[stream_id] = evaluate
+        self.streams[stream_id] = ScheduledStream(stream_id, lambda: self.scan_stream(stream_id), interval=interval)
+
+    @staticmethod
+    def _fingerprint(payload: Any) -> str:
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _apply_alerts(self, stream_id: str, alerts: List[Alert]) -> AlertDiff:
+        """
+        Replaces one stream's alerts and returns what changed.
+        Alerts that stay active keep their original created_at.
+        """
+        current = {a.id: a for a in self.active_alerts if stream_id in a.stream_ids}
+        incoming = {a.id: a for a in alerts}
+
+        new = [a for a_id, a in incoming.items() if a_id not in current]
+        resolved = [a for a_id, a in current.items() if a_id not in incoming]
+        kept = [a.model_copy(update={"created_at": current[a.id].created_at}) if a.id in current else a
+                for a in alerts]
+
+        others = [a for a in self.active_alerts if stream_id not in a.stream_ids]
+        self.active_alerts = others + kept
+        self.world_state.alerts = self.active_alerts
+        diff = AlertDiff(new=new, resolved=resolved)
+        if new or resolved:
+            self.last_diff = diff
+        return diff
+
+    def _evaluate_monsoon_alerts(self, data: StreamData) -> List[Alert]:
+        """Runs the monsoon rule set for the focused year (national, regional and state rules)."""
+        year = data.metadata["year"]
+        return self.alert_engine.evaluate(self.monsoon_client.store, start=year, end=year, now=data.timestamp)
+
+    async def scan_stream(self, stream_id: str) -> Dict[str, Any]:
+        """
+        Scans one registered stream under its own timeout and updates the world state.
+        Alert evaluation is skipped when the stream's metrics fingerprint is unchanged.
+        Failures and timeouts are reported in the result rather than raised,
+        so one bad stream never holds back the others.
+        """
+        stream = self.registry[stream_id]
+        try:
+            data = await asyncio.wait_for(stream.scan(), timeout=self.timeouts[stream_id])
+        except asyncio.TimeoutError:
+            logger.warning(f"Stream '{stream_id}' timed out after {self.timeouts[stream_id]}s")
+            return self._mark_unavailable(stream_id, StreamStatus.DEGRADED, "timeout")
+        except Exception as e:
+            logger.exception(f"Stream '{stream_id}' scan failed")
+            return self._mark_unavailable(stream_id, StreamStatus.OFFLINE, str(e))
+
+        self._set_stream_state(stream_id, data)
+        if data.status == StreamStatus.OFFLINE:
+            logger.error(f"Stream '{stream_id}' scan failed: No data returned")
+            return {"status": "error", "stream": data}
+
+        fingerprint = self._fingerprint([data.status, data.metrics, data.metadata])
+        if self._fingerprints.get(stream_id) == fingerprint and stream_id in self._last_results:
+            logger.debug(f"Stream '{stream_id}' unchanged; skipping alert evaluation.")
+            return {**self._last_results[stream_id], "stream": data, "skipped": True, "diff": AlertDiff()}
+
+        evaluate = self.evaluators.get(stream_id)
+        alerts = evaluate(data) if evaluate else []
+        diff = self._apply_alerts(stream_id, alerts)
+        self._fingerprints[stream_id] = fingerprint
+        if diff.new or diff.resolved:
+            self.events.publish(ALERT_TRIGGER, {
+                "stream_id": stream_id,
+                "new": [a.model_dump(mode="json") for a in diff.new],
+                "resolved": [a.id for a in diff.resolved],
+            })
+        logger.info(f"Stream '{stream_id}' scan complete. {len(alerts)} active alerts "
+                    f"({len(diff.new)} new, {len(diff.resolved)} resolved).")
+
+        result = {
+            "status": data.status.value,
+            "alerts": [a for a in self.active_alerts if stream_id in a.stream_ids],
+        }
+        self._last_results[stream_id] = result
+        return {**result, "stream": data, "skipped": False, "diff": diff}
+
+    def _mark_unavailable(self, stream_id: str, status: StreamStatus, error: str) -> Dict[str, Any]:
+        previous = self.world_state.streams.get(stream_id)
+        # Keep the last good metrics so the snapshot stays usable while the stream recovers
+        self._set_stream_state(stream_id, StreamData(
+            stream_id=stream_id,
+            timestamp=time.time(),
+            status=status,
+            metrics=previous.metrics if previous else {},
+            metadata={**(previous.metadata if previous else {}), "error": error},
+        ))
+        return {"status": "error", "error": error}
+
+    def _set_stream_state(self, stream_id: str, data: StreamData):
+        """Stores a stream's latest data and pushes changed metrics/status to subscribers."""
+        previous = self.world_state.streams.get(stream_id)
+        self.world_state.streams[stream_id] = data
+        self.world_state.timestamp = data.timestamp
+
+        changed = {k: v for k, v in data.metrics.items() if previous is None or previous.metrics.get(k) != v}
+        if changed or previous is None or previous.status != data.status:
+            self.events.publish(STREAM_UPDATE, {
+                "stream_id": stream_id,
+                "status": data.status.value,
+                "timestamp": data.timestamp,
+                "metrics": changed,
+            }, update_key=stream_id)
 
     async def scan_monsoon(self) -> Dict[str, Any]:
         """
@@ -23,60 +204,81 @@ class StreamManager:
         Triggers alerts if thresholds are crossed.
         """
         logger.info("Scanning Monsoon Stream...")
-        metrics = self.monsoon_client.get_current_metrics()
-        
-        if not metrics:
-            logger.error("Monsoon scan failed: No data returned")
+        result = await self.scan_stream("climate")
+        if result["status"] == "error":
             return {"status": "error"}
+        return {**result, "metrics": result["stream"].metadata}
 
-        deviation = metrics["deviation_percent"]
-        onset_delay = self.monsoon_client.get_onset_delay()
-        
-        # Alert Logic
-        new_alerts = []
-        
-        # 1. Rainfall Deficit Alert
-        if deviation < -10:
-            alert = Alert(
-                id=f"alert_monsoon_deficit_{metrics['year']}",
-                stream_ids=["climate"],
-                severity=AlertSeverity.CRITICAL if deviation < -15 else AlertSeverity.HIGH,
-                message=f"Critical Monsoon Deficit: {deviation}% below LPA. Agricultural impact imminent.",
-                created_at=1700000000.0, # Mock ts
-                context={"deviation": deviation, "impact_est": "High"}
-            )
-            new_alerts.append(alert)
-        
-        # 2. Delayed Onset Alert
-        if onset_delay > 7:
-             alert = Alert(
-                id=f"alert_onset_delay_{metrics['year']}",
-                stream_ids=["climate"],
-                severity=AlertSeverity.MEDIUM,
-                message=f"Monsoon Onset Delayed by {onset_delay} days. Sowing windows at risk.",
-                created_at=1700000000.0,
-                context={"delay_days": onset_delay}
-            )
-             new_alerts.append(alert)
-
-        self.active_alerts = new_alerts
-        logger.info(f"Monsoon scan complete. {len(new_alerts)} active alerts.")
-        
-        return {
-            "status": "healthy",
-            "metrics": metrics,
-            "alerts": new_alerts
-        }
+    async def scan_all(self) -> WorldState:
+        """
+        Scans every registered stream concurrently and returns the merged world state.
+        Wall time tracks the slowest stream (bounded by its timeout), not the sum.
+        """
+        start = time.perf_counter()
+        await asyncio.gather(*(self.run_stream_once(s) for s in self.streams.values()))
+        self.world_state.scan_latency_ms = round((time.perf_counter() - start) * 1000, 3)
+        self.world_state.timestamp = time.time()
+        return self.get_world_state()
+
+    def get_world_state(self) -> WorldState:
+        """Snapshot copy of the current world state."""
+        return self.world_state.model_copy(update={
+            "streams": dict(self.world_state.streams),
+            "alerts": list(self.active_alerts),
+        })
+
+    async def run_stream_once(self, stream: ScheduledStream) -> Optional[Dict[str, Any]]:
+        """Runs one scheduled scan and records latency/skip/error stats."""
+        start = time.perf_counter()
+        try:
+            result = await stream.scan()
+        except Exception:
+            logger.exception(f"Scan of stream '{stream.name}' failed")
+            stream.record(time.perf_counter() - start, error=True)
+            return None
+        error = result.get("status") == "error"
+        stream.record(time.perf_counter() - start, skipped=bool(result.get("skipped")), error=error)
+        return result
+
+    async def _stream_loop(self, stream: ScheduledStream):
+        while self.is_running:
+            await self.run_stream_once(stream)
+            await asyncio.sleep(stream.next_delay())
+
+    def start(self):
+        """Starts one scheduler task per stream (called from the FastAPI lifespan)."""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._tasks = [asyncio.create_task(self._stream_loop(s), name=f"scan:{s.name}")
+                       for s in self.streams.values()]
+        logger.info(f"Stream scheduler started for: {', '.join(self.streams)}")
+
+    async def stop(self):
+        self.is_running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
 
     async def start_background_loop(self):
         """
-        Starts the background orchestration loop.
-        (For demo, we might just call scan on demand, but this structure allows polling)
+        Starts the background orchestration loop and runs until stop() is called.
         """
-        self.is_running = True
-        while self.is_running:
-            await self.scan_monsoon()
-            await asyncio.sleep(60) # Scan every minute for demo purposes
+        self.start()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Scheduler state and per-stream scan stats."""
+        return {
+            "running": self.is_running,
+            "active_alerts": len(self.active_alerts),
+            "events": self.events.get_stats(),
+            "streams": {
+                name: {"interval_s": s.interval, "consecutive_failures": s.failures, **s.stats}
+                for name, s in self.streams.items()
+            },
+        }
 
 # Global Instance
 stream_manager = StreamManager()
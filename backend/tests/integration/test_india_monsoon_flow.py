@@ -56,14 +56,14 @@ async def test_2019_drought_flow():
     print(f"\nDEBUG: Analyzing Strategy: '{strategy}'")
     analysis = oracle.analyze_strategy(strategy, investment_inr=investment)
     
-    print(f"DEBUG: Identified Mechanism: {analysis['mechanism']}")
-    print(f"DEBUG: Feasibility: {analysis['feasibility_score']}")
-    print(f"DEBUG: Policy Matches: {analysis['policy_context']['existing_programs']}")
+    print(f"DEBUG: Identified Mechanism: {analysis.mechanism}")
+    print(f"DEBUG: Feasibility: {analysis.feasibility_score}")
+    print(f"DEBUG: Policy Matches: {analysis.policy_context.existing_programs}")
     
     # VERIFY ORACLE RESPONSE
-    assert analysis["mechanism"] == "Monsoon Cloud Seeding (Coughlin-style)"
-    assert analysis["feasibility_score"] > 0.5
-    assert "Ministry of Earth Sciences" in str(analysis["policy_context"])
-    assert "IIT Bombay" in str(analysis["research_vectors"])
+    assert analysis.mechanism == "Monsoon Cloud Seeding (Coughlin-style)"
+    assert analysis.feasibility_score > 0.5
+    assert "Ministry of Earth Sciences" in str(analysis.policy_context)
+    assert "IIT Bombay" in str(analysis.research_vectors)
     
     print("--- ✅ TEST PASS: 2019 Flow Verified ---")
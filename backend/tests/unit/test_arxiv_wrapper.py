@@ -0,0 +1,240 @@
+import asyncio
+import json
+import sys
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.arxiv_wrapper import ArxivWrapper, FeedParser
+from reasoning.llm_engine import OracleEngine
+from reasoning.research_aggregator import ArxivSource, ResearchAggregator
+
+
+def atom_feed(query: str, n: int) -> bytes:
+    entries = "".join(f"""
+  <entry>
+    <title>Paper {i} on {query}</title>
+    <summary>Abstract {i}</summary>
+    <published>2023-0{i % 9 + 1}-01T00:00:00Z</published>
+    <author><name>Author {i}</name></author>
+  </entry>""" for i in range(n))
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{entries}</feed>'.encode()
+
+
+class StubArxiv:
+    """Local stand-in for export.arxiv.org with configurable latency and failures."""
+
+    def __init__(self, delay: float = 0.0, entry_delay: float = 0.0):
+        self.delay = delay
+        self.entry_delay = entry_delay
+        self.status = 200
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+                server.requests.append((time.monotonic(), params["search_query"][0]))
+                time.sleep(server.delay)
+                body = atom_feed(params["search_query"][0], int(params["max_results"][0]))
+                self.send_response(server.status)
+                self.send_header("Content-Type", "application/atom+xml")
+                if not server.entry_delay:
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                # Trickle one entry at a time (body ends when the connection closes)
+                self.end_headers()
+                for i, part in enumerate(body.split(b"</entry>")):
+                    if i:
+                        time.sleep(server.entry_delay)
+                    self.wfile.write(part + (b"</entry>" if b"<entry>" in part else b""))
+                    self.wfile.flush()
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/query"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def stub():
+    server = StubArxiv()
+    yield server
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_queries_share_one_request(stub, tmp_path):
+    stub.delay = 0.1
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    results = await asyncio.gather(*(client.search_papers("cloud seeding", 3) for _ in range(5)))
+    await client.aclose()
+
+    assert len(stub.requests) == 1
+    assert all(r == results[0] for r in results)
+    assert results[0][0]["title"] == "Paper 0 on all:cloud seeding"
+    assert client.stats["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_results_persist_to_disk(stub, tmp_path):
+    first = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    papers = await first.search_papers("monsoon", 2)
+    await first.aclose()
+
+    second = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    assert await second.search_papers("  Monsoon ", 2) == papers
+    await second.aclose()
+    assert len(stub.requests) == 1 and second.stats["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_upstream_falls_back_to_stale_cache(stub, tmp_path):
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), ttl=0, timeout=0.2, min_interval=0)
+    papers = await client.search_papers("heat", 2)
+
+    stub.delay = 1.0
+    start = time.perf_counter()
+    assert await client.search_papers("heat", 2) == papers
+    assert time.perf_counter() - start < 0.8
+    assert client.stats["stale_served"] == 1
+
+    # Nothing cached: an empty list rather than an exception
+    stub.delay, stub.status = 0, 503
+    assert await client.search_papers("uncached", 2) == []
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_upstream_requests_respect_rate_limit(stub, tmp_path):
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0.2)
+    await asyncio.gather(*(client.search_papers(f"query {i}", 1) for i in range(3)))
+    await client.aclose()
+
+    times = sorted(t for t, _ in stub.requests)
+    assert len(times) == 3
+    assert all(b - a >= 0.18 for a, b in zip(times, times[1:]))
+
+
+@pytest.mark.asyncio
+async def test_papers_are_yielded_while_the_feed_downloads(stub, tmp_path):
+    stub.entry_delay = 0.1
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+
+    start = time.perf_counter()
+    arrivals = []
+    async for paper in client.iter_papers("monsoon", 5):
+        arrivals.append(time.perf_counter() - start)
+    await client.aclose()
+
+    assert len(arrivals) == 5
+    assert arrivals[0] < 0.25 < arrivals[-1]
+    # The completed feed was cached
+    assert client.cache.get("monsoon|5") is not None
+
+
+def test_feed_parser_detaches_finished_entries():
+    parser = FeedParser()
+    feed = atom_feed("bulk", 500)
+    papers = []
+    for i in range(0, len(feed), 1000):
+        papers.extend(parser.feed(feed[i:i + 1000]))
+    assert len(papers) == 500
+    assert len(parser._root) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_analysis_emits_late_arxiv_papers(stub, tmp_path):
+    stub.delay = 0.3
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    engine = OracleEngine(demo_pacing=0, arxiv=client)
+    engine.research.budget = 0.1
+    events = [json.loads(line) async for line in engine.stream_analysis("cloud seeding")]
+    await client.aclose()
+
+    stages = [e.get("stage") for e in events]
+    papers = [e for e in events if e["status"] == "paper"]
+    # Local papers make the budget; arXiv papers stream in afterwards
+    assert stages.index("research_fetch") < events.index(papers[0])
+    assert len(papers) == 5 and papers[0]["source"] == "arxiv"
+
+    final = events[-1]
+    assert final["status"] == "oracle_analysis"
+    assert final["data"]["research_sources"]["arxiv"]["status"] == "ok"
+    assert final["data"]["research_sources"]["arxiv"]["latency_ms"] >= 300
+
+
+@pytest.mark.asyncio
+async def test_stream_analysis_emits_arxiv_papers_while_the_feed_downloads(stub, tmp_path):
+    stub.delay, stub.entry_delay = 0.1, 0.1
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    engine = OracleEngine(demo_pacing=0, arxiv=client)
+    engine.research.budget = 0.05
+    start = time.perf_counter()
+    arrivals = []
+    async for line in engine.stream_analysis("cloud seeding"):
+        event = json.loads(line)
+        if event["status"] == "paper" and event["source"] == "arxiv":
+            arrivals.append(time.perf_counter() - start)
+    await client.aclose()
+
+    # One "paper" event per entry, not one batch after the feed ends
+    assert len(arrivals) == 5
+    assert arrivals[0] < 0.3 < arrivals[-1]
+
+
+@pytest.mark.asyncio
+async def test_arxiv_source_deadline_serves_stale_cache(stub, tmp_path):
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), ttl=0, min_interval=0)
+    papers = await client.search_papers("heat", 2)
+
+    stub.delay = 1.0
+    aggregator = ResearchAggregator([ArxivSource(client, deadline=0.2)], budget=0.5)
+    result = await aggregator.gather("heat", 2)
+    await client.aclose()
+
+    assert result["sources"]["arxiv"]["status"] == "ok"
+    assert [p["title"] for p in result["papers"]] == [p["title"] for p in papers]
+    assert client.stats["stale_served"] == 1
+
+
+def test_loop_change_closes_the_previous_client(stub, tmp_path):
+    client = ArxivWrapper(stub.url, cache_dir=str(tmp_path), min_interval=0)
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever, daemon=True)
+    thread.start()
+    try:
+        asyncio.run_coroutine_threadsafe(client.search_papers("monsoon", 2), other).result(timeout=5)
+        first = client._client
+
+        async def search_on_a_new_loop():
+            papers = await client.search_papers("drought", 2)
+            assert client._client is not first
+            await client.aclose()
+            return papers
+
+        assert len(asyncio.run(search_on_a_new_loop())) == 2
+        # The first client is closed on the loop it was created on
+        deadline = time.monotonic() + 2
+        while not first.is_closed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert first.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join()
+        other.close()
@@ -0,0 +1,87 @@
+import json
+import sys
+import os
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from main import app
+from streams.event_bus import EventBus, ALERT_TRIGGER, STREAM_UPDATE
+from streams.stream_manager import StreamManager
+
+
+@pytest.mark.asyncio
+async def test_updates_coalesce_and_alerts_keep_order():
+    bus = EventBus(queue_size=10)
+    sub = bus.subscribe()
+
+    bus.publish(STREAM_UPDATE, {"stream_id": "climate", "metrics": {"a": 1.0}}, update_key="climate")
+    bus.publish(ALERT_TRIGGER, {"new": [], "resolved": ["x"]})
+    bus.publish(STREAM_UPDATE, {"stream_id": "climate", "metrics": {"b": 2.0}}, update_key="climate")
+
+    first = json.loads(await sub.get(timeout=0.1))
+    second = json.loads(await sub.get(timeout=0.1))
+    assert first["channel"] == ALERT_TRIGGER
+    assert second == {"channel": STREAM_UPDATE, "stream_id": "climate", "metrics": {"a": 1.0, "b": 2.0}}
+    assert sub.coalesced == 1
+    assert await sub.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_dropped_without_blocking_others():
+    bus = EventBus(queue_size=2)
+    slow, fast = bus.subscribe(), bus.subscribe()
+
+    for i in range(2):
+        bus.publish(ALERT_TRIGGER, {"n": i})
+        await fast.get(timeout=0.1)
+    bus.publish(ALERT_TRIGGER, {"n": 2})
+
+    assert slow.closed and slow not in bus.subscribers
+    assert json.loads(await fast.get(timeout=0.1))["n"] == 2
+    assert bus.get_stats()["dropped_subscribers"] == 1
+
+
+@pytest.mark.asyncio
+async def test_scan_publishes_alert_diff_and_metric_deltas():
+    manager = StreamManager()
+    sub = manager.events.subscribe()
+    manager.monsoon_client.set_year(2019)
+    await manager.scan_monsoon()
+
+    messages = [json.loads(await sub.get(timeout=0.1)) for _ in range(2)]
+    channels = {m["channel"]: m for m in messages}
+    assert channels[ALERT_TRIGGER]["new"][0]["id"].startswith("alert_")
+    assert channels[STREAM_UPDATE]["metrics"]["deviation_percent"] == -14
+
+    # Unchanged data pushes nothing
+    await manager.scan_monsoon()
+    assert await sub.get(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_events_are_encoded_by_the_shared_serializer():
+    bus = EventBus()
+    sub = bus.subscribe()
+
+    bus.publish(ALERT_TRIGGER, {"severity": np.float32(0.5), "count": np.int64(3)})
+    bus.publish(STREAM_UPDATE, {"stream_id": "climate", "metrics": {"rainfall_total": np.float32(812.5)}},
+                update_key="climate")
+
+    alert, update = await sub.get(timeout=0.1), await sub.get(timeout=0.1)
+    assert isinstance(alert, bytes) and isinstance(update, bytes)
+    # numpy scalars arrive as numbers, not their str() as with json.dumps(default=str)
+    assert json.loads(alert) == {"channel": ALERT_TRIGGER, "severity": 0.5, "count": 3}
+    assert json.loads(update)["metrics"] == {"rainfall_total": 812.5}
+
+
+def test_websocket_sends_snapshot_first():
+    with TestClient(app) as client:
+        with client.websocket_connect("/api/streams/ws") as ws:
+            snapshot = json.loads(ws.receive_text())
+    assert snapshot["channel"] == "snapshot"
+    assert "climate" in snapshot["streams"]
@@ -0,0 +1,115 @@
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from scripts.fetch_idata import fetch_data
+
+
+class StandInServer:
+    """Local stand-in for the NOAA file server: ETag, Last-Modified, Range and If-Range."""
+
+    def __init__(self, body: bytes, etag: str = '"v1"'):
+        self.body = body
+        self.etag = etag
+        self.last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _respond(self, send_body):
+                server.requests.append((self.command, dict(self.headers)))
+                if self.headers.get("If-None-Match") == server.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+
+                body, status = server.body, 200
+                range_header = self.headers.get("Range")
+                if_range = self.headers.get("If-Range")
+                if range_header and (if_range is None or if_range == server.etag):
+                    start, _, end = range_header.split("=")[1].partition("-")
+                    start, end = int(start), int(end) if end else len(body) - 1
+                    body, status = body[start:end + 1], 206
+
+                self.send_response(status)
+                self.send_header("ETag", server.etag)
+                self.send_header("Last-Modified", server.last_modified)
+                self.send_header("Accept-Ranges", "bytes")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+
+            def do_HEAD(self):
+                self._respond(send_body=False)
+
+            def do_GET(self):
+                self._respond(send_body=True)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/ibtracs.csv"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def gets(self):
+        return [headers for method, headers in self.requests if method == "GET"]
+
+
+BODY = b"SID,SEASON\n" + b"".join(b"2005236N23285,2005\n" for _ in range(5000))
+
+
+@pytest.fixture
+def server():
+    s = StandInServer(BODY)
+    yield s
+    s.httpd.shutdown()
+
+
+def test_download_then_conditional_skip(server, tmp_path):
+    out = str(tmp_path / "ibtracs.csv")
+
+    assert fetch_data(server.url, out) == "downloaded"
+    assert open(out, "rb").read() == BODY
+    assert not os.path.exists(out + ".part")
+
+    assert fetch_data(server.url, out) == "not_modified"
+    assert len(server.gets()) == 1
+
+
+def test_resume_from_partial_download(server, tmp_path):
+    out = str(tmp_path / "ibtracs.csv")
+    # Simulate an interrupted run: validators recorded, first 1000 bytes on disk
+    fetch_data(server.url, out)
+    os.replace(out, out + ".part")
+    with open(out + ".part", "r+b") as f:
+        f.truncate(1000)
+    with open(out + ".part.json", "w") as f:
+        f.write('{"etag": "\\"v1\\"", "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT", '
+                f'"size": {len(BODY)}, "accept_ranges": true, "segments": 0}}')
+    os.remove(out + ".meta.json")
+
+    assert fetch_data(server.url, out) == "downloaded"
+    assert open(out, "rb").read() == BODY
+    assert server.gets()[-1]["Range"] == f"bytes=1000-{len(BODY) - 1}"
+
+
+def test_parallel_segments_and_changed_remote(server, tmp_path):
+    out = str(tmp_path / "ibtracs.csv")
+    assert fetch_data(server.url, out, segments=4) == "downloaded"
+    assert open(out, "rb").read() == BODY
+    step = -(-len(BODY) // 4)
+    assert sorted(h["Range"] for h in server.gets()) == sorted(
+        f"bytes={i * step}-{min((i + 1) * step, len(BODY)) - 1}" for i in range(4)
+    )
+
+    server.body, server.etag = BODY + b"2024001N10280,2024\n", '"v2"'
+    assert fetch_data(server.url, out, segments=4) == "downloaded"
+    assert open(out, "rb").read() == server.body
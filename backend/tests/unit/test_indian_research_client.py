@@ -0,0 +1,72 @@
+import sys
+import os
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.indian_research_client import IndianResearchClient
+
+PAPERS = [
+    {"title": "Cloud seeding trials over Solapur", "summary": "Hygroscopic seeding of monsoon clouds.",
+     "institution": "IITM Pune", "year": 2019},
+    {"title": "Cool roofs for Ahmedabad", "summary": "Heat action plan and reflective roofs.",
+     "institution": "IIPH Gandhinagar", "year": 2021},
+    {"title": "Seeding agents review", "summary": "Silver iodide versus salt flares for cloud seeding.",
+     "institution": "IIT Bombay", "year": 2022},
+    {"title": "Monsoon onset prediction", "summary": "Statistical models for Kerala onset.",
+     "institution": "IIT Delhi", "year": 2022},
+]
+
+
+def test_default_corpus_ranks_seeding_papers():
+    client = IndianResearchClient()
+    results = client.search("Monsoon Cloud Seeding (Coughlin-style) research India")
+    assert results[0]["institution"].startswith("IITM Pune")
+    assert any(r["institution"] == "IIT Bombay" for r in results)
+
+
+def test_bm25_prefers_title_matches_and_stems():
+    client = IndianResearchClient(papers=PAPERS)
+    titles = [r["title"] for r in client.search("cloud seeded")]
+    assert titles == ["Cloud seeding trials over Solapur", "Seeding agents review"]
+
+
+def test_filters_and_pagination():
+    client = IndianResearchClient(papers=PAPERS)
+    page = client.search_page("seeding monsoon cloud", institution="iit ", year_from=2020)
+    assert [r["institution"] for r in page["results"]] == ["IIT Bombay", "IIT Delhi"]
+
+    full = client.search_page("seeding monsoon cloud roofs", limit=10)["results"]
+    pages = [client.search_page("seeding monsoon cloud roofs", limit=2, offset=o)["results"] for o in (0, 2)]
+    assert [r["title"] for r in pages[0] + pages[1]] == [r["title"] for r in full]
+    assert client.search_page("seeding", offset=10)["results"] == []
+
+
+def test_total_and_ties_do_not_depend_on_page_size():
+    # Identical papers tie on score; ties rank by corpus order
+    client = IndianResearchClient(papers=PAPERS + [dict(PAPERS[3], year=y) for y in (2023, 2024, 2025)])
+    query = "monsoon onset"
+    full = client.search_page(query, limit=10)
+    assert full["total"] == 5
+    for limit in (1, 2, 3):
+        pages = [client.search_page(query, limit=limit, offset=o) for o in range(0, 5, limit)]
+        assert {page["total"] for page in pages} == {5}
+        assert [r["year"] for page in pages for r in page["results"]] == [r["year"] for r in full["results"]]
+
+
+def test_no_match_returns_generic_review():
+    client = IndianResearchClient(papers=PAPERS)
+    results = client.search("quantum entanglement")
+    assert len(results) == 1 and results[0]["institution"] == "DST Centre of Excellence"
+
+
+def test_empty_and_out_of_range_pages():
+    client = IndianResearchClient(papers=PAPERS)
+    assert client.search_page("seeding", limit=0) == {"total": 2, "offset": 0, "limit": 0, "results": []}
+    assert client.search_page("seeding", limit=5, offset=2)["results"] == []
+    assert client.search_page("seeding", limit=5, offset=99)["total"] == 2
+    for bad in ({"limit": -1}, {"offset": -1}):
+        with pytest.raises(ValueError):
+            client.search_page("seeding", **bad)
@@ -0,0 +1,187 @@
+import json
+import sys
+import os
+import time
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.llm_engine import OracleEngine
+from models.serialization import dumps
+
+
+async def collect(engine, strategy, investment=0):
+    return [json.loads(line) async for line in engine.stream_analysis(strategy, investment)]
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_real_stages_without_delay():
+    engine = OracleEngine(demo_pacing=0)
+    strategy = "Cool roof coating for Delhi heat"
+
+    start = time.perf_counter()
+    events = await collect(engine, strategy, 200000000)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    progress = [e for e in events if e["status"] == "progress"]
+    assert progress[0]["stage"] == "mechanism_detection"
+    assert {e["stage"] for e in progress[1:]} == {"policy_lookup", "research_fetch"}
+    assert [e["progress"] for e in progress] == [30, 55, 80]
+
+    final = events[-1]
+    assert final["status"] == "oracle_analysis"
+    assert final["data"] == json.loads(dumps(engine.analyze_strategy(strategy, 200000000)))
+
+
+@pytest.mark.asyncio
+async def test_demo_pacing_holds_each_stage():
+    engine = OracleEngine(demo_pacing=0.05)
+    start = time.perf_counter()
+    await collect(engine, "cloud seeding")
+    assert time.perf_counter() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_ends_stream_with_error():
+    engine = OracleEngine(demo_pacing=0)
+
+    def broken_lookup(mechanism_key):
+        raise RuntimeError("policy table unavailable")
+
+    engine.policy_analyzer.get_analysis = broken_lookup
+    events = await collect(engine, "cloud seeding")
+    assert events[-1]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_failed_research_source_is_reported_not_fatal():
+    engine = OracleEngine(demo_pacing=0)
+
+    def broken_search(query, limit=5, **filters):
+        raise RuntimeError("research backend down")
+
+    engine.research_client.search_page = broken_search
+    events = await collect(engine, "cloud seeding")
+    final = events[-1]
+    assert final["status"] == "oracle_analysis"
+    assert final["data"]["research_sources"]["indian_repositories"]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_failed_research_fan_out_falls_back_to_generic_review():
+    engine = OracleEngine(demo_pacing=0)
+
+    async def broken_stream(query, limit=5):
+        raise RuntimeError("aggregator crashed")
+        yield
+
+    engine.research.stream = broken_stream
+    final = (await collect(engine, "cloud seeding"))[-1]
+    assert final["status"] == "oracle_analysis"
+    assert final["data"]["active_papers"][0]["institution"] == "DST Centre of Excellence"
+    assert final["data"]["research_sources"]["indian_repositories"]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_skips_to_final_result():
+    engine = OracleEngine(demo_pacing=0)
+    first = await collect(engine, "Cool roof coating for Delhi heat", 200000000)
+    # Same normalized strategy, different investment
+    second = await collect(engine, "  cool ROOF coating for delhi   heat ", 50000000)
+
+    assert len(second) == 1
+    assert second[0]["cached"] is True and first[-1]["cached"] is False
+    assert second[0]["data"]["feasibility_score"] < first[-1]["data"]["feasibility_score"]
+    assert {**second[0]["data"], "feasibility_score": None} == {**first[-1]["data"], "feasibility_score": None}
+    assert engine.cache.get_stats()["hits"] == 1
+
+
+def test_cache_does_not_change_the_score():
+    investments = [1.4e7, 2.5e7, 2.5e8, 1.4e7]
+    cached = OracleEngine()
+    scores = [cached.analyze_strategy("crop insurance for farmers", inv).feasibility_score for inv in investments]
+    assert cached.cache.get_stats()["hits"] == 3
+
+    uncached = [OracleEngine().analyze_strategy("crop insurance for farmers", inv).feasibility_score for inv in investments]
+    assert scores == uncached == [0.48, 0.53, 0.63, 0.48]
+
+
+def test_cache_invalidated_when_policy_mapping_changes(monkeypatch):
+    import reasoning.llm_engine as llm_engine_module
+    from reasoning.policy_context import POLICY_MAPPING
+
+    monkeypatch.setattr(llm_engine_module, "KNOWLEDGE_CHECK_INTERVAL", 0)
+    engine = OracleEngine()
+    before = engine.analyze_strategy("cloud seeding", 500000000)
+
+    monkeypatch.setitem(POLICY_MAPPING["Monsoon_Cloud_Seeding"], "political_feasibility_score", 0.1)
+    after = engine.analyze_strategy("cloud seeding", 500000000)
+
+    assert after.feasibility_score < before.feasibility_score
+    assert engine.cache.get_stats()["invalidations"] == 1
+
+
+def test_result_cache_lru_and_ttl(monkeypatch):
+    import reasoning.result_cache as result_cache_module
+    from reasoning.result_cache import ResultCache
+
+    now = [100.0]
+    monkeypatch.setattr(result_cache_module.time, "monotonic", lambda: now[0])
+    cache = ResultCache(maxsize=2, ttl=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)  # evicts least recently used "b"
+    assert cache.get("b") is None and cache.get("c") == 3
+
+    now[0] += 11
+    assert cache.get("a") is None
+    stats = cache.get_stats()
+    assert (stats["evictions"], stats["expired"], stats["hits"]) == (1, 1, 2)
+
+
+def test_batch_matches_single_analysis():
+    engine = OracleEngine()
+    strategies = ["Cool roof coating for Delhi heat", "Use Cloud Seeding to help Maharashtra farmers",
+                  "cool roof coating for delhi heat"]
+    investments = [0, 12345678, 5e7, 2e8, 1e9]
+
+    batch = engine.analyze_batch(strategies, investments)
+    assert batch["mechanisms"] == ["Urban_Heat_Mitigation", "Monsoon_Cloud_Seeding", "Urban_Heat_Mitigation"]
+    assert len(batch["feasibility"]) == 3 and len(batch["feasibility"][0]) == 5
+    for strategy, row in zip(strategies, batch["feasibility"]):
+        assert row == [engine.analyze_strategy(strategy, inv).feasibility_score for inv in investments]
+
+
+def test_batch_scores_the_investments_as_given():
+    engine = OracleEngine()
+    investments = [v * 1e7 for v in (0.2, 0.4, 0.6, 1.4, 2.5, 3.5)]
+
+    batch = engine.analyze_batch(["crop insurance for farmers"], investments)
+    assert batch["investments_inr"] == investments
+    # ₹5 Cr per rollout: every step of this sweep moves the score
+    row = batch["feasibility"][0]
+    assert row == sorted(set(row))
+    mechanism = engine.mechanism(batch["mechanisms"][0])
+    policy = engine.policy_analyzer.get_analysis(batch["mechanisms"][0])
+    assert row == [engine._calculate_feasibility(mechanism, policy, inv) for inv in investments]
+
+
+def test_batch_endpoint_matrix_and_ndjson():
+    from fastapi.testclient import TestClient
+    from main import app
+
+    client = TestClient(app)
+    payload = {"strategies": ["cloud seeding", "IMD forecast"], "investments": [1, 10, 50]}
+    matrix = client.post("/api/simulate/batch", json=payload).json()
+    assert matrix["investments_inr"] == [1e7, 1e8, 5e8]
+    assert len(matrix["feasibility"]) == 2
+
+    response = client.post("/api/simulate/batch", json={**payload, "format": "ndjson"})
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert lines[0]["status"] == "batch"
+    assert [line["feasibility"] for line in lines[1:]] == matrix["feasibility"]
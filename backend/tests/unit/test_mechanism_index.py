@@ -0,0 +1,47 @@
+import sys
+import os
+
+import numpy as np
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.llm_engine import OracleEngine
+from reasoning.mechanism_database import MECHANISMS
+from reasoning.mechanism_index import MechanismIndex
+
+
+def test_paraphrases_rank_the_right_mechanism():
+    index = MechanismIndex(MECHANISMS)
+    assert index.search("reflective paint on slum housing", k=1)[0][0] == "Urban_Heat_Mitigation"
+    assert index.search("machine learning for district sowing decisions", k=1)[0][0] == "Monsoon_Prediction_Enhancement"
+
+    top = index.search("millet varieties for delayed onset", k=3)
+    assert len(top) == 3 and top[0][0] == "Agricultural_Adaptation_Systems"
+    assert top[0][1] >= top[1][1] >= top[2][1]
+
+
+def test_incremental_update_matches_full_rebuild():
+    catalog = dict(MECHANISMS)
+    index = MechanismIndex(catalog)
+
+    catalog["Glacier_Monitoring"] = {
+        "name": "Himalayan Glacier Monitoring",
+        "description": "Satellite tracking of glacial lake outburst risk.",
+        "research_focus": ["GLOF early warning"],
+    }
+    del catalog["Urban_Heat_Mitigation"]
+    assert index.update(catalog) == 1
+    assert index.update(catalog) == 0
+
+    rebuilt = MechanismIndex(catalog)
+    assert sorted(index.keys) == sorted(rebuilt.keys)
+    assert np.allclose(index.df, rebuilt.df)
+    assert index.search("glacial lake outburst", k=1)[0][0] == "Glacier_Monitoring"
+    assert dict(index.search("satellite glacier", k=4)) == dict(rebuilt.search("satellite glacier", k=4))
+
+
+def test_engine_uses_retrieval_when_no_keyword_matches():
+    engine = OracleEngine()
+    assert engine.detect_mechanism("reflective paint on slum housing")[0] == "Urban_Heat_Mitigation"
+    assert engine.detect_mechanism("hello there")[0] == "Monsoon_Cloud_Seeding"
@@ -0,0 +1,47 @@
+import sys
+import os
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.llm_engine import OracleEngine
+from reasoning.mechanism_matcher import MechanismMatcher, stem
+
+TRIGGERS = {
+    "Seeding": ["cloud", "seed", "drought", "silver iodide"],
+    "Crops": ["crop", "seed", "drought", "farmer"],
+    "Forecast": ["forecast", "predict"],
+}
+
+
+def test_word_boundaries_and_stemming():
+    matcher = MechanismMatcher(TRIGGERS)
+    assert matcher.scores("rainfall may exceed the average").max() == 0
+    assert matcher.best("seeding clouds over the ghats") == "Seeding"
+    assert matcher.best("better forecasts and predictions") == "Forecast"
+    assert stem("farmers") == stem("farmer")
+
+
+def test_shared_keywords_are_split_and_counted_once():
+    matcher = MechanismMatcher(TRIGGERS)
+    scores = dict(zip(matcher.keys, matcher.scores("drought drought seed for farmers")))
+    # drought + seed are shared (0.5 each), farmer is Crops-only
+    assert scores == {"Seeding": 1.0, "Crops": 2.0, "Forecast": 0.0}
+
+
+def test_multi_word_phrases_need_the_whole_phrase():
+    matcher = MechanismMatcher(TRIGGERS)
+    assert matcher.scores("silver linings")[0] == 0
+    assert matcher.scores("Silver-iodide flares")[0] == 1.0
+
+
+def test_no_match_falls_back():
+    matcher = MechanismMatcher(TRIGGERS)
+    assert matcher.best("something unrelated", default="Seeding") == "Seeding"
+
+
+def test_engine_detection():
+    engine = OracleEngine()
+    assert engine.detect_mechanism("Cool roofs for Delhi slums")[0] == "Urban_Heat_Mitigation"
+    assert engine.detect_mechanism("IMD forecast accuracy")[0] == "Monsoon_Prediction_Enhancement"
+    assert engine.detect_mechanism("Use Cloud Seeding to help Maharashtra farmers")[0] == "Monsoon_Cloud_Seeding"
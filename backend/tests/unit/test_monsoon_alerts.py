@@ -0,0 +1,65 @@
+import sys
+import os
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from models.stream_models import AlertSeverity
+from streams.climate.monsoon_alerts import AlertRuleEngine, ThresholdRule
+from streams.climate.monsoon_store import MonsoonStore
+
+
+def record(year, deviation, onset, states=None, districts=None):
+    return {
+        "year": year, "scenario_name": f"Season {year}", "all_india_rainfall_mm": 800, "lpa_mm": 880,
+        "deviation_percent": deviation, "onset_date": onset, "normal_onset_date": f"{year}-06-01",
+        "regional_data": [{"region": "Central India", "rainfall_mm": 700, "deviation": deviation}],
+        "states": states or {}, "districts": districts or {},
+    }
+
+
+STORE = MonsoonStore.from_records({
+    "2001": record(2001, -18, "2001-06-12",
+                   states={"Maharashtra": {"rainfall_mm": 500, "deviation": -65, "risk_level": "Critical"},
+                           "Kerala": {"rainfall_mm": 2000, "deviation": 5, "risk_level": "Low"}},
+                   districts={"Pune": {"state": "Maharashtra", "rainfall_mm": 300, "deviation": -25}}),
+    "2002": record(2002, -12, "2002-06-03",
+                   states={"Maharashtra": {"rainfall_mm": 900, "deviation": -5, "risk_level": "High"}}),
+    "2003": record(2003, 4, "2003-06-01"),
+})
+
+
+def test_vectorized_rules_over_all_years():
+    alerts = {a.id: a for a in AlertRuleEngine().evaluate(STORE, now=123.0)}
+
+    assert alerts["alert_monsoon_deficit_2001"].severity == AlertSeverity.CRITICAL
+    assert alerts["alert_monsoon_deficit_2002"].severity == AlertSeverity.HIGH
+    assert "alert_monsoon_deficit_2003" not in alerts
+    assert alerts["alert_onset_delay_2001"].context["delay_days"] == 11
+    assert "alert_onset_delay_2002" not in alerts
+    assert alerts["alert_state_deficit_2001_maharashtra"].severity == AlertSeverity.CRITICAL
+    assert alerts["alert_state_risk_2001_maharashtra"].severity == AlertSeverity.CRITICAL
+    assert alerts["alert_state_risk_2002_maharashtra"].severity == AlertSeverity.HIGH
+    assert alerts["alert_district_deficit_2001_pune"].context["area"] == "Pune"
+    assert not any("kerala" in a_id for a_id in alerts)
+    assert all(a.created_at == 123.0 and a.stream_ids == ["climate"] for a in alerts.values())
+
+
+def test_year_window_and_dedup():
+    alerts = AlertRuleEngine().evaluate(STORE, start=2002, end=2002)
+    assert {a.context["year"] for a in alerts} == {2002}
+
+    # Two rules with the same name collapse to one alert per id, most severe wins
+    rules = [ThresholdRule("dry", "national", "deviation", "lt", ((-10, AlertSeverity.MEDIUM),), "{value}"),
+             ThresholdRule("dry", "national", "deviation", "lt", ((-15, AlertSeverity.CRITICAL),), "{value}")]
+    alerts = {a.id: a for a in AlertRuleEngine(rules).evaluate(STORE)}
+    assert alerts["alert_dry_2001"].severity == AlertSeverity.CRITICAL
+    assert alerts["alert_dry_2002"].severity == AlertSeverity.MEDIUM
+    assert len(alerts) == 2
+
+
+def test_invalid_rule_rejected():
+    with pytest.raises(ValueError):
+        ThresholdRule("risk", "national", "risk", "ge", ((2, AlertSeverity.HIGH),), "")
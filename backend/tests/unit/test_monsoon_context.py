@@ -0,0 +1,89 @@
+import sys
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from api import monsoon_routes
+from streams.climate.mock_monsoon_client import MockMonsoonClient, MonsoonContext
+from streams.stream_manager import StreamManager
+
+
+def test_clients_share_one_read_only_snapshot():
+    client = MockMonsoonClient()
+    assert StreamManager().monsoon_client.store is client.store is monsoon_routes.monsoon_client.store
+    with pytest.raises(ValueError):
+        client.store.obs_rainfall_mm[0] = 0
+
+
+def test_reload_reaches_every_client_and_closes_the_old_archive():
+    manager_client = StreamManager().monsoon_client
+    before = monsoon_routes.monsoon_client.store
+    old_context = monsoon_routes.monsoon_client.context(2022)
+
+    after = monsoon_routes.monsoon_client.reload()
+    assert after is not before
+    assert manager_client.store is after is MockMonsoonClient().store
+    # The retired store keeps answering for contexts that still hold it
+    assert before.__dict__.get("_archive") is None
+    assert old_context.get_rainfall("Central India") == after.rainfall(2022, "Central India") > 0
+
+
+def test_contexts_are_independent():
+    client = MockMonsoonClient()
+    drought, wet = client.context(2019), client.context(2022)
+    assert drought.get_current_metrics()["year"] == 2019
+    assert wet.get_current_metrics()["year"] == 2022
+    assert client.current_year_focus == 2019
+
+    by_name = client.context(scenario=wet.scenario)
+    assert by_name.year == 2022
+    assert MonsoonContext(client.store, 1850).year == 2019
+
+
+def test_routes_use_request_and_session_context():
+    app = FastAPI()
+    app.include_router(monsoon_routes.router)
+    http = TestClient(app)
+
+    assert http.get("/streams/climate/monsoon/current", params={"year": 2022}).json()["metadata"]["year"] == 2022
+    # ?year= no longer leaks into other requests
+    assert http.get("/streams/climate/monsoon/current").json()["metadata"]["year"] == 2019
+
+    http.post("/streams/climate/monsoon/simulation/set_year", params={"year": 2023})
+    assert http.get("/streams/climate/monsoon/current").json()["metadata"]["year"] == 2023
+    other_session = TestClient(app)
+    assert other_session.get("/streams/climate/monsoon/current").json()["metadata"]["year"] == 2019
+
+
+def test_conditional_get_and_reload_invalidation():
+    app = FastAPI()
+    app.include_router(monsoon_routes.router)
+    http = TestClient(app)
+    url = "/streams/climate/monsoon/historical/2019"
+
+    first = http.get(url)
+    assert first.status_code == 200 and first.headers["cache-control"].startswith("public")
+    assert first.json() == monsoon_routes.monsoon_client.get_year(2019)
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+
+    again = http.get(url, headers={"If-None-Match": f'W/"other", {etag}'})
+    assert again.status_code == 304 and again.content == b"" and again.headers["etag"] == etag
+
+    current = http.get("/streams/climate/monsoon/current", params={"year": 2022})
+    assert current.headers["vary"] == "Cookie"
+    assert http.get("/streams/climate/monsoon/current", params={"year": 2022},
+                    headers={"If-None-Match": current.headers["etag"]}).status_code == 304
+    assert http.get("/streams/climate/monsoon/current", params={"year": 2019},
+                    headers={"If-None-Match": current.headers["etag"]}).status_code == 200
+
+    invalidations = monsoon_routes.response_cache.stats["invalidations"]
+    monsoon_routes.monsoon_client.reload()
+    assert http.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert monsoon_routes.response_cache.stats["invalidations"] == invalidations + 1
+    assert http.get("/streams/climate/monsoon/historical/1850").status_code == 404
@@ -0,0 +1,76 @@
+import sys
+import os
+import json
+
+import numpy as np
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from streams.climate.monsoon_store import MonsoonStore, load_monsoon_store, DISTRICT
+from streams.climate.mock_monsoon_client import MockMonsoonClient
+
+DATA_PATH = os.path.join(os.path.dirname(__file__), '../../data/mock_monsoon_data.json')
+
+
+def load_records():
+    with open(DATA_PATH, 'r') as f:
+        return json.load(f)
+
+
+def test_records_roundtrip_json():
+    records = load_records()
+    store = MonsoonStore.from_records(records)
+    for year, record in records.items():
+        assert store.record(int(year)) == record
+    assert store.record(1990) is None
+
+
+def test_onset_delay_preparsed():
+    store = MonsoonStore.from_records(load_records())
+    assert store.onset_delay(2019) == 7
+    # 2023 has no normal_onset_date: measured against 1 June
+    assert store.onset_delay(2023) == 3
+    assert store.onset_delay(1990) == 0
+
+
+def test_series_range_query():
+    store = MonsoonStore.from_records(load_records())
+    series = store.series("Maharashtra", 2020, 2023)
+    assert list(series["years"]) == [2022, 2023]
+    assert list(series["rainfall_mm"]) == [1150.0, 800.0]
+    assert len(store.series("Atlantis")["years"]) == 0
+    record = load_records()["2019"]
+    assert store.rainfall(2019, "Central India") == record["regional_data"][1]["rainfall_mm"]
+    assert store.rainfall(2019, "Rajasthan") == record["states"]["Rajasthan"]["rainfall_mm"]
+    assert store.rainfall(2019, "Atlantis") == 0.0
+
+
+def test_districts_and_lazy_load(tmp_path):
+    records = load_records()
+    records["2019"]["districts"] = {"Pune": {"state": "Maharashtra", "rainfall_mm": 510.5, "deviation": -31,
+                                             "status": "Deficient", "risk_level": "High"}}
+    store = MonsoonStore.from_records(records)
+    path = str(tmp_path / "monsoon.npz")
+    store.save(path)
+
+    loaded = MonsoonStore.load(path)
+    assert "obs_rainfall_mm" not in loaded.__dict__
+    assert loaded.record(2019) == records["2019"]
+    assert loaded.area_id("Pune", DISTRICT) >= 0
+    assert loaded.onset.dtype == np.dtype("datetime64[D]")
+
+
+def test_loader_builds_cache_and_client_uses_it(tmp_path):
+    store_path = str(tmp_path / "cache" / "monsoon.npz")
+    store = load_monsoon_store(os.path.abspath(DATA_PATH), store_path)
+    assert os.path.exists(store_path) and len(store) == 3
+    assert load_monsoon_store(os.path.abspath(DATA_PATH), store_path) is store
+
+    client = MockMonsoonClient(store=store)
+    client.set_year(2022)
+    assert client.get_current_metrics()["scenario_name"] == load_records()["2022"]["scenario_name"]
+    assert client.get_historical_rainfall(2022, "All India") == load_records()["2022"]["all_india_rainfall_mm"]
+    client.set_year(1990)
+    assert client.get_current_metrics()["year"] == 2019
+    assert client.get_onset_delay() == 7
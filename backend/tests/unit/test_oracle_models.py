@@ -0,0 +1,54 @@
+import sys
+import os
+import json
+import dataclasses
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from models.oracle_models import Mechanism, PolicyContext, ResearchPaper
+from models.serialization import dumps, _json_dumps
+from reasoning.llm_engine import OracleEngine
+from reasoning.mechanism_database import MECHANISMS, load_mechanisms
+
+
+def test_mechanisms_validated_at_load():
+    mechanisms = load_mechanisms()
+    seeding = mechanisms["Monsoon_Cloud_Seeding"]
+    assert seeding.gap_ratio == 4.0 and isinstance(seeding.research_focus, tuple)
+    assert seeding.bottleneck.description == "Gap of 4.0x between current pilots and required scale."
+
+    broken = {**MECHANISMS["Monsoon_Cloud_Seeding"], "gap_ratio": "4x"}
+    with pytest.raises(ValueError, match="gap_ratio"):
+        Mechanism.from_dict("broken", broken)
+    with pytest.raises(ValueError, match="political_feasibility_score"):
+        PolicyContext.from_dict({"relevant_ministries": [], "existing_programs": [],
+                                 "political_feasibility_score": 1.5, "alignment_notes": ""})
+
+
+def test_results_share_load_time_parts_and_are_frozen():
+    engine = OracleEngine()
+    a = engine.analyze_strategy("cloud seeding", 1e8)
+    b = engine.analyze_strategy("cloud seeding for Karnataka", 5e8)
+    assert a.bottleneck is b.bottleneck and a.research_vectors is b.research_vectors
+    assert a.policy_context is b.policy_context
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        a.feasibility_score = 1.0
+    # Nested per-source stats cannot be changed through a shared (cached) result either
+    with pytest.raises(TypeError):
+        a.research_sources["indian_repositories"]["count"] = 0
+    with pytest.raises(TypeError):
+        a.research_sources["injected"] = {}
+
+
+def test_result_json_shape():
+    result = OracleEngine().analyze_strategy("cloud seeding", 1e8)
+    encoded = json.loads(dumps(result))
+    assert encoded == json.loads(_json_dumps(result))
+    assert list(encoded) == ["mechanism", "description", "feasibility_score", "bottleneck", "research_vectors",
+                             "active_papers", "research_sources", "economic_context", "policy_context"]
+    assert encoded["research_vectors"][0]["institutions"] == MECHANISMS["Monsoon_Cloud_Seeding"]["indian_institutions"]
+    assert encoded["active_papers"][0]["authors"]
+    assert ResearchPaper.from_dict({"title": "t", "sources": ["arxiv"]}).sources == ("arxiv",)
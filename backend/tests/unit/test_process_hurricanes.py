@@ -0,0 +1,144 @@
+import json
+import sys
+import os
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from scripts.process_hurricanes import (
+    process_hurricanes, process_hurricanes_parallel, process_hurricanes_incremental, iter_storms, main, parse_args
+)
+
+CSV_ROWS = [
+    "SID,SEASON,NUMBER,BASIN,NAME,ISO_TIME,LAT,LON,USA_WIND",
+    " ,Year, , , , ,degrees_north,degrees_east,kts",
+    "2003001N10280,2003,1,NA,OLD,2003-08-01 00:00:00,10.0,-80.0,40",
+    "2003001N10280,2003,1,NA,OLD,2003-08-01 06:00:00,10.5,-80.5,45",
+    "2005236N23285,2005,2,NA,KATRINA,2005-08-23 18:00:00,23.1,-75.1,30",
+    "2005236N23285,2005,2,NA,KATRINA,2005-08-24 00:00:00,23.4,-75.7, ",
+    "2005236N23285,2005,2,NA,KATRINA,2005-08-24 06:00:00,bad,-76.2,35",
+    "2005236N23285,2005,2,NA,KATRINA,2005-08-24 12:00:00,24.5,-76.5,40",
+    "2005261N21290,2005,3,NA,RITA,2005-09-18 00:00:00,21.3,-69.9,25",
+    "2006001N10280,2006,4,NA,SOLO,2006-07-01 00:00:00,12.0,-60.0,20",
+    "2006002N11281,2006,5,NA,ALBERTO,2006-07-02 00:00:00,13.0,-61.0,20",
+    "2006002N11281,2006,5,NA,ALBERTO,2006-07-02 06:00:00,13.5,-61.5,25",
+]
+
+
+def write_csv(tmp_path):
+    path = tmp_path / "ibtracs.csv"
+    path.write_text("\n".join(CSV_ROWS) + "\n", encoding="utf-8")
+    return str(path)
+
+
+def test_stream_output_matches_in_memory(tmp_path):
+    input_csv = write_csv(tmp_path)
+    memory_out = tmp_path / "memory.json"
+    stream_out = tmp_path / "stream.json"
+
+    n_memory = process_hurricanes(input_csv, str(memory_out))
+    n_stream = process_hurricanes(input_csv, str(stream_out), stream=True, chunk_rows=3)
+
+    assert n_memory == n_stream == 3
+    assert memory_out.read_bytes() == stream_out.read_bytes()
+
+
+def test_iter_storms_groups_by_sid_and_skips_bad_rows(tmp_path):
+    storms = list(iter_storms(write_csv(tmp_path), start_year=2004, chunk_rows=2))
+
+    assert [sid for sid, _, _, _ in storms] == ["2005236N23285", "2005261N21290", "2006001N10280", "2006002N11281"]
+    sid, name, season, points = storms[0]
+    assert name == "KATRINA"
+    assert season == 2005
+    assert [p["wind"] for p in points] == [30.0, 0, 40.0]
+
+
+def test_parallel_season_shards_match_serial(tmp_path):
+    input_csv = write_csv(tmp_path)
+    serial_out = tmp_path / "serial.json"
+    parallel_out = tmp_path / "parallel.json"
+
+    process_hurricanes(input_csv, str(serial_out), start_year=2003, stream=True)
+    count = process_hurricanes_parallel([input_csv], str(parallel_out), start_year=2003, workers=3)
+
+    assert count == 4
+    assert parallel_out.read_bytes() == serial_out.read_bytes()
+
+
+def test_parallel_basin_files_dedupe_shared_storms(tmp_path):
+    header, rows = CSV_ROWS[:2], CSV_ROWS[2:]
+    na = tmp_path / "na.csv"
+    ep = tmp_path / "ep.csv"
+    # KATRINA appears in both basin files; RITA/ALBERTO only in one each
+    na.write_text("\n".join(header + [r for r in rows if "KATRINA" in r or "RITA" in r]) + "\n")
+    ep.write_text("\n".join(header + [r for r in rows if "KATRINA" in r or "ALBERTO" in r]) + "\n")
+
+    out = tmp_path / "merged.json"
+    count = process_hurricanes_parallel([str(ep), str(na)], str(out), start_year=2004, workers=2)
+
+    features = json.loads(out.read_text())["features"]
+    assert count == len(features) == 3
+    assert [f["properties"]["name"] for f in features] == ["KATRINA", "KATRINA", "ALBERTO"]
+
+
+def test_end_year_applies_to_every_mode(tmp_path):
+    input_csv = write_csv(tmp_path)
+    names = {}
+    for mode, run in {
+        "memory": lambda out: process_hurricanes(input_csv, out, start_year=2003, end_year=2005),
+        "stream": lambda out: process_hurricanes(input_csv, out, start_year=2003, stream=True, end_year=2005),
+        "parallel": lambda out: process_hurricanes_parallel([input_csv], out, start_year=2003, end_year=2005),
+        "incremental": lambda out: process_hurricanes_incremental(input_csv, out, start_year=2003, end_year=2005,
+                                                                  cache_dir=str(tmp_path / "cache")),
+    }.items():
+        out = tmp_path / f"{mode}.json"
+        run(str(out))
+        names[mode] = [f["properties"]["name"] for f in json.loads(out.read_text())["features"]]
+    assert all(n == ["OLD", "KATRINA", "KATRINA"] for n in names.values()), names
+
+
+def test_cli_store_includes_every_basin(tmp_path):
+    from streams.climate.track_store import TrackStore
+
+    header, rows = CSV_ROWS[:2], CSV_ROWS[2:]
+    na, ep = tmp_path / "na.csv", tmp_path / "ep.csv"
+    na.write_text("\n".join(header + [r for r in rows if "KATRINA" in r or "RITA" in r]) + "\n")
+    ep.write_text("\n".join(header + [r for r in rows if "KATRINA" in r or "ALBERTO" in r]) + "\n")
+
+    store_path = str(tmp_path / "tracks.npz")
+    main(["--input", str(na), str(ep), "--output", str(tmp_path / "out.json"), "--store", store_path,
+          "--end-year", "2006"])
+    assert sorted(TrackStore.load(store_path).names.tolist()) == ["ALBERTO", "KATRINA", "RITA"]
+
+
+def test_incremental_reuses_unchanged_storms(tmp_path):
+    input_csv = write_csv(tmp_path)
+    cache_dir = str(tmp_path / "cache")
+    full_out = tmp_path / "full.json"
+    inc_out = tmp_path / "incremental.json"
+    process_hurricanes(input_csv, str(full_out), start_year=2003)
+
+    first = process_hurricanes_incremental(input_csv, str(inc_out), start_year=2003, cache_dir=cache_dir)
+    assert first["new"] == 5 and first["reused"] == 0
+    assert inc_out.read_bytes() == full_out.read_bytes()
+
+    second = process_hurricanes_incremental(input_csv, str(inc_out), start_year=2003, cache_dir=cache_dir)
+    assert second["reused"] == 5 and second["new"] == second["changed"] == 0
+    assert inc_out.read_bytes() == full_out.read_bytes()
+
+    # NOAA revises one storm and drops another
+    rows = [r.replace("24.5,-76.5,40", "24.6,-76.6,45") for r in CSV_ROWS if "RITA" not in r]
+    (tmp_path / "ibtracs.csv").write_text("\n".join(rows) + "\n")
+    third = process_hurricanes_incremental(input_csv, str(inc_out), start_year=2003, cache_dir=cache_dir)
+    assert (third["changed"], third["reused"], third["removed"]) == (1, 3, 1)
+    assert "24.6" in inc_out.read_text()
+
+
+@pytest.mark.parametrize("extra", [["--input", "a.csv", "b.csv"], ["--workers", "4"]])
+def test_incremental_rejects_options_it_cannot_honour(extra, capsys):
+    with pytest.raises(SystemExit):
+        parse_args(["--incremental", *extra])
+    assert "--incremental" in capsys.readouterr().err
+    assert parse_args(["--incremental", "--end-year", "2005"]).end_year == 2005
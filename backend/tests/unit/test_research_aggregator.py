@@ -0,0 +1,90 @@
+import asyncio
+import sys
+import os
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from reasoning.research_aggregator import ResearchAggregator, ResearchSource, fuse
+
+
+class FakeSource(ResearchSource):
+    def __init__(self, name, papers, delay=0.0, deadline=1.0, error=None):
+        self.name = name
+        self.papers = papers
+        self.delay = delay
+        self.deadline = deadline
+        self.error = error
+
+    async def search(self, query, limit):
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.papers[:limit]
+
+
+def test_fuse_dedups_by_doi_and_title_and_merges_ranks():
+    merged = fuse({
+        "a": [{"title": "Monsoon Onset, Revisited"}, {"title": "Cool roofs", "doi": "10.1/X"}],
+        "b": [{"title": "Cool Roofs (preprint)", "doi": "10.1/x"}, {"title": "monsoon onset revisited"}],
+    })
+    assert len(merged) == 2
+    assert all(p["sources"] == ["a", "b"] for p in merged)
+    # Equal fused scores keep first-seen order
+    assert merged[0]["title"] == "Monsoon Onset, Revisited"
+
+
+@pytest.mark.asyncio
+async def test_ready_within_budget_then_late_results():
+    aggregator = ResearchAggregator([
+        FakeSource("fast", [{"title": "Fast paper"}]),
+        FakeSource("slow", [{"title": "Slow paper"}, {"title": "Fast paper"}], delay=0.2),
+    ], budget=0.05)
+
+    events = [e async for e in aggregator.stream("q")]
+    ready, late = events
+    assert ready["type"] == "ready" and not ready["complete"]
+    assert [p["title"] for p in ready["papers"]] == ["Fast paper"]
+    assert ready["sources"]["slow"]["status"] == "pending"
+
+    assert late["type"] == "late" and late["source"] == "slow" and late["complete"]
+    assert [p["title"] for p in late["new"]] == ["Slow paper"]
+    assert late["sources"]["slow"]["latency_ms"] >= 200
+
+
+@pytest.mark.asyncio
+async def test_deadlines_and_errors_are_reported():
+    aggregator = ResearchAggregator([
+        FakeSource("ok", [{"title": "Paper"}]),
+        FakeSource("hung", [], delay=5, deadline=0.05),
+        FakeSource("broken", [], error=RuntimeError("boom")),
+    ], budget=1.0)
+
+    result = await aggregator.gather("q")
+    assert result["complete"]
+    assert {name: s["status"] for name, s in result["sources"].items()} == \
+        {"ok": "ok", "hung": "timeout", "broken": "error"}
+
+
+class TrickleSource(FakeSource):
+    async def stream(self, query, limit):
+        for paper in self.papers[:limit]:
+            await asyncio.sleep(self.delay)
+            yield paper
+
+
+@pytest.mark.asyncio
+async def test_streaming_source_emits_each_paper_as_it_arrives():
+    aggregator = ResearchAggregator([
+        FakeSource("fast", [{"title": "Fast paper"}]),
+        TrickleSource("feed", [{"title": "One"}, {"title": "Fast paper"}, {"title": "Two"}], delay=0.1),
+    ], budget=0.05)
+
+    events = [e async for e in aggregator.stream("q")]
+    # The duplicate gets no event of its own; the last paper arrives together with completion
+    assert [e["type"] for e in events] == ["ready", "paper", "late"]
+    assert [[p["title"] for p in e["new"]] for e in events] == [["Fast paper"], ["One"], ["Two"]]
+    assert events[1]["sources"]["feed"]["status"] == "pending"
+    assert events[-1]["sources"]["feed"]["status"] == "ok" and events[-1]["sources"]["feed"]["count"] == 3
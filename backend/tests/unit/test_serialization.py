@@ -0,0 +1,48 @@
+import sys
+import os
+import json
+
+import numpy as np
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from models import serialization
+from models.serialization import ORJSONResponse, dumps, frame, ndjson, _json_dumps
+from models.stream_models import StreamData, StreamStatus
+
+
+PAYLOAD = {
+    "name": "Maharashtra — खरीफ",
+    "values": np.array([1.5, 2.0], dtype=np.float32),
+    "count": np.int64(3),
+    "stream": StreamData(stream_id="climate", timestamp=1.0, status=StreamStatus.HEALTHY, metrics={"x": 1.0}),
+    "nested": [{"ok": True, "none": None}],
+}
+
+EXPECTED = {
+    "name": "Maharashtra — खरीफ",
+    "values": [1.5, 2.0],
+    "count": 3,
+    "stream": {"stream_id": "climate", "timestamp": 1.0, "status": "healthy", "metrics": {"x": 1.0}, "metadata": {}},
+    "nested": [{"ok": True, "none": None}],
+}
+
+
+def test_active_backend_and_stdlib_fallback_agree():
+    assert serialization.BACKEND in ("orjson", "msgspec", "json")
+    assert json.loads(dumps(PAYLOAD)) == EXPECTED
+    assert json.loads(_json_dumps(PAYLOAD)) == EXPECTED
+
+
+def test_frames_are_cached_ndjson_lines():
+    line = frame(status="progress", progress=30, message="Mechanism identified", stage="mechanism_detection")
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert frame(status="progress", progress=30, message="Mechanism identified", stage="mechanism_detection") is line
+    assert json.loads(ndjson({"a": 1})) == {"a": 1}
+
+
+def test_response_renders_numpy():
+    response = ORJSONResponse({"matrix": np.eye(2)})
+    assert json.loads(response.body) == {"matrix": [[1.0, 0.0], [0.0, 1.0]]}
+    assert response.headers["content-type"] == "application/json"
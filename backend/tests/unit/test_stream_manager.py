@@ -0,0 +1,107 @@
+import asyncio
+import sys
+import os
+import time
+
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from models.stream_models import StreamData, StreamStatus
+from streams.base_stream import BaseStream
+from streams.stream_manager import ScheduledStream, StreamManager
+
+
+@pytest.mark.asyncio
+async def test_unchanged_metrics_skip_alert_evaluation():
+    manager = StreamManager()
+    manager.monsoon_client.set_year(2019)
+
+    first = await manager.scan_monsoon()
+    assert not first["skipped"]
+    assert {a.id for a in first["diff"].new} == {a.id for a in manager.active_alerts} != set()
+    created = {a.id: a.created_at for a in manager.active_alerts}
+
+    second = await manager.scan_monsoon()
+    assert second["skipped"]
+    assert second["alerts"] == first["alerts"]
+    assert not second["diff"].new and not second["diff"].resolved
+    assert {a.id: a.created_at for a in manager.active_alerts} == created
+
+
+@pytest.mark.asyncio
+async def test_year_change_produces_alert_diff():
+    manager = StreamManager()
+    manager.monsoon_client.set_year(2019)
+    await manager.scan_monsoon()
+    old_ids = {a.id for a in manager.active_alerts}
+
+    manager.monsoon_client.set_year(2022)
+    result = await manager.scan_monsoon()
+
+    assert not result["skipped"]
+    assert {a.id for a in result["diff"].resolved} == old_ids
+    assert {a.id for a in manager.active_alerts} == {a.id for a in result["diff"].new}
+
+
+@pytest.mark.asyncio
+async def test_scheduler_records_stats_and_backs_off():
+    manager = StreamManager()
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        raise RuntimeError("upstream down")
+
+    stream = ScheduledStream("flaky", flaky, interval=0.01, jitter=0.0, max_backoff=0.04)
+    manager.streams = {"flaky": stream, "monsoon": ScheduledStream("monsoon", manager.scan_monsoon, interval=0.01)}
+    manager.start()
+    await asyncio.sleep(0.1)
+    await manager.stop()
+
+    status = manager.get_status()
+    assert status["streams"]["flaky"]["errors"] == len(calls) >= 2
+    assert stream.next_delay() == 0.04
+    monsoon = status["streams"]["monsoon"]
+    assert monsoon["skips"] == monsoon["scans"] - 1 and monsoon["last_latency_ms"] is not None
+
+
+class FakeStream(BaseStream):
+    def __init__(self, stream_id, delay=0.0, fail=False):
+        super().__init__(stream_id)
+        self.delay = delay
+        self.fail = fail
+
+    async def scan(self) -> StreamData:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ConnectionError("feed unreachable")
+        return StreamData(stream_id=self.stream_id, timestamp=time.time(),
+                          status=StreamStatus.HEALTHY, metrics={"value": 1.0})
+
+    async def health_check(self) -> bool:
+        return not self.fail
+
+
+@pytest.mark.asyncio
+async def test_scan_all_runs_streams_concurrently_and_isolates_failures():
+    manager = StreamManager()
+    manager.register(FakeStream("economic", delay=0.2))
+    manager.register(FakeStream("social", delay=0.2))
+    manager.register(FakeStream("geopolitical", fail=True))
+    manager.register(FakeStream("satellite", delay=5.0), timeout=0.1)
+
+    start = time.perf_counter()
+    state = await manager.scan_all()
+    elapsed = time.perf_counter() - start
+
+    # Bounded by the slowest stream (0.2s), not the 5.4s sum
+    assert elapsed < 0.5
+    assert state.streams["economic"].status == StreamStatus.HEALTHY
+    assert state.streams["social"].status == StreamStatus.HEALTHY
+    assert state.streams["geopolitical"].status == StreamStatus.OFFLINE
+    assert state.streams["satellite"].status == StreamStatus.DEGRADED
+    assert state.streams["climate"].metadata["year"] == 2019
+    assert manager.streams["geopolitical"].failures == 1
+    assert state.alerts == manager.active_alerts
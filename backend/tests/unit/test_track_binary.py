@@ -0,0 +1,63 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from streams.climate.track_store import TrackStore, NAT
+from streams.climate.track_binary import FLAG_LON32, FLAG_TIME64, decode, encode, read_binary, read_header, write_binary
+
+
+def point(time, lat, lon, wind):
+    return {"time": time, "lat": lat, "lon": lon, "wind": wind}
+
+
+STORMS = [
+    ("2005236N23285", "KATRINA", 2005, [point("2005-08-23 18:00:00", 23.1, -75.1, 30.0),
+                                        point("2005-08-24 00:00:00", 23.4, -75.7, 0),
+                                        point("2005-08-24 06:00:00", 24.5, -76.5, 40.0)]),
+    ("2005261N21290", "RITA", 2005, [point("2005-09-18 00:00:00", 21.3, -69.9, 25.0)]),
+    ("2006002N11281", "KATRINA", 2006, [point("2006-07-02 00:00:00", 13.0, -61.0, 20.0),
+                                        point("2006-07-02 06:00:00", 13.5, -61.5, 25.0)]),
+]
+
+
+def assert_same(a, b):
+    assert list(a.sids) == list(b.sids) and list(a.names) == list(b.names)
+    np.testing.assert_array_equal(a.offsets, b.offsets)
+    np.testing.assert_array_equal(a.seasons, b.seasons)
+    np.testing.assert_array_equal(a.time, b.time)
+    np.testing.assert_array_equal(a.wind, b.wind)
+    np.testing.assert_allclose(a.lat, b.lat, atol=0.006)
+    np.testing.assert_allclose(a.lon, b.lon, atol=0.006)
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_roundtrip_via_mmap(tmp_path, compress):
+    store = TrackStore.from_storms(STORMS)
+    path = str(tmp_path / "tracks.htrk")
+    write_binary(store, path, compress=compress)
+
+    assert_same(read_binary(path), store)
+    assert list(read_binary(path).segment_features()) == list(store.segment_features())
+
+
+def test_wide_deltas_and_missing_times_fall_back_to_wider_ints():
+    storms = [("2010001N10180", "WRAP", 2010, [point("2010-01-01 00:00:00", 10.0, 179.9, 30.0),
+                                               point("not-a-time", 10.2, -179.9, 35.0)])]
+    store = TrackStore.from_storms(storms)
+    data = encode(store)
+
+    flags = read_header(data)["flags"]
+    assert flags & FLAG_LON32 and flags & FLAG_TIME64
+    decoded = decode(data)
+    assert decoded.time[1] == NAT
+    assert_same(decoded, store)
+
+
+def test_string_table_deduplicates_names():
+    store = TrackStore.from_storms(STORMS)
+    assert read_header(encode(store))["n_strings"] == 5
@@ -0,0 +1,46 @@
+import sys
+import os
+
+import numpy as np
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from streams.climate.track_store import TrackStore
+from scripts.process_hurricanes import storm_segments
+
+
+def point(time, lat, lon, wind):
+    return {"time": time, "lat": lat, "lon": lon, "wind": wind}
+
+
+STORMS = [
+    ("2004001N10280", "ALEX", 2004, [point("2004-08-01 00:00:00", 10.0, -80.0, 40.0),
+                                     point("2004-08-01 06:00:00", 10.5, -80.5, 45.0),
+                                     point("2004-08-01 12:00:00", 11.0, -81.0, 50.0)]),
+    ("2005001N10280", "SOLO", 2005, [point("2005-07-01 00:00:00", 12.0, -60.0, 20.0)]),
+    ("2006001N10280", "BERYL", 2006, [point("2006-07-01 00:00:00", 13.0, -61.0, 20.0),
+                                      point("2006-07-01 06:00:00", 13.5, -61.5, 0)]),
+]
+
+
+def test_segments_match_dict_pipeline():
+    store = TrackStore.from_storms(STORMS)
+    expected = [f for sid, name, _, points in STORMS for f in storm_segments(sid, name, points)]
+
+    assert store.lat.dtype == np.float32 and store.time.dtype == np.int64
+    assert list(store.offsets) == [0, 3, 4, 6]
+    assert list(store.segment_features()) == expected
+
+
+def test_filter_seasons_and_roundtrip(tmp_path):
+    store = TrackStore.from_storms(STORMS).filter_seasons(2005, 2006)
+    assert list(store.sids) == ["2005001N10280", "2006001N10280"]
+    assert list(store.offsets) == [0, 1, 3]
+    assert len(store.segments()["lat0"]) == 1
+
+    path = str(tmp_path / "tracks.npz")
+    store.save(path)
+    loaded = TrackStore.load(path)
+    assert list(loaded.names) == ["SOLO", "BERYL"]
+    np.testing.assert_array_equal(loaded.lon, store.lon)
@@ -0,0 +1,84 @@
+import json
+import sys
+import os
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+# Ensure backend modules are found
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from api import track_routes
+from main import app
+from streams.climate.track_store import TrackStore
+from streams.climate.track_tiles import build_tiles, douglas_peucker, tile_xy
+
+
+def make_store():
+    # A gently curving 100-point track across the Atlantic
+    lons = np.linspace(-80.0, -20.0, 100)
+    lats = 15.0 + 10.0 * np.sin(np.linspace(0, np.pi, 100))
+    points = [{"time": "2005-08-23 18:00:00", "lat": float(la), "lon": float(lo), "wind": 50.0}
+              for lo, la in zip(lons, lats)]
+    return TrackStore.from_storms([("2005236N23285", "KATRINA", 2005, points)])
+
+
+def test_douglas_peucker_keeps_endpoints_and_corners():
+    lon = np.array([0.0, 1.0, 2.0, 2.0, 2.0])
+    lat = np.array([0.0, 0.0, 0.0, 1.0, 2.0])
+    assert douglas_peucker(lon, lat, 0.01).tolist() == [True, False, True, False, True]
+
+
+def test_tile_xy_geographic_scheme():
+    x, y = tile_xy(np.array([-180.0, 179.9, 0.0]), np.array([90.0, -90.0, 0.0]), 0)
+    assert x.tolist() == [0, 1, 1] and y.tolist() == [0, 0, 0]
+
+
+def test_build_tiles_simplifies_low_zooms(tmp_path):
+    manifest = build_tiles(make_store(), str(tmp_path), max_zoom=3)
+
+    zooms = manifest["zooms"]
+    assert zooms["0"]["points"] < zooms["3"]["points"] == 100
+    assert zooms["3"]["segments"] == 99
+    for x, y, count, size in zooms["0"]["tiles"]:
+        tile = json.loads((tmp_path / "0" / str(x) / f"{y}.json").read_text())
+        assert len(tile["features"]) == count
+        assert tile["features"][0]["properties"]["name"] == "KATRINA"
+    assert json.loads((tmp_path / "index.json").read_text())["max_zoom"] == 3
+
+
+def test_segments_on_tile_edges_share_one_id(tmp_path):
+    manifest = build_tiles(make_store(), str(tmp_path), max_zoom=3)
+    ids = []
+    for x, y, _, _ in manifest["zooms"]["3"]["tiles"]:
+        tile = json.loads((tmp_path / "3" / str(x) / f"{y}.json").read_text())
+        ids.extend(f["id"] for f in tile["features"])
+    # Edge-crossing segments appear in several tiles, always under the same id
+    assert len(ids) > len(set(ids)) == manifest["zooms"]["3"]["segments"]
+    assert {"2005236N23285:0", "2005236N23285:98"} <= set(ids)
+
+
+def test_rebuild_replaces_the_previous_tree(tmp_path):
+    out = tmp_path / "tiles"
+    build_tiles(make_store(), str(out), max_zoom=3)
+    assert (out / "3").is_dir()
+
+    manifest = build_tiles(make_store(), str(out), max_zoom=1)
+    assert sorted(p.name for p in out.iterdir()) == ["0", "1", "index.json"]
+    assert json.loads((out / "index.json").read_text()) == manifest
+    # No staging or retired trees are left next to the output
+    assert [p.name for p in tmp_path.iterdir()] == ["tiles"]
+
+
+def test_tile_routes(tmp_path, monkeypatch):
+    build_tiles(make_store(), str(tmp_path), max_zoom=1)
+    monkeypatch.setattr(track_routes, "TILES_DIR", str(tmp_path))
+    client = TestClient(app)
+
+    assert client.get("/api/tracks/tiles/index.json").json()["max_zoom"] == 1
+    x, y = json.loads((tmp_path / "index.json").read_text())["zooms"]["0"]["tiles"][0][:2]
+    response = client.get(f"/api/tracks/tiles/0/{x}/{y}.json")
+    assert response.status_code == 200 and response.json()["features"]
+    assert "max-age" in response.headers["cache-control"]
+    assert client.get("/api/tracks/tiles/1/0/0.json").json()["features"] == []
+    assert client.get("/api/tracks/tiles/0/2/0.json").status_code == 404
@@ -8,6 +8,36 @@ interface OracleMapProps {
     mitigatedData?: any;
 }
 
+// Served by backend/api/track_routes.py (Cesium GeographicTilingScheme z/x/y)
+const TILE_API = '/api/tracks/tiles';
+
+// Pick the tile zoom whose tiles span roughly the visible globe at this camera height
+const zoomForHeight = (height: number, maxZoom: number) =>
+    Math.max(0, Math.min(maxZoom, Math.floor(Math.log2(20000000 / Math.max(height, 1)))));
+
+const tileInView = (zoom: number, x: number, y: number, view?: Cesium.Rectangle) => {
+    if (!view) return true;
+    const size = 180 / (1 << zoom);
+    const tile = Cesium.Rectangle.fromDegrees(-180 + x * size, 90 - (y + 1) * size, -180 + (x + 1) * size, 90 - y * size);
+    return Cesium.Rectangle.intersection(tile, view) !== undefined;
+};
+
+const styleBaseline = (source: Cesium.GeoJsonDataSource) => {
+    source.entities.values.forEach(entity => {
+        if (entity.polyline) {
+            const wind = entity.properties?.wind?.getValue();
+            let color = Cesium.Color.WHITE.withAlpha(0.2); // Faded by default
+
+            if (wind >= 137) color = Cesium.Color.RED.withAlpha(0.3);
+            else if (wind >= 113) color = Cesium.Color.ORANGERED.withAlpha(0.3);
+            else if (wind >= 96) color = Cesium.Color.ORANGE.withAlpha(0.3);
+
+            (entity.polyline.material as any) = new Cesium.ColorMaterialProperty(color);
+            entity.polyline.width = (wind / 40) as any;
+        }
+    });
+};
+
 const OracleMap: React.FC<OracleMapProps> = ({ mitigatedData }) => {
     const containerRef = useRef<HTMLDivElement>(null);
     const viewerRef = useRef<Cesium.Viewer | null>(null);
@@ -36,28 +66,71 @@ const OracleMap: React.FC<OracleMapProps> = ({ mitigatedData }) => {
 
                 viewer.scene.backgroundColor = Cesium.Color.BLACK;
 
-                // Load Baseline
-                try {
-                    const baselineSource = await Cesium.GeoJsonDataSource.load('/data/hurricanes_baseline.json');
-
-                    baselineSource.entities.values.forEach(entity => {
-                        if (entity.polyline) {
-                            const wind = entity.properties?.wind?.getValue();
-                            let color = Cesium.Color.WHITE.withAlpha(0.2); // Faded by default
+                // Load Baseline: level-of-detail tiles when available, full file otherwise
+                const baselineSource = new Cesium.GeoJsonDataSource('baseline');
+                viewer.dataSources.add(baselineSource);
+                baselineSourceRef.current = baselineSource;
 
-                            if (wind >= 137) color = Cesium.Color.RED.withAlpha(0.3);
-                            else if (wind >= 113) color = Cesium.Color.ORANGERED.withAlpha(0.3);
-                            else if (wind >= 96) color = Cesium.Color.ORANGE.withAlpha(0.3);
-
-                            (entity.polyline.material as any) = new Cesium.ColorMaterialProperty(color);
-                            entity.polyline.width = (wind / 40) as any;
-                        }
+                try {
+                    const index = await fetch(`${TILE_API}/index.json`).then(res => {
+                        if (!res.ok) throw new Error(`Tile index unavailable (${res.status})`);
+                        return res.json();
                     });
-
-                    viewer.dataSources.add(baselineSource);
-                    baselineSourceRef.current = baselineSource;
-                } catch (err) {
-                    console.warn("Baseline data not ready.");
+                    const loadedTiles = new Set<string>();
+                    const loadedFeatures = new Set<string>();
+                    let loadedZoom = -1;
+                    // Bumped on every camera move; only one load runs at a time and restarts when this changes
+                    let generation = 0;
+                    let loading: Promise<void> | null = null;
+
+                    const loadVisibleTiles = async (run: number) => {
+                        const zoom = zoomForHeight(viewer.camera.positionCartographic.height, index.max_zoom);
+                        if (zoom !== loadedZoom) {
+                            baselineSource.entities.removeAll();
+                            loadedTiles.clear();
+                            loadedFeatures.clear();
+                            loadedZoom = zoom;
+                        }
+                        const available: number[][] = index.zooms[String(zoom)].tiles;
+                        const view = viewer.camera.computeViewRectangle();
+                        const wanted = available.filter(([x, y]) => !loadedTiles.has(`${x}/${y}`) && tileInView(zoom, x, y, view));
+
+                        for (const [x, y] of wanted) {
+                            if (run !== generation) return; // Camera moved: the next pass picks the tiles
+                            const tile = await fetch(`${TILE_API}/${zoom}/${x}/${y}.json`).then(res => res.json());
+                            loadedTiles.add(`${x}/${y}`);
+                            // Segments crossing a tile edge are in every tile they touch, under one id
+                            // (tiles built before ids were added have none and are drawn as-is)
+                            const fresh = tile.features.filter((feature: any) => feature.id === undefined || !loadedFeatures.has(feature.id));
+                            fresh.forEach((feature: any) => feature.id !== undefined && loadedFeatures.add(feature.id));
+                            await baselineSource.process({ ...tile, features: fresh });
+                        }
+                        styleBaseline(baselineSource);
+                    };
+
+                    const refreshTiles = () => {
+                        generation += 1;
+                        if (!loading) {
+                            loading = (async () => {
+                                let run: number;
+                                do {
+                                    run = generation;
+                                    await loadVisibleTiles(run);
+                                } while (run !== generation);
+                            })().finally(() => { loading = null; });
+                        }
+                        return loading;
+                    };
+
+                    viewer.camera.moveEnd.addEventListener(() => { refreshTiles(); });
+                    await refreshTiles();
+                } catch (tileErr) {
+                    try {
+                        await baselineSource.load('/data/hurricanes_baseline.json');
+                        styleBaseline(baselineSource);
+                    } catch (err) {
+                        console.warn("Baseline data not ready.");
+                    }
                 }
 
                 viewer.camera.setView({